@@ -0,0 +1,50 @@
+"""Measure the export of the citations of a large issue in each style.
+
+The issue is built by repeating the articles of a fixture until the summary has 500 articles,
+the size of the largest index issues.
+
+Usage, from the root of the repository::
+
+    PYTHONPATH=. DJANGO_SETTINGS_MODULE=eruditarticle.tests.settings python benchmarks/citations.py
+"""
+import io
+import re
+import timeit
+
+import django
+
+from eruditarticle.citations import CITATION_STYLES
+from eruditarticle.citations import get_summary_citations
+from eruditarticle.citations import write_citations
+from eruditarticle.objects import EruditPublication
+
+FIXTURE = "./eruditarticle/tests/fixtures/publication/ae1375.xml"
+ARTICLE_COUNT = 500
+
+
+def get_issue_xml():
+    """ :returns: the XML of the fixture, with ARTICLE_COUNT articles in its summary. """
+    with open(FIXTURE, "rb") as fp:
+        xml = fp.read().decode("utf-8")
+    articles = re.search(r"<article .*</article>", xml, re.S).group(0)
+    repeats = -(-ARTICLE_COUNT // articles.count("<article "))
+    return xml.replace(articles, articles * repeats).encode("utf-8")
+
+
+def export(xml, style):
+    """ Export the citations of a freshly parsed issue. """
+    publication = EruditPublication(xml)
+    return write_citations(get_summary_citations(publication), io.StringIO(), style)
+
+
+def main():
+    django.setup()
+    xml = get_issue_xml()
+    for style in CITATION_STYLES:
+        count = export(xml, style)
+        timing = min(timeit.repeat(lambda: export(xml, style), number=1, repeat=5))
+        print("{:<9} {} citations in {:>6.1f} ms".format(style, count, timing * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Compare EruditArticle.extract with the sum of the accessors it gathers.
+
+Usage, from the root of the repository::
+
+    PYTHONPATH=. DJANGO_SETTINGS_MODULE=eruditarticle.tests.settings python benchmarks/extract.py
+"""
+import glob
+import timeit
+
+import django
+
+from eruditarticle.objects import EruditArticle
+from eruditarticle.objects.exceptions import LiberuditarticleError
+
+FIXTURES = "./eruditarticle/tests/fixtures/article/**/*.xml"
+LANGUAGE = "fr"
+
+
+def call_accessors(article):
+    """ Call the accessors gathered by ``extract()`` one by one. """
+    return {
+        "titles": article.get_titles(html=True),
+        "authors": article.get_authors(),
+        "abstracts": article.get_abstracts(html=True),
+        "keywords": article.get_keywords(html=True),
+        "doi": article.get_doi(),
+        "first_page": article.get_first_page(),
+        "last_page": article.get_last_page(),
+        "copyrights": article.get_copyrights(LANGUAGE, formatted=True, html=True),
+        "notegens": article.get_notegens(html=True),
+        "section_titles": [
+            article.get_section_titles(level=level, html=True) for level in (1, 2, 3)
+        ],
+        "references": article.get_references(html=True),
+    }
+
+
+def get_articles():
+    """ :returns: the parsed articles of the fixtures which have all the fields. """
+    articles = []
+    for path in sorted(glob.glob(FIXTURES, recursive=True)):
+        with open(path, "rb") as fp:
+            article = EruditArticle(fp.read())
+        try:
+            call_accessors(article)
+        except (LiberuditarticleError, AttributeError):
+            # Some fixtures are partial, without languages or sections.
+            continue
+        articles.append(article)
+    return articles
+
+
+def measure(articles, *extracts):
+    """ :returns: the best time of each extraction over all the articles. """
+    timings = [[] for _ in extracts]
+    # Interleave the runs so that they are all affected by the load of the machine.
+    for _ in range(20):
+        for extract, extract_timings in zip(extracts, timings):
+
+            def run():
+                for article in articles:
+                    article.clear_cache()
+                    extract(article)
+
+            extract_timings.append(timeit.timeit(run, number=1))
+    return [min(extract_timings) for extract_timings in timings]
+
+
+def main():
+    django.setup()
+    articles = get_articles()
+    for article in articles:
+        article.clear_cache()
+        fields = article.extract(language=LANGUAGE)
+        article.clear_cache()
+        values = call_accessors(article)
+        assert fields.keys() == values.keys()
+        assert repr(fields["titles"]) == repr(values["titles"])
+        assert [a.format_name() for a in fields["authors"]] == [
+            a.format_name() for a in values["authors"]
+        ]
+        for field in fields.keys() - {"titles", "authors"}:
+            assert fields[field] == values[field], field
+
+    accessors, extract = measure(
+        articles, call_accessors, lambda a: a.extract(language=LANGUAGE)
+    )
+    print("{} articles".format(len(articles)))
+    print("accessors: {:>7.1f} ms".format(accessors * 1000))
+    print("extract:   {:>7.1f} ms ({:.0%})".format(extract * 1000, extract / accessors))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Compare EruditPublication.render_bundle with the sum of the accessors it gathers.
+
+Usage, from the root of the repository::
+
+    DJANGO_SETTINGS_MODULE=eruditarticle.tests.settings python benchmarks/render_bundle.py
+"""
+import glob
+import timeit
+
+import django
+from django.utils.translation import override
+
+from eruditarticle.objects import EruditPublication
+from eruditarticle.objects.exceptions import LiberuditarticleError
+
+FIXTURES = "./eruditarticle/tests/fixtures/publication/**/*.xml"
+LANGUAGE = "fr"
+
+
+def call_accessors(publication):
+    """ Call the accessors of an issue page one by one. """
+    with override(LANGUAGE):
+        return (
+            publication.get_journal_title(formatted=True, html=True),
+            publication.get_volume_numbering(formatted=True, html=True),
+            publication.get_themes(formatted=True, html=True),
+            publication.get_redacteurchef(),
+            publication.get_notegens_edito(html=True),
+            publication.get_copyrights(LANGUAGE, formatted=True, html=True),
+            publication.get_droitsauteur(),
+            publication.get_summary_articles(),
+        )
+
+
+def get_publications():
+    """ :returns: the parsed publications of the fixtures which have an issue page. """
+    publications = []
+    for path in sorted(glob.glob(FIXTURES, recursive=True)):
+        with open(path, "rb") as fp:
+            publication = EruditPublication(fp.read())
+        try:
+            call_accessors(publication)
+        except LiberuditarticleError:
+            continue
+        publications.append(publication)
+    return publications
+
+
+def measure(publications, *renders):
+    """ :returns: the best time of each render over all the publications. """
+    timings = [[] for _ in renders]
+    # Interleave the runs so that they are all affected by the load of the machine.
+    for _ in range(20):
+        for render, render_timings in zip(renders, timings):
+
+            def run():
+                for publication in publications:
+                    publication.clear_cache()
+                    render(publication)
+
+            render_timings.append(timeit.timeit(run, number=1))
+    return [min(render_timings) for render_timings in timings]
+
+
+def main():
+    django.setup()
+    publications = get_publications()
+    for publication in publications:
+        publication.clear_cache()
+        bundle = publication.render_bundle(LANGUAGE)
+        publication.clear_cache()
+        values = call_accessors(publication)
+        assert [
+            bundle.journal_title,
+            bundle.volume_numbering,
+            bundle.themes,
+            [r.format_name() for r in bundle.redacteurchef],
+            bundle.notegens_edito,
+            bundle.copyrights,
+            bundle.droitsauteur,
+            bundle.summary_articles,
+        ] == [
+            *values[:3],
+            [r.format_name() for r in values[3]],
+            *values[4:],
+        ]
+
+    accessors, bundle = measure(
+        publications, call_accessors, lambda p: p.render_bundle(LANGUAGE)
+    )
+    print("{} issues".format(len(publications)))
+    print("accessors: {:>7.1f} ms".format(accessors * 1000))
+    print("bundle:    {:>7.1f} ms ({:.0%})".format(bundle * 1000, bundle / accessors))
+
+
+if __name__ == "__main__":
+    main()
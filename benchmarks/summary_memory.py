@@ -0,0 +1,64 @@
+"""Compare the memory used by lists of SummaryArticle and by SummaryArticleColumns.
+
+Usage, from the root of the repository::
+
+    DJANGO_SETTINGS_MODULE=eruditarticle.tests.settings python benchmarks/summary_memory.py
+"""
+import gc
+import glob
+import pickle
+import tracemalloc
+
+import django
+
+from eruditarticle.objects import EruditPublication
+from eruditarticle.objects import SummaryArticleColumns
+
+FIXTURES = "./eruditarticle/tests/fixtures/publication/**/*.xml"
+
+
+def get_summaries():
+    """:returns: the pickled summaries of the fixtures, as returned by
+    get_summary_articles(). Pickling formats their lazy fields."""
+    summaries = []
+    for path in sorted(glob.glob(FIXTURES, recursive=True)):
+        with open(path, "rb") as fp:
+            summary_articles = EruditPublication(fp.read()).get_summary_articles()
+        summaries.append(pickle.dumps(summary_articles))
+    return summaries
+
+
+def measure(build):
+    """ :returns: the result of ``build`` and the memory it holds. """
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def main():
+    django.setup()
+    summaries = get_summaries()
+
+    # Like a long-lived cache that unpickles its entries.
+    lists, lists_size = measure(lambda: [pickle.loads(s) for s in summaries])
+    columns, columns_size = measure(
+        lambda: [SummaryArticleColumns(pickle.loads(s)) for s in summaries]
+    )
+    assert [list(c) for c in columns] == lists
+
+    print(
+        "{} issues, {} articles".format(len(lists), sum(len(list_) for list_ in lists))
+    )
+    print("pickled: {:>9} bytes".format(sum(len(s) for s in summaries)))
+    print("lists:   {:>9} bytes".format(lists_size))
+    print(
+        "columns: {:>9} bytes ({:.0%})".format(columns_size, columns_size / lists_size)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""Disk-backed cache of the results of the objects accessors.
+
+The results are stored in a SQLite database, which can be shared by several processes, and are
+keyed by a hash of the raw XML document. An object built with a cache whose results are all
+cached never parses its document::
+
+    cache = SQLiteCache("/var/cache/eruditarticle.sqlite3")
+    article = EruditArticle(xml, cache=cache)
+    article.get_titles(html=True)
+"""
+
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+
+import lxml.etree as et
+
+from . import __version__
+
+
+class SQLiteCache:
+    """Store pickled accessor results in a SQLite database.
+
+    The least recently used entries are evicted when the total size of the stored results
+    exceeds ``max_size`` bytes. Results that cannot be pickled are not stored.
+
+    :param path: the path of the database file, created on first use.
+    :param max_size: the maximum size, in bytes, of the stored results.
+    :param timeout: how long, in seconds, to wait for another process holding a lock.
+    """
+
+    def __init__(self, path, max_size=64 * 1024 * 1024, timeout=5.0):
+        self.path = path
+        self.max_size = max_size
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _get_connection(self):
+        # SQLite connections must not be shared with other threads or forked processes.
+        pid = os.getpid()
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != pid:
+            connection = sqlite3.connect(
+                self.path, timeout=self.timeout, isolation_level=None
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " key TEXT PRIMARY KEY,"
+                " value BLOB NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " accessed REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)"
+            )
+            # The total size of the entries is kept up to date by triggers, so that it is not
+            # summed on every write. The replaced rows only fire the delete trigger with
+            # recursive triggers.
+            connection.execute("PRAGMA recursive_triggers = ON")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS metadata ("
+                " name TEXT PRIMARY KEY,"
+                " value INTEGER NOT NULL)"
+            )
+            connection.execute(
+                "CREATE TRIGGER IF NOT EXISTS entries_inserted AFTER INSERT ON entries"
+                " BEGIN UPDATE metadata SET value = value + new.size"
+                " WHERE name = 'total_size'; END"
+            )
+            connection.execute(
+                "CREATE TRIGGER IF NOT EXISTS entries_deleted AFTER DELETE ON entries"
+                " BEGIN UPDATE metadata SET value = value - old.size"
+                " WHERE name = 'total_size'; END"
+            )
+            # Databases created before the total was kept are summed once.
+            connection.execute(
+                "INSERT OR IGNORE INTO metadata (name, value)"
+                " SELECT 'total_size', COALESCE(SUM(size), 0) FROM entries"
+            )
+            self._local.connection = connection
+            self._local.pid = pid
+        return connection
+
+    @staticmethod
+    def get_document_key(xml):
+        """:returns: the key of a document, which changes with its content and the version of
+        the library."""
+        if not isinstance(xml, (str, bytes)):
+            xml = et.tostring(xml)
+        if isinstance(xml, str):
+            xml = xml.encode("utf-8")
+        return "{}:{}".format(__version__, hashlib.sha256(xml).hexdigest())
+
+    def get(self, key, default=None):
+        """ :returns: the result stored for ``key`` or ``default`` if there is none. """
+        connection = self._get_connection()
+        row = connection.execute(
+            "SELECT value FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return default
+        connection.execute(
+            "UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key)
+        )
+        return pickle.loads(row[0])
+
+    def set(self, key, value):
+        """ Store the result of an accessor and evict the least recently used results. """
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+        if len(data) > self.max_size:
+            return
+        connection = self._get_connection()
+        connection.execute(
+            "INSERT OR REPLACE INTO entries (key, value, size, accessed)"
+            " VALUES (?, ?, ?, ?)",
+            (key, data, len(data), time.time()),
+        )
+        self._evict(connection)
+
+    def _evict(self, connection):
+        (total_size,) = connection.execute(
+            "SELECT value FROM metadata WHERE name = 'total_size'"
+        ).fetchone()
+        excess = total_size - self.max_size
+        if excess <= 0:
+            return
+        keys = []
+        for key, size in connection.execute(
+            "SELECT key, size FROM entries ORDER BY accessed"
+        ):
+            keys.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        connection.executemany("DELETE FROM entries WHERE key = ?", keys)
+
+    def clear(self):
+        """ Remove all the stored results. """
+        self._get_connection().execute("DELETE FROM entries")
@@ -0,0 +1,365 @@
+# -*- coding: utf-8 -*-
+"""Export the citations of many articles as BibTeX, RIS or CSL-JSON.
+
+The fields of each article are gathered in a :class:`Citation` record: the authors are text-only
+:class:`~eruditarticle.objects.person.PersonRecord` snapshots and the numbering of the issue is a
+:class:`~eruditarticle.objects.VolumeNumbering` record, which the articles of an issue summary
+share. The records are then written one at a time, so that whole issues can be exported without
+keeping their citations in memory::
+
+    publication = EruditPublication(xml)
+    with open("citations.ris", "w") as fp:
+        write_citations(get_summary_citations(publication), fp, style="ris")
+"""
+
+import abc
+import json
+import re
+import typing
+from dataclasses import dataclass
+from urllib.parse import urlparse
+
+from .objects import EruditArticle, SummaryArticle, VolumeNumbering
+from .objects.exceptions import InvalidCitationStyleError, LiberuditarticleError
+from .objects.person import Person, PersonRecord
+
+
+@dataclass
+class Citation:
+    """The fields of an article used by the citation styles"""
+
+    localidentifier: typing.Optional[str]
+    title: typing.Optional[str]
+    authors: typing.List[PersonRecord]
+    journal_title: typing.Optional[str]
+    volume_numbering: typing.Optional[VolumeNumbering]
+    first_page: typing.Optional[str] = None
+    last_page: typing.Optional[str] = None
+    doi: typing.Optional[str] = None
+    url: typing.Optional[str] = None
+    issn: typing.Optional[str] = None
+    publishers: typing.Sequence[str] = ()
+    language: typing.Optional[str] = None
+
+    @property
+    def year(self):
+        """ :returns: the first year of the publication period of the issue. """
+        if self.volume_numbering is None:
+            return None
+        for tag, text in self.volume_numbering.publication_period_parts:
+            if tag == "annee" and text:
+                return text.strip()
+        return None
+
+
+class IssueCitationFields:
+    """The fields of an issue shared by the citations of its articles
+
+    The fields are read once, when the fields are built.
+    """
+
+    def __init__(self, publication):
+        self.publication = publication
+        self.journal_title = publication.get_journal_title()["main"].title
+        self.volume_numbering = publication.get_volume_numbering_record()
+        self.issn = publication.get_issn() or publication.get_issn_num()
+        self.publishers = tuple(publication.get_publishers())
+        # The articles of the summary, by localidentifier.
+        self.articles = {}
+        for article in publication.findall("article"):
+            self.articles.setdefault(article.get("idproprio"), article)
+
+    def get_citation(self, summary_article: SummaryArticle) -> Citation:
+        """ :returns: the citation of an article of the summary of the issue. """
+        article = self.articles.get(summary_article.localidentifier)
+        if article is not None:
+            # The title is formatted without markup, and without the other lazy fields of the
+            # summary article.
+            title = self.publication.get_summary_article_title(
+                summary_article.localidentifier
+            )
+            authors = [
+                Person(author).snapshot(html=False) for author in article.iter("auteur")
+            ]
+            languages = (article.get("lang") or "").split()
+        else:
+            title = summary_article.title
+            authors, languages = [], []
+        url = summary_article.urlhtml or summary_article.urlpdf
+        return Citation(
+            localidentifier=summary_article.localidentifier,
+            title=title,
+            authors=authors,
+            journal_title=self.journal_title,
+            volume_numbering=self.volume_numbering,
+            first_page=summary_article.first_page,
+            last_page=summary_article.last_page,
+            doi=summary_article.doi,
+            # The urls of the summary may be relative to the website of the journal.
+            url=url if url and urlparse(url).netloc else None,
+            issn=self.issn,
+            publishers=self.publishers,
+            language=languages[0] if languages else None,
+        )
+
+
+def get_article_citation(article: EruditArticle) -> Citation:
+    """ :returns: the citation of an article. """
+    return Citation(
+        localidentifier=article.get_localidentifier(),
+        title=article.get_formatted_title(),
+        authors=[author.snapshot(html=False) for author in article.get_authors()],
+        journal_title=article.get_text("revue/titrerev"),
+        volume_numbering=article.get_volume_numbering_record(),
+        first_page=article.get_first_page(),
+        last_page=article.get_last_page(),
+        doi=article.get_doi(),
+        url=article.get_uri(),
+        issn=article.get_issn() or article.get_issn_num(),
+        publishers=tuple(article.get_publishers()),
+        language=article.get_language(),
+    )
+
+
+def get_citations(
+    objects: typing.Iterable[typing.Union[EruditArticle, SummaryArticle]],
+    publication=None,
+) -> typing.Iterator[Citation]:
+    """Build the citations of articles, one at a time
+
+    :param objects: :class:`~eruditarticle.objects.EruditArticle` objects, or
+        :class:`~eruditarticle.objects.SummaryArticle` objects of the summary of ``publication``.
+    :param publication: the :class:`~eruditarticle.objects.EruditPublication` of the summary
+        articles. Its fields are read once and shared by the citations of its articles.
+    :returns: an iterator of the :class:`Citation` of each object.
+    """
+    issue_fields = None
+    for obj in objects:
+        if isinstance(obj, SummaryArticle):
+            if publication is None:
+                raise LiberuditarticleError(
+                    "The citations of summary articles need their publication"
+                )
+            if issue_fields is None:
+                issue_fields = IssueCitationFields(publication)
+            yield issue_fields.get_citation(obj)
+        else:
+            yield get_article_citation(obj)
+
+
+def get_summary_citations(publication) -> typing.Iterator[Citation]:
+    """ :returns: an iterator of the citations of the articles of an issue summary. """
+    return get_citations(publication.get_summary_articles(), publication)
+
+
+class CitationWriter(abc.ABC):
+    """Write citations to a text file-like object, one at a time
+
+    The subclasses define the formatting of a style, which is prepared once, when the class is
+    defined, and shared by all the citations.
+    """
+
+    def __init__(self, fp):
+        self.fp = fp
+        self.count = 0
+
+    def write_header(self):
+        pass
+
+    def write(self, citation: Citation):
+        self.write_citation(citation)
+        self.count += 1
+
+    @abc.abstractmethod
+    def write_citation(self, citation: Citation):
+        pass
+
+    def write_footer(self):
+        pass
+
+    @staticmethod
+    def format_pages(citation, separator):
+        """ :returns: the page range of the citation, or its first page. """
+        if citation.first_page and citation.last_page:
+            return "{}{}{}".format(citation.first_page, separator, citation.last_page)
+        return citation.first_page or citation.last_page
+
+
+class BibTeXWriter(CitationWriter):
+    """ Write citations as BibTeX ``@article`` entries. """
+
+    ESCAPES = str.maketrans(
+        {
+            "\\": r"\textbackslash{}",
+            "{": r"\{",
+            "}": r"\}",
+            "&": r"\&",
+            "%": r"\%",
+            "$": r"\$",
+            "#": r"\#",
+            "_": r"\_",
+            "~": r"\textasciitilde{}",
+            "^": r"\textasciicircum{}",
+        }
+    )
+    KEY_RE = re.compile(r"[^\w:.-]+")
+    FIELD = "  {} = {{{}}}"
+
+    def escape(self, value):
+        if not value:
+            return value
+        return " ".join(value.split()).translate(self.ESCAPES)
+
+    def format_author(self, author: PersonRecord):
+        if author.is_organization:
+            # Braces keep the name of an organization from being split by BibTeX.
+            return "{{{}}}".format(self.escape(author.organization) or "")
+        given = " ".join(n for n in (author.firstname, author.othername) if n)
+        if author.lastname and given:
+            return "{}, {}".format(self.escape(author.lastname), self.escape(given))
+        return self.escape(author.lastname or given)
+
+    def write_citation(self, citation: Citation):
+        key = self.KEY_RE.sub("", citation.localidentifier or "")
+        numbering = citation.volume_numbering
+        escape = self.escape
+        # The names of the authors are escaped by format_author().
+        authors = [self.format_author(author) for author in citation.authors]
+        fields = (
+            ("author", " and ".join(a for a in authors if a)),
+            ("title", escape(citation.title)),
+            ("journal", escape(citation.journal_title)),
+            ("volume", escape(numbering.volume) if numbering else None),
+            ("number", escape(numbering.number) if numbering else None),
+            ("year", escape(citation.year)),
+            ("pages", escape(self.format_pages(citation, "--"))),
+            ("doi", escape(citation.doi)),
+            ("url", escape(citation.url)),
+            ("issn", escape(citation.issn)),
+            ("publisher", escape(", ".join(citation.publishers))),
+            ("language", escape(citation.language)),
+        )
+        lines = [self.FIELD.format(name, value) for name, value in fields if value]
+        if self.count:
+            self.fp.write("\n")
+        self.fp.write(
+            "@article{{{},\n{}\n}}\n".format(
+                key or "article{}".format(self.count + 1), ",\n".join(lines)
+            )
+        )
+
+
+class RISWriter(CitationWriter):
+    """ Write citations as RIS ``JOUR`` records. """
+
+    LINE = "{}  - {}\n"
+
+    def write_line(self, tag, value):
+        if value:
+            self.fp.write(self.LINE.format(tag, " ".join(value.split())))
+
+    def format_author(self, author: PersonRecord):
+        if author.is_organization:
+            return author.organization
+        given = " ".join(n for n in (author.firstname, author.othername) if n)
+        if author.lastname and given:
+            return "{}, {}".format(author.lastname, given)
+        return author.lastname or given
+
+    def write_citation(self, citation: Citation):
+        numbering = citation.volume_numbering
+        self.fp.write(self.LINE.format("TY", "JOUR"))
+        for author in citation.authors:
+            self.write_line("AU", self.format_author(author))
+        self.write_line("TI", citation.title)
+        self.write_line("JO", citation.journal_title)
+        self.write_line("VL", numbering.volume if numbering else None)
+        self.write_line("IS", numbering.number if numbering else None)
+        self.write_line("PY", citation.year)
+        self.write_line("SP", citation.first_page)
+        self.write_line("EP", citation.last_page)
+        self.write_line("DO", citation.doi)
+        self.write_line("UR", citation.url)
+        self.write_line("SN", citation.issn)
+        for publisher in citation.publishers:
+            self.write_line("PB", publisher)
+        self.write_line("LA", citation.language)
+        self.write_line("ID", citation.localidentifier)
+        self.fp.write("ER  - \n")
+
+
+class CSLJSONWriter(CitationWriter):
+    """ Write citations as a CSL-JSON array of ``article-journal`` items. """
+
+    encoder = json.JSONEncoder(ensure_ascii=False)
+
+    def write_header(self):
+        self.fp.write("[")
+
+    def format_author(self, author: PersonRecord):
+        if author.is_organization:
+            return {"literal": author.organization}
+        name = {}
+        if author.lastname:
+            name["family"] = author.lastname
+        given = " ".join(n for n in (author.firstname, author.othername) if n)
+        if given:
+            name["given"] = given
+        return name
+
+    def write_citation(self, citation: Citation):
+        numbering = citation.volume_numbering
+        item = {
+            "id": citation.localidentifier,
+            "type": "article-journal",
+            "title": citation.title,
+            "author": [self.format_author(author) for author in citation.authors],
+            "container-title": citation.journal_title,
+            "volume": numbering.volume if numbering else None,
+            "issue": numbering.number if numbering else None,
+            "page": self.format_pages(citation, "-"),
+            "DOI": citation.doi,
+            "URL": citation.url,
+            "ISSN": citation.issn,
+            "publisher": ", ".join(citation.publishers),
+            "language": citation.language,
+        }
+        if citation.year and citation.year.isdigit():
+            item["issued"] = {"date-parts": [[int(citation.year)]]}
+        item = {key: value for key, value in item.items() if value}
+        self.fp.write(",\n" if self.count else "\n")
+        self.fp.write(self.encoder.encode(item))
+
+    def write_footer(self):
+        self.fp.write("\n]\n" if self.count else "]\n")
+
+
+# The writers of the citation styles, by name.
+CITATION_STYLES = {
+    "bibtex": BibTeXWriter,
+    "ris": RISWriter,
+    "csl-json": CSLJSONWriter,
+}
+
+
+def write_citations(
+    citations: typing.Iterable[Citation], fp, style: str = "bibtex"
+) -> int:
+    """Write citations to a file-like object, one at a time
+
+    :param citations: the citations to write, for instance as built by :func:`get_citations`.
+    :param fp: a text file-like object.
+    :param style: the name of the style, one of ``CITATION_STYLES``.
+    :returns: the number of citations written.
+    """
+    try:
+        writer = CITATION_STYLES[style](fp)
+    except KeyError:
+        raise InvalidCitationStyleError(
+            "Unknown citation style: {}".format(style)
+        ) from None
+    writer.write_header()
+    for citation in citations:
+        writer.write(citation)
+    writer.write_footer()
+    return writer.count
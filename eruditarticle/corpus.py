@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+"""Read the Érudit XML documents of a directory tree, a zip or a tar archive.
+
+The kind of each document is inferred from its root element, which is read from the beginning of
+the file only, and its object is built when it is first accessed. Archives are read in place,
+without being extracted::
+
+    with Corpus("/data/erudit.zip", types=[EruditArticle]) as corpus:
+        for document in corpus:
+            index(document.name, document.object.get_titles())
+
+The documents of directories and zips are listed by name, those of tars in the order of the
+archive, so that batch jobs run over a corpus in the same order every time.
+"""
+
+import abc
+import functools
+import io
+import logging
+import os
+import tarfile
+import zipfile
+
+import lxml.etree as et
+
+from .objects import EruditArticle, EruditJournal, EruditPublication
+from .objects.exceptions import LiberuditarticleError
+
+logger = logging.getLogger(__name__)
+
+# The object types of the documents, by the name of their root element.
+ROOT_TAGS = {
+    "article": EruditArticle,
+    "sommaire": EruditPublication,
+    "numeros": EruditJournal,
+}
+
+# The size of the chunks read from the beginning of a document to find its root element.
+SNIFF_SIZE = 4096
+
+
+def get_root_tag(fp):
+    """Read the name of the root element of an XML document
+
+    :param fp: a binary file-like object, at the beginning of the document.
+    :returns: the name of the root element, without its namespace, or ``None`` if the document
+        is not well-formed XML.
+    """
+    parser = et.XMLPullParser(events=("start",))
+    try:
+        while True:
+            chunk = fp.read(SNIFF_SIZE)
+            if not chunk:
+                parser.close()
+                return None
+            parser.feed(chunk)
+            for _, element in parser.read_events():
+                return et.QName(element).localname
+    except et.XMLSyntaxError:
+        return None
+
+
+def is_xml_name(name):
+    return name.lower().endswith(".xml")
+
+
+class CorpusSource(abc.ABC):
+    """ The XML files of a corpus, as ``(name, key)`` entries. """
+
+    @abc.abstractmethod
+    def get_entries(self):
+        """ :returns: the list of the entries, in the order of the corpus. """
+
+    def iter_entries(self):
+        """ :returns: an iterator of the entries, in the order of the corpus. """
+        return iter(self.get_entries())
+
+    @abc.abstractmethod
+    def open(self, key):
+        """ :returns: a binary file-like object of the file of an entry. """
+
+    def sniff(self, key):
+        """:returns: the root tag of the document of an entry and its raw XML, if it had to be
+        read in full."""
+        with self.open(key) as fp:
+            return get_root_tag(fp), None
+
+    def close(self):
+        pass
+
+
+class DirectorySource(CorpusSource):
+    """ The XML files of a directory tree, by relative path. """
+
+    def __init__(self, path):
+        self.path = path
+
+    def get_entries(self):
+        entries = []
+        for directory, directories, filenames in os.walk(self.path):
+            # os.walk() visits the subdirectories in the order of this list.
+            directories.sort()
+            for filename in filenames:
+                if is_xml_name(filename):
+                    path = os.path.join(directory, filename)
+                    entries.append((os.path.relpath(path, self.path), path))
+        entries.sort()
+        return entries
+
+    def open(self, key):
+        return open(key, "rb")
+
+
+class ZipSource(CorpusSource):
+    """ The XML members of a zip archive, by name. """
+
+    def __init__(self, path):
+        self.archive = zipfile.ZipFile(path)
+
+    def get_entries(self):
+        entries = [
+            (info.filename, info)
+            for info in self.archive.infolist()
+            if not info.is_dir() and is_xml_name(info.filename)
+        ]
+        entries.sort(key=lambda entry: entry[0])
+        return entries
+
+    def open(self, key):
+        return self.archive.open(key)
+
+    def close(self):
+        self.archive.close()
+
+
+class TarSource(CorpusSource):
+    """The XML members of a tar archive, compressed or not, in the order of the archive
+
+    A compressed stream can only seek backward by decompressing it again from its start. The
+    members are thus read once each, in a single forward pass, and their documents keep their
+    raw XML.
+    """
+
+    def __init__(self, path):
+        self.archive = tarfile.open(path)
+
+    def get_entries(self):
+        return list(self.iter_entries())
+
+    def iter_entries(self):
+        # The headers of the members are read along the way, unless they were all read already.
+        for member in self.archive:
+            if member.isfile() and is_xml_name(member.name):
+                yield member.name, member
+
+    def open(self, key):
+        return self.archive.extractfile(key)
+
+    def sniff(self, key):
+        with self.open(key) as fp:
+            xml = fp.read()
+        return get_root_tag(io.BytesIO(xml)), xml
+
+    def close(self):
+        self.archive.close()
+
+
+class CorpusDocument:
+    """A document of a corpus, whose object is built when it is first accessed
+
+    :param name: the path of the document, relative to the directory or the archive.
+    :param object_type: the class of the object of the document.
+    """
+
+    def __init__(self, corpus, name, key, object_type, xml=None):
+        self.name = name
+        self.object_type = object_type
+        self._corpus = corpus
+        self._key = key
+        self._xml = xml
+
+    def __repr__(self):
+        return "CorpusDocument(name={!r}, object_type={})".format(
+            self.name, self.object_type.__name__
+        )
+
+    def read(self):
+        """ :returns: the raw XML of the document. """
+        if self._xml is not None:
+            return self._xml
+        with self._corpus._source.open(self._key) as fp:
+            return fp.read()
+
+    @functools.cached_property
+    def object(self):
+        """ The object of the document, built from its raw XML on first access. """
+        return self.object_type(self.read(), cache=self._corpus.cache)
+
+
+class Corpus:
+    """The Érudit XML documents of a directory tree, a zip or a tar archive
+
+    Iterating over a corpus yields a :class:`CorpusDocument` for each document whose root element
+    is known, one at a time. The other documents, such as those wrapped in a Fedora
+    ``digitalObject``, are skipped. Only the names of the files are kept by the corpus, the
+    documents and their objects are not, so that the memory used by a batch job does not grow
+    with the corpus.
+
+    :param path: the path of a directory, or of a zip or tar archive.
+    :param types: the object types of the documents to yield, among :data:`ROOT_TAGS`. All the
+        documents are yielded by default.
+    :param cache: an optional :class:`eruditarticle.cache.SQLiteCache` given to the objects.
+    """
+
+    def __init__(self, path, types=None, cache=None):
+        if os.path.isdir(path):
+            self._source = DirectorySource(path)
+        elif zipfile.is_zipfile(path):
+            self._source = ZipSource(path)
+        elif tarfile.is_tarfile(path):
+            self._source = TarSource(path)
+        else:
+            raise LiberuditarticleError(
+                "'{}' is neither a directory nor a zip or tar archive".format(path)
+            )
+        self.path = path
+        self.types = None if types is None else tuple(types)
+        self.cache = cache
+        self._entries = None
+
+    def _get_entries(self):
+        if self._entries is None:
+            self._entries = self._source.get_entries()
+        return self._entries
+
+    def __length_hint__(self):
+        """:returns: the number of XML files of the corpus, some of which may be skipped. The
+        members of a compressed tar are counted by decompressing the whole archive once."""
+        return len(self._get_entries())
+
+    def __iter__(self):
+        if self._entries is not None:
+            entries = self._entries
+        else:
+            entries = self._source.iter_entries()
+        for name, key in entries:
+            root_tag, xml = self._source.sniff(key)
+            object_type = ROOT_TAGS.get(root_tag)
+            if object_type is None:
+                logger.debug("Skipping %s, whose root element is %s", name, root_tag)
+                continue
+            if self.types is not None and object_type not in self.types:
+                continue
+            yield CorpusDocument(self, name, key, object_type, xml)
+
+    def objects(self):
+        """ :returns: an iterator of the objects of the documents, built one at a time. """
+        for document in self:
+            yield document.object
+
+    def close(self):
+        """ Close the archive of the corpus, if any. """
+        self._source.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""Pure Python conversion of trivial marquage content to HTML.
+
+Most titles, keywords and names only contain text and a few ``marquage``, ``exposant``,
+``indice`` or ``caracunicode`` elements. For those nodes, walking the element is much cheaper than
+running the ``marquage_to_html`` XSLT and serializing its result, and produces the exact same
+HTML. Any other element makes the conversion bail out so that the XSLT is used instead.
+"""
+
+import re
+
+import lxml.etree as et
+
+# The HTML tags of the ``marquage`` types which are not converted to a ``span``.
+MARQUAGE_TAGS = {
+    "gras": "strong",
+    "italique": "em",
+    "taillep": "small",
+}
+
+# The HTML tags of the other converted elements.
+ELEMENT_TAGS = {
+    "exposant": "sup",
+    "indice": "sub",
+}
+
+# Elements whose tags are stripped while their content is kept.
+TRANSPARENT_ELEMENTS = {"caracunicode"}
+
+# Root elements that the XSLT converts to tags with attributes or that the HTML serializer
+# handles in a special way, which would affect the extraction of their content.
+UNSUPPORTED_ROOTS = {
+    "A",
+    "a",
+    "em",
+    "liensimple",
+    "listenonord",
+    "listeord",
+    "marquage",
+    "renvoi",
+    "script",
+    "small",
+    "span",
+    "strong",
+    "style",
+    "sub",
+    "sup",
+}
+
+CLASS_RE = re.compile(r"^[A-Za-z0-9_-]*$")
+
+
+class UnsupportedMarkupError(Exception):
+    """Raised when a node contains markup that is not handled in pure Python"""
+
+
+def escape(text):
+    """Escape text the same way as the lxml HTML serializer."""
+    if "\r" in text:
+        raise UnsupportedMarkupError("carriage return")
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def _render_children(node, strip_elements, parts):
+    if node.text:
+        parts.append(escape(node.text))
+    for child in node:
+        tag = child.tag
+        if not isinstance(tag, str):
+            # Comments and processing instructions are dropped by the XSLT, entities are not.
+            if not isinstance(child, (et._Comment, et._ProcessingInstruction)):
+                raise UnsupportedMarkupError(tag)
+        elif tag in strip_elements:
+            pass
+        elif tag in TRANSPARENT_ELEMENTS:
+            _render_children(child, strip_elements, parts)
+        else:
+            if tag == "marquage":
+                typemarq = child.get("typemarq", "")
+                html_tag = MARQUAGE_TAGS.get(typemarq)
+                if html_tag is not None:
+                    parts.append("<{}>".format(html_tag))
+                elif CLASS_RE.match(typemarq):
+                    html_tag = "span"
+                    parts.append('<span class="{}">'.format(typemarq))
+                else:
+                    raise UnsupportedMarkupError(typemarq)
+            elif tag in ELEMENT_TAGS:
+                html_tag = ELEMENT_TAGS[tag]
+                parts.append("<{}>".format(html_tag))
+            else:
+                raise UnsupportedMarkupError(tag)
+            _render_children(child, strip_elements, parts)
+            parts.append("</{}>".format(html_tag))
+        if child.tail:
+            parts.append(escape(child.tail))
+
+
+def render(node, strip_elements=None):
+    """Convert the content of a node to HTML without the XSLT.
+
+    :param strip_elements: elements to drop, with their content, from the node.
+    :returns: the node's content as an HTML string, not normalized, or ``None`` if the node
+        contains markup that must be converted with the XSLT.
+    """
+    if not isinstance(node.tag, str) or node.tag in UNSUPPORTED_ROOTS:
+        return None
+    parts = []
+    try:
+        _render_children(node, strip_elements or (), parts)
+    except UnsupportedMarkupError:
+        return None
+    return "".join(parts)
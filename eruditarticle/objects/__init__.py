@@ -20,7 +20,10 @@
 
 """
 from .publication import EruditPublication, SummaryArticle  # noqa
-from .article import EruditArticle  # noqa
+from .publication import SummaryArticleColumns  # noqa
+from .publication import PublicationBundle, SummarySection  # noqa
+from .numbering import VolumeNumbering, format_volume_numbering  # noqa
+from .article import ARTICLE_FIELDS, EruditArticle  # noqa
 from .journal import EruditJournal  # noqa
 from .base import EruditBaseObject  # noqa
 from .base import Title  # noqa
@@ -2,11 +2,17 @@ import logging
 from collections import OrderedDict
 from xml.etree import ElementTree
 
+from .. import xpath
 from .base import EruditBaseObject
+from .base import Title
+from .base import _get_active_language
+from .base import cached_accessor
+from .base import requires_sections
 from .mixins import CopyrightMixin
 from .mixins import ISBNMixin
 from .mixins import ISSNMixin
 from .mixins import PublicationPeriodMixin
+from .numbering import VolumeNumberingMixin
 from .person import (
     Person,
     format_authors,
@@ -15,14 +21,39 @@ from .person import (
     format_authors_chicago,
 )
 
-from .exceptions import InvalidOrdseqError, InvalidTitleLevelError
+from .exceptions import InvalidFieldError, InvalidOrdseqError, InvalidTitleLevelError
 
 logger = logging.getLogger(__name__)
 
+# The fields which can be extracted at once with ``EruditArticle.extract()``.
+ARTICLE_FIELDS = (
+    "titles",
+    "authors",
+    "abstracts",
+    "keywords",
+    "doi",
+    "first_page",
+    "last_page",
+    "copyrights",
+    "notegens",
+    "section_titles",
+    "references",
+)
+
 
 class EruditArticle(
-    PublicationPeriodMixin, ISBNMixin, ISSNMixin, CopyrightMixin, EruditBaseObject
+    PublicationPeriodMixin,
+    VolumeNumberingMixin,
+    ISBNMixin,
+    ISSNMixin,
+    CopyrightMixin,
+    EruditBaseObject,
 ):
+
+    SECTIONS = ("admin", "grlien", "liminaire", "corps", "partiesann", "head")
+
+    @requires_sections("liminaire")
+    @cached_accessor
     def get_abstracts(self, formatted=False, html=False, strip_footnotes=True):
         """Returns the abstracts of the article object
         :param formatted: (bool, optional): Defaults to False.
@@ -58,7 +89,7 @@ class EruditArticle(
             parser_method = self.convert_marquage_content_to_html
         else:
             parser_method = self.stringify_children
-        for abstract_dom in self.findall("resume"):
+        for abstract_dom in self.findall("liminaire/resume"):
 
             abstract = {
                 "lang": abstract_dom.get("lang"),
@@ -92,6 +123,8 @@ class EruditArticle(
         """ :returns: the type of the article. """
         return self._dom.getroot().get("typeart")
 
+    @requires_sections("liminaire")
+    @cached_accessor
     def get_authors(self, formatted=False, html=False, style=None, suffixes=True):
         """:returns: the authors of the article object.
 
@@ -100,12 +133,7 @@ class EruditArticle(
         :param style: alternative formatting style. choices: 'mla', 'apa', 'chicago'
         """
 
-        authors = [
-            Person(author)
-            for author in self._root.xpath(
-                '//liminaire//auteur[not(contribution[@typecontrib!="aut"])]'
-            )
-        ]
+        authors = [Person(author) for author in self.findall(xpath.article_authors)]
 
         if formatted and len(authors) == 0:
             return ""
@@ -131,38 +159,54 @@ class EruditArticle(
         """
         return self.get_authors(formatted=True)
 
+    @requires_sections("admin", "liminaire")
+    @cached_accessor
     def get_notegens(self, html=True):
         """
 
         :returns: the notes of the article object."""
-        notegen_nodes = self.findall("notegen")
-        notegens = []
+        notegen_nodes = [
+            (notegen_node, self.findall("alinea", dom=notegen_node))
+            for notegen_node in self.findall("admin/numero/notegen")
+            + self.findall("liminaire/notegen")
+        ]
         if html:
-            parser_method = self.convert_marquage_content_to_html
-        else:
-            parser_method = self.stringify_children
-        for notegen_node in notegen_nodes:
+            # Convert the alineas of all the notes at once.
+            contents = iter(
+                self.batch_convert_marquage_content_to_html(
+                    [n for _, alinea_nodes in notegen_nodes for n in alinea_nodes]
+                )
+            )
+        notegens = []
+        for notegen_node, alinea_nodes in notegen_nodes:
             notegen = {}
-            alinea_nodes = self.findall("alinea", dom=notegen_node)
             notegen["type"] = notegen_node.get("typenoteg")
             notegen["scope"] = notegen_node.get("porteenoteg")
-            notegen["content"] = [parser_method(n) for n in alinea_nodes]
+            if html:
+                notegen["content"] = [next(contents) for _ in alinea_nodes]
+            else:
+                notegen["content"] = [self.stringify_children(n) for n in alinea_nodes]
             notegens.append(notegen)
         return notegens
 
+    @requires_sections("admin")
     def get_doi(self):
         """ :returns: the DOI of the article object. """
-        doi = self.get_text('infoarticle/idpublic[@scheme="doi"]')
+        doi = self.get_text(xpath.article_doi)
         return doi.strip() if doi is not None else None
 
+    @requires_sections("admin")
     def get_uri(self):
         """ :returns: the URI of the article object. """
-        return self.get_text('idpublic[@scheme="uri"]')
+        return self.get_text(xpath.article_uri)
 
+    @requires_sections("admin")
     def get_first_page(self):
         """ :returns: the first page of the article object. """
-        return self.get_text("infoarticle//pagination//ppage")
+        return self.get_text("admin/infoarticle/pagination/ppage")
 
+    @requires_sections("corps")
+    @cached_accessor
     def get_html_body(self):
         """
         .. warning::
@@ -170,19 +214,18 @@ class EruditArticle(
            For more information please refer to :py:mod:`eruditarticle.objects`
 
         :returns: the full body of the article object as HTML text."""
-        alinea_nodes = self.findall("para/alinea")
+        alinea_nodes = self.findall("corps//para/alinea")
         if alinea_nodes:
-            nodes = [
-                self.convert_marquage_content_to_html(n)
-                for n in alinea_nodes
-                if n.text is not None
-            ]
+            nodes = self.batch_convert_marquage_content_to_html(
+                [n for n in alinea_nodes if n.text is not None]
+            )
             html_body = " ".join(n for n in nodes if n is not None)
         else:
             texte_node = self.find("corps/texte")
             html_body = self.convert_marquage_content_to_html(texte_node)
         return html_body if html_body else ""
 
+    @requires_sections("liminaire")
     def get_html_title(self):
         """
         .. warning::
@@ -190,25 +233,41 @@ class EruditArticle(
            For more information please refer to :py:mod:`eruditarticle.objects`
 
         :returns: the title of the article object with HTML tags."""
-        return self.convert_marquage_content_to_html(self.find("titre"))
+        return self.convert_marquage_content_to_html(
+            self.find("liminaire/grtitre/titre")
+        )
 
+    @requires_sections("liminaire")
+    @cached_accessor
     def get_keywords(self, formatted=False, html=False):
         """:returns: the keywords of the article object.
 
         The keywords are returned as an ``OrderedDict`` index by language code.
         """
         keywords = OrderedDict()
-        for tree_keywords in self.findall("grmotcle"):
-            lang_keywords = keywords[tree_keywords.get("lang")] = []
-            for n in tree_keywords.findall("motcle"):
+        keywords_nodes = [
+            (tree_keywords.get("lang"), tree_keywords.findall("motcle"))
+            for tree_keywords in self.findall("liminaire/grmotcle")
+        ]
+        if html:
+            # Convert the keywords of all the languages at once.
+            html_keywords = iter(
+                self.batch_convert_marquage_content_to_html(
+                    [n for _, motcle_nodes in keywords_nodes for n in motcle_nodes]
+                )
+            )
+        for lang, motcle_nodes in keywords_nodes:
+            lang_keywords = keywords[lang] = []
+            for n in motcle_nodes:
                 if html:
-                    s = self.convert_marquage_content_to_html(n)
+                    s = next(html_keywords)
                 else:
                     s = ElementTree.tostring(n, encoding="utf8", method="text")
                     s = s.decode("utf-8").strip()
                 lang_keywords.append(s)
         return keywords
 
+    @cached_accessor
     def get_languages(self):
         """ :returns: a list of  languages of the article object. """
         return self._root.get("lang").split()
@@ -219,9 +278,14 @@ class EruditArticle(
         if languages:
             return languages[0]
 
+    @requires_sections("admin")
     def get_last_page(self):
         """ :returns: the last page of the article object. """
-        return self.get_text("infoarticle//pagination//dpage")
+        return self.get_text("admin/infoarticle/pagination/dpage")
+
+    def get_localidentifier(self):
+        """ :returns: the local identifier of the article object. """
+        return self._root.get("idproprio")
 
     def get_ordseq(self):
         """ :returns: the ordering number of the article object. """
@@ -235,14 +299,18 @@ class EruditArticle(
         """ :returns: the processing type of the article object. """
         return self._root.get("qualtraitement")
 
+    @requires_sections("admin")
     def get_publication_year(self):
         """ :returns: the year of publication of the article object. """
-        return self.get_text("numero//pub//annee")
+        return self.get_text("admin/numero/pub/annee")
 
+    @requires_sections("admin")
     def get_publishers(self):
         """ :returns: the publisher of the article object. """
-        return [publisher.text for publisher in self.findall("editeur//nomorg")]
+        return [publisher.text for publisher in self.findall("admin/editeur/nomorg")]
 
+    @requires_sections("liminaire")
+    @cached_accessor
     def get_section_titles(self, level=1, html=True):
         """:returns: the section titles of the article object
 
@@ -286,16 +354,23 @@ class EruditArticle(
         else:
             return self.stringify_children(self.find(element))
 
+    @requires_sections("liminaire")
     def get_subtitle(self):
         """ :returns: the subtitle of the article object. """
-        return self.stringify_children(self.find("sstitre"))
+        return self.stringify_children(self.find("liminaire/grtitre/sstitre"))
 
+    @requires_sections("liminaire")
     def get_reviewed_works(self, html=True):
         """ :returns: the works reviewed by this article """
+        grtitre = self.find("liminaire/grtitre")
+        if grtitre is None:
+            return []
         return self._get_reviewed_or_referenced_works(
-            root_elem=self._dom, ref_elem_name="trefbiblio", html=html
+            root_elem=grtitre, ref_elem_name="trefbiblio", html=html
         )
 
+    @requires_sections("partiesann")
+    @cached_accessor
     def get_references(self, html=True):
         """
         .. warning::
@@ -306,20 +381,23 @@ class EruditArticle(
              that contains possibly two keys: doi and title
         """
         references = []
-        xml_references = self.findall("refbiblio")
-        for reference in xml_references:
-            doi = reference.find('idpublic[@scheme="doi"]')
-            if doi is not None:
-                doi = doi.text.strip()
-            if html:
-                title = self.convert_marquage_content_to_html(
-                    reference, strip_elements=("idpublic",)
-                )
-            else:
-                title = self.stringify_children(reference, strip_elements=("idpublic",))
+        xml_references = self.findall("partiesann//refbiblio")
+        if html:
+            titles = self.batch_convert_marquage_content_to_html(
+                xml_references, strip_elements=("idpublic",)
+            )
+        else:
+            titles = [
+                self.stringify_children(reference, strip_elements=("idpublic",))
+                for reference in xml_references
+            ]
+        for reference, title in zip(xml_references, titles):
+            doi = xpath.reference_doi(reference)
+            doi = doi[0].text.strip() if doi else None
             references.append({"doi": doi, "title": title})
         return references
 
+    @cached_accessor
     def get_title(self, formatted=False, html=False):
         """Returns the title of the article object.
         :param formatted: (bool, optional): Defaults to False.
@@ -335,15 +413,18 @@ class EruditArticle(
                 strip_elements=["liensimple", "renvoi"],
             )
 
+    @requires_sections("admin")
+    @cached_accessor
     def get_journal_titles(self):
         """:returns: the titles of the journal
 
         This method has the same behaviour as :meth:`~.get_titles`.
         """
-        languages = self.find("revue").get("lang").split()
+        revue = self.find("admin/revue")
+        languages = revue.get("lang").split()
 
         return self._get_titles(
-            root_elem=self.find("revue"),
+            root_elem=revue,
             title_elem_name="titrerev",
             subtitle_elem_name="sstitrerev",
             paral_title_elem_name="titrerevparal",
@@ -351,6 +432,8 @@ class EruditArticle(
             languages=languages,
         )
 
+    @requires_sections("liminaire")
+    @cached_accessor
     def get_titles(self, html=True):
         """Retrieve the titles of an article
 
@@ -409,7 +492,7 @@ class EruditArticle(
         """
 
         titles = self._get_titles(
-            root_elem=self.find("grtitre"),
+            root_elem=self.find("liminaire/grtitre"),
             title_elem_name="titre",
             subtitle_elem_name="sstitre",
             paral_title_elem_name="titreparal",
@@ -454,7 +537,101 @@ class EruditArticle(
         titles = self.get_titles(html=True)
         return self._get_formatted_title(titles, html=True)
 
+    def extract(self, fields=None, html=True, language=None):
+        """Return several fields of the article object at once
+
+        The nodes converted to HTML by the requested fields are all converted with a single XSLT
+        transformation, and each of them at most once, instead of once per accessor.
+
+        :param fields: the names of the fields to return, among ``ARTICLE_FIELDS``. Defaults to
+            all of them.
+        :param html: convert XML markup to HTML.
+        :param language: the language of the copyrights notice. Defaults to the active language,
+            or to the main language of the article.
+        :returns: a dictionary of the requested fields, in the order of ``fields``. Each value is
+            the one returned by the matching accessor, ``section_titles`` being the list of the
+            section titles of levels 1, 2 and 3.
+        """
+        fields = ARTICLE_FIELDS if fields is None else list(fields)
+        unknown_fields = [field for field in fields if field not in ARTICLE_FIELDS]
+        if unknown_fields:
+            raise InvalidFieldError(
+                "Unknown fields: {}".format(", ".join(unknown_fields))
+            )
+        if language is None:
+            language = _get_active_language() or self.get_language()
+
+        accessors = {
+            "titles": lambda: self.get_titles(html=html),
+            "authors": lambda: self.get_authors(),
+            "abstracts": lambda: self.get_abstracts(html=html),
+            "keywords": lambda: self.get_keywords(html=html),
+            "doi": lambda: self.get_doi(),
+            "first_page": lambda: self.get_first_page(),
+            "last_page": lambda: self.get_last_page(),
+            "copyrights": lambda: self.get_copyrights(
+                language, formatted=True, html=html
+            ),
+            "notegens": lambda: self.get_notegens(html=html),
+            "section_titles": lambda: [
+                self.get_section_titles(level=level, html=html) for level in (1, 2, 3)
+            ],
+            "references": lambda: self.get_references(html=html),
+        }
+        with self.sharing_conversions():
+            if html:
+                self._batch_convert_marquage_content_to_html(
+                    self._get_extracted_nodes(fields)
+                )
+            return {field: accessors[field]() for field in fields}
+
+    def _get_extracted_nodes(self, fields):
+        """:returns: the ``(node, strip_elements)`` pairs converted to HTML by the accessors
+        of ``fields``.
+        """
+        renvoi = ["renvoi"]
+        if "titles" in fields:
+            grtitre = self.find("liminaire/grtitre")
+            if grtitre is not None:
+                for node in grtitre.iter(
+                    "titre", "sstitre", "titreparal", "sstitreparal"
+                ):
+                    yield node, Title.STRIP_ELEMENTS
+                for node in grtitre.iter("trefbiblio"):
+                    yield node, renvoi
+        if "abstracts" in fields:
+            for node in self.findall("liminaire/resume"):
+                yield node, ["titre", "renvoi"]
+                titre = node.find("titre")
+                if titre is not None:
+                    yield titre, renvoi
+        if "keywords" in fields:
+            for node in self.findall("liminaire/grmotcle"):
+                for motcle in node.iterfind("motcle"):
+                    yield motcle, renvoi
+        if "notegens" in fields:
+            for node in self.findall("admin/numero/notegen") + self.findall(
+                "liminaire/notegen"
+            ):
+                for alinea in self.findall("alinea", dom=node):
+                    yield alinea, renvoi
+        if "section_titles" in fields:
+            grtitre = self.find("liminaire/grtitre")
+            if grtitre is not None:
+                for node in grtitre:
+                    if isinstance(node.tag, str) and node.tag.startswith("surtitre"):
+                        yield node, renvoi
+        if "references" in fields:
+            for node in self.findall("partiesann//refbiblio"):
+                yield node, ["idpublic"]
+        if "copyrights" in fields:
+            copyright = self.find("copyright")
+            if copyright is not None:
+                for node in copyright.iter("label", "year"):
+                    yield node, renvoi
+
     @property
+    @requires_sections("corps")
     def is_of_type_roc(self):
         # If the first "corps/texte" element of the article is of type "roc" that means that
         # its content is minimally processed. What that's the case, this property is True.
@@ -475,6 +652,7 @@ class EruditArticle(
     languages = property(get_languages)
     language = property(get_language)
     last_page = property(get_last_page)
+    localidentifier = property(get_localidentifier)
     ordseq = property(get_ordseq)
     processing = property(get_processing)
     publication_year = property(get_publication_year)
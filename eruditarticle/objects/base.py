@@ -1,10 +1,21 @@
+try:
+    from django.conf import settings
+    from django.utils.translation import get_language
+except ImportError:
+    settings = None
+
 import collections
+import dataclasses
+import functools
+import inspect
+from copy import copy, deepcopy
 
 import lxml.etree as et
 import re
 import six
 
-from .exceptions import LiberuditarticleError
+from .exceptions import LiberuditarticleError, MissingSectionError
+from ..utils import parse_xml
 from ..utils import remove_xml_namespaces
 from .dom import DomObject
 from .person import Person
@@ -74,15 +85,227 @@ class Title:
         )
 
 
+# Marks the results that are not cached.
+MISSING = object()
+
+
+def _get_active_language():
+    """ Return the language the formatted results are translated to, if any. """
+    if settings is None or not settings.configured:
+        return None
+    return get_language()
+
+
+def _freeze_argument(value):
+    """ Make list arguments, such as ``idrefs``, usable in a cache key. """
+    if isinstance(value, list):
+        return tuple(_freeze_argument(item) for item in value)
+    return value
+
+
+def _copy_result(value):
+    """Copy the containers of a cached result so that callers cannot alter the cache.
+
+    Lists, tuples, dicts and dataclass records are copied, the other objects they contain are
+    shared with the cached result.
+    """
+    if isinstance(value, (list, tuple)):
+        return type(value)(_copy_result(item) for item in value)
+    if isinstance(value, dict):
+        return type(value)((key, _copy_result(item)) for key, item in value.items())
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return copy(value)
+    return value
+
+
+def _is_plain(value):
+    """Tell whether a result only holds builtin values, and containers and records of them.
+
+    Such results can be stored in the disk cache, unlike the elements of a tree and the objects
+    that hold them.
+    """
+    if value is None or isinstance(value, (str, bytes, int, float)):
+        return True
+    if isinstance(value, (list, tuple)):
+        return all(_is_plain(item) for item in value)
+    if isinstance(value, dict):
+        return all(_is_plain(k) and _is_plain(v) for k, v in value.items())
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return all(
+            _is_plain(getattr(value, field.name)) for field in dataclasses.fields(value)
+        )
+    if hasattr(value, "__dict__") and not hasattr(value, "__slots__"):
+        return all(_is_plain(item) for item in vars(value).values())
+    return False
+
+
+def cached_accessor(method):
+    """Memoize the results of an accessor on the object it is called on.
+
+    Results are cached per bound arguments, defaults included, so that ``get_titles()`` and
+    ``get_titles(html=True)`` share the same entry, and per active language since formatted
+    results are translated. Calls with unhashable arguments are not cached. Use
+    :meth:`~.EruditBaseObject.clear_cache` after altering the tree of an object.
+
+    Objects built with a disk cache (see :mod:`eruditarticle.cache`) also look the results of
+    their public accessors up and store them there, if they are plain values. The results of
+    private accessors, such as indexes, are only kept in memory.
+    """
+    signature = inspect.signature(method)
+    name = method.__qualname__
+    persistent = not method.__name__.startswith("_")
+
+    def get_cache_key(self, *args, **kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        arguments = tuple(bound.arguments.values())[1:]
+        return (name, _get_active_language(), tuple(map(_freeze_argument, arguments)))
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = get_cache_key(self, *args, **kwargs)
+        try:
+            result = self._accessor_cache.get(key, MISSING)
+        except TypeError:
+            return method(self, *args, **kwargs)
+        if result is MISSING:
+            result = self._get_cached_result(
+                key, functools.partial(method, self, *args, **kwargs), persistent
+            )
+        return _copy_result(result)
+
+    wrapper.get_cache_key = get_cache_key
+    return wrapper
+
+
+def requires_sections(*sections):
+    """Make an accessor raise :class:`~.MissingSectionError` when the object was built without
+    one of the sections it reads."""
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            for section in sections:
+                if section in self._discarded_sections:
+                    raise MissingSectionError(section, method.__name__)
+            return method(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
 class EruditBaseObject(DomObject):
-    def __init__(self, xml):
+    """An Erudit XML document.
+
+    :param xml: the document, as a string or as an lxml tree.
+    :param cache: an optional :class:`eruditarticle.cache.SQLiteCache` holding the results
+        of the cached accessors. The document is only parsed if it is needed to compute one.
+    :param sections: the names of the :attr:`SECTIONS` to parse, all of them by default. The
+        other sections are discarded while the document is parsed, and the accessors that read
+        them raise :class:`~.MissingSectionError`.
+    :param lazy: whether to parse a string document on first use rather than in the
+        constructor, which is implied by ``cache``. Syntax errors are then raised by the
+        accessors, every time they are called.
+    """
+
+    index_tags = True
+
+    #: The names of the children of the root element that can be discarded with the
+    #: ``sections`` argument.
+    SECTIONS = ()
+
+    def __init__(self, xml, cache=None, sections=None, lazy=False):
+        self._accessor_cache = {}
+        self._disk_cache = cache
+        if sections is None:
+            self._discarded_sections = ()
+        else:
+            unknown_sections = set(sections).difference(self.SECTIONS)
+            if unknown_sections:
+                raise LiberuditarticleError(
+                    "Unknown sections: {}".format(", ".join(sorted(unknown_sections)))
+                )
+            self._discarded_sections = tuple(
+                section for section in self.SECTIONS if section not in sections
+            )
+        if cache is not None:
+            self._document_key = cache.get_document_key(xml)
+        if (lazy or cache is not None) and isinstance(xml, (str, bytes)):
+            # The document is only parsed when it is needed, which a hit in the disk cache or
+            # a streamed summary avoid altogether.
+            self._xml = xml
+            self._tag_index = None
+        else:
+            self._dom = self._parse(xml)
+            super().__init__(self._dom.getroot())
+
+    def _parse(self, xml):
         if isinstance(xml, six.string_types) or isinstance(
             xml, six.moves.builtins.bytes
         ):
-            self._dom = remove_xml_namespaces(et.fromstring(xml))
+            return parse_xml(xml, discarded_sections=self._discarded_sections)
+        # Namespaces are stripped in place, do not alter the tree we were given.
+        dom = remove_xml_namespaces(deepcopy(xml))
+        root = dom.getroot()
+        for element in list(root):
+            if element.tag in self._discarded_sections:
+                root.remove(element)
+        return dom
+
+    @functools.cached_property
+    def _dom(self):
+        dom = self._parse(self._xml)
+        # Keep the document until it is parsed, so that a syntax error is raised again on the
+        # next access.
+        self._xml = None
+        return dom
+
+    @functools.cached_property
+    def _root(self):
+        return self._dom.getroot()
+
+    def _is_parsed(self):
+        return "_dom" in self.__dict__
+
+    def _indexed_findall(self, tag_name, dom):
+        if not self._is_parsed():
+            # ``dom`` comes from a streamed document, which is not indexed.
+            return None
+        return super()._indexed_findall(tag_name, dom)
+
+    def _get_cached_result(self, key, compute, persistent=True):
+        """Return the result of an accessor from the disk cache, if any, or compute it.
+
+        The result is kept in the in-memory cache of the object in both cases. Only the plain
+        results of ``persistent`` accessors are stored in the disk cache.
+        """
+        if self._disk_cache is None or not persistent:
+            result = compute()
         else:
-            self._dom = remove_xml_namespaces(xml)
-        super().__init__(self._dom.getroot())
+            disk_key = "{}:{!r}".format(self._document_key, key)
+            result = self._disk_cache.get(disk_key, MISSING)
+            if result is MISSING:
+                result = compute()
+                if _is_plain(result):
+                    self._disk_cache.set(disk_key, result)
+        self._accessor_cache[key] = result
+        return result
+
+    def _has_cached_result(self, accessor, *args, **kwargs):
+        """ Tell whether the result of a cached accessor is in the in-memory cache already. """
+        try:
+            return accessor.get_cache_key(self, *args, **kwargs) in self._accessor_cache
+        except TypeError:
+            return False
+
+    def clear_cache(self):
+        """Forget the results of the cached accessors, ie. after altering the tree.
+
+        The results stored in the disk cache, if any, are kept since they are keyed by the
+        original document.
+        """
+        self._accessor_cache.clear()
 
     def __getattr__(self, name):
         try:
@@ -92,6 +315,10 @@ class EruditBaseObject(DomObject):
         else:
             return val
 
+        # Private attributes, such as the lazily parsed tree, are never tags.
+        if name.startswith("_"):
+            raise AttributeError(name)
+
         # Tries to fetch the value of the tag whose name
         # matches the considered attribute
         result = self.find(name)
@@ -151,10 +378,9 @@ class EruditBaseObject(DomObject):
            For more information please refer to :py:mod:`eruditarticle.objects`
         """
         if html:
-            references = [
-                self.convert_marquage_content_to_html(ref)
-                for ref in root_elem.findall(f".//{ref_elem_name}")
-            ]
+            references = self.batch_convert_marquage_content_to_html(
+                root_elem.findall(f".//{ref_elem_name}")
+            )
         else:
             references = [
                 self.stringify_children(ref)
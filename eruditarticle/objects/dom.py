@@ -1,30 +1,191 @@
+import contextlib
+import contextvars
+import re
+from bisect import bisect_left
+from bisect import bisect_right
 from copy import copy
+from functools import lru_cache
 
 import lxml.etree as et
 
+from .. import marquage
+from .. import xpath
 from .. import xslt
 from ..utils import normalize_whitespace
 
+# The nodes that are not removed when all the tags of a tree are stripped.
+TEXT_STOPPERS = (et.Comment, et.ProcessingInstruction, et.Entity)
+
+SIMPLE_STEP_RE = re.compile(r"^[A-Za-z_][\w.-]*$")
+
+# The HTML of the nodes converted in a DomObject.sharing_conversions() context, keyed by node
+# and stripped elements.
+shared_conversions = contextvars.ContextVar("shared_conversions", default=None)
+
+
+@lru_cache(maxsize=None)
+def parse_simple_path(tag_name):
+    """Split a path made only of tag names and ``/`` or ``//`` separators into its steps.
+
+    :returns: a tuple of ``(descendant, tag)`` pairs, where ``descendant`` is ``True`` for the
+        ``//`` axis, or ``None`` if the path uses anything else (predicates, wildcards, etc.).
+    """
+    steps = []
+    descendant = True
+    for part in tag_name.split("/"):
+        if not part:
+            if descendant:
+                # Either a leading slash or more than two slashes in a row.
+                return None
+            descendant = True
+            continue
+        if not SIMPLE_STEP_RE.match(part):
+            return None
+        steps.append((descendant, part))
+        descendant = False
+    if descendant:
+        # Trailing slash.
+        return None
+    return tuple(steps)
+
+
+class TagIndex:
+    """Index of the elements of a tree by tag name, in document order.
+
+    The index is built in a single walk of the tree and allows to resolve simple paths (see
+    :func:`parse_simple_path`) with dictionary lookups and bisections instead of scanning the
+    whole tree. Elements removed from the tree after it was indexed are filtered out of the
+    results, but elements added to it are not indexed.
+    """
+
+    def __init__(self, root):
+        self._elements = {}
+        self._starts = {}
+        self._spans = {}
+        position = 0
+        for event, element in et.iterwalk(root, events=("start", "end")):
+            if event == "start":
+                self._elements.setdefault(element.tag, []).append(element)
+                self._starts.setdefault(element.tag, []).append(position)
+                self._spans[element] = position
+                position += 1
+            else:
+                self._spans[element] = (self._spans[element], position)
+
+    def __contains__(self, element):
+        return element in self._spans
+
+    def findall(self, steps, dom):
+        """Resolve the steps of a simple path relative to ``dom``.
+
+        Unlike lxml, the results never contain duplicates and are always in document order.
+        """
+        context = [dom]
+        for descendant, tag in steps:
+            ancestors = set(context)
+            context = [
+                element
+                for element in self._descendants(context, tag)
+                if self._is_under(element, ancestors, descendant)
+            ]
+            if not context:
+                break
+        return context
+
+    @staticmethod
+    def _is_under(element, ancestors, descendant):
+        """ :returns: whether ``element`` is still a child or a descendant of ``ancestors``. """
+        parent = element.getparent()
+        if not descendant:
+            return parent in ancestors
+        while parent is not None:
+            if parent in ancestors:
+                return True
+            parent = parent.getparent()
+        return False
+
+    def _descendants(self, context, tag):
+        """ :returns: the ``tag`` elements under any of the ``context`` elements. """
+        elements = self._elements.get(tag)
+        if not elements:
+            return []
+        starts = self._starts[tag]
+        results = []
+        last_end = -1
+        for element in context:
+            start, end = self._spans[element]
+            # The context is in document order, skip the elements nested in the previous one.
+            if start < last_end:
+                continue
+            last_end = end
+            results.extend(
+                elements[bisect_right(starts, start) : bisect_left(starts, end)]
+            )
+        return results
+
 
 class DomObject:
+
+    #: Whether ``find`` and ``findall`` should resolve simple paths with a :class:`TagIndex`.
+    index_tags = False
+
     def __init__(self, root):
         assert root is not None
         self._root = root
+        self._tag_index = None
+
+    def get_tag_index(self):
+        """ :returns: the tag index of the tree, built on first use. """
+        if self._tag_index is None:
+            self._tag_index = TagIndex(self._root)
+        return self._tag_index
 
-    def find(self, tag_name, dom=None):
-        """ Find an element in the tree. """
+    def _indexed_findall(self, tag_name, dom):
+        """:returns: the elements matching ``tag_name`` according to the tag index or ``None``
+        if the lookup cannot be resolved with the index."""
+        if not self.index_tags:
+            return None
+        steps = parse_simple_path(tag_name)
+        if steps is None:
+            return None
+        tag_index = self.get_tag_index()
+        if dom not in tag_index:
+            return None
+        return tag_index.findall(steps, dom)
+
+    def find(self, tag_name, dom=None, **variables):
+        """Find an element in the tree.
+
+        :param tag_name: a path relative to ``dom`` or a precompiled :class:`lxml.etree.XPath`.
+        :param variables: the XPath variables, if ``tag_name`` is a precompiled XPath.
+        """
         dom = dom if dom is not None else self._root
-        return dom.find(".//{}".format(tag_name))
+        if isinstance(tag_name, et.XPath):
+            elements = tag_name(dom, **variables)
+            return elements[0] if elements else None
+        elements = self._indexed_findall(tag_name, dom)
+        if elements is None:
+            return dom.find(".//{}".format(tag_name))
+        return elements[0] if elements else None
 
-    def findall(self, tag_name, dom=None):
-        """ Find elements in the tree. """
+    def findall(self, tag_name, dom=None, **variables):
+        """Find elements in the tree.
+
+        :param tag_name: a path relative to ``dom`` or a precompiled :class:`lxml.etree.XPath`.
+        :param variables: the XPath variables, if ``tag_name`` is a precompiled XPath.
+        """
         dom = dom if dom is not None else self._root
-        return dom.findall(".//{}".format(tag_name))
+        if isinstance(tag_name, et.XPath):
+            return tag_name(dom, **variables)
+        elements = self._indexed_findall(tag_name, dom)
+        if elements is None:
+            return dom.findall(".//{}".format(tag_name))
+        return elements
 
     def get_nodes(self, dom=None):
         """ :returns: all the elements under the current root. """
         dom = dom if dom is not None else self._root
-        return dom.xpath("child::node()")
+        return xpath.child_nodes(dom)
 
     def get_text(self, tag_name, dom=None):
         """ :returns: the text associated with the considered tag. """
@@ -61,12 +222,36 @@ class DomObject:
         """
         if node is None:
             return None
-        node = copy(node)
-        if strip_elements:
-            et.strip_elements(node, *strip_elements, with_tail=False)
-        et.strip_tags(node, "*")
-        if node.text is not None:
-            return normalize_whitespace(node.text)
+        strip_elements = strip_elements or ()
+        if next(node.iter(*strip_elements, *TEXT_STOPPERS), None) is None:
+            text = "".join(node.itertext())
+        else:
+            parts = []
+            DomObject._collect_text(node, strip_elements, parts)
+            text = "".join(parts)
+        return normalize_whitespace(text)
+
+    @staticmethod
+    def _collect_text(node, strip_elements, parts):
+        """Collect the text of a node, without copying it, as if it was stringified by stripping
+        ``strip_elements`` and then all the tags of a copy of the node.
+
+        Stripping the tags leaves comments, processing instructions and entities in place, so
+        the text of the stripped node stops at the first of them.
+
+        :returns: ``False`` if the text was stopped by such a node.
+        """
+        if node.text:
+            parts.append(node.text)
+        for child in node:
+            if not isinstance(child.tag, str):
+                return False
+            if child.tag not in strip_elements:
+                if not DomObject._collect_text(child, strip_elements, parts):
+                    return False
+            if child.tail:
+                parts.append(child.tail)
+        return True
 
     @staticmethod
     def convert_marquage_content_to_html(node, strip_elements=["renvoi"]):
@@ -81,16 +266,152 @@ class DomObject:
         """
         if node is None:
             return
+        conversions = shared_conversions.get()
+        if conversions is None:
+            return DomObject._convert_marquage_content_to_html(node, strip_elements)
+        key = (node, tuple(strip_elements or ()))
+        try:
+            return conversions[key]
+        except KeyError:
+            html = conversions[key] = DomObject._convert_marquage_content_to_html(
+                node, strip_elements
+            )
+            return html
+
+    @staticmethod
+    def _convert_marquage_content_to_html(node, strip_elements):
+        # Trivial nodes are converted without the XSLT.
+        html = marquage.render(node, strip_elements)
+        if html is not None:
+            return normalize_whitespace(html)
+        rendered_node = DomObject.render_marquage_to_html(node, strip_elements)
+        return DomObject.get_rendered_html(rendered_node, tag=node.tag)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def sharing_conversions(nodes=(), strip_elements=["renvoi"]):
+        """Convert each node to HTML at most once within this context.
+
+        The results of :meth:`convert_marquage_content_to_html` and
+        :meth:`batch_convert_marquage_content_to_html` are kept until the outermost context is
+        exited, so that the nodes used by several accessors are only converted once.
+
+        :param nodes: (list, optional): nodes to convert beforehand, all at once with
+            :meth:`batch_convert_marquage_content_to_html`.
+        :param strip_elements: (list, optional): Defaults to ['renvoi'].
+            The elements to strip from ``nodes``.
+        """
+        conversions = shared_conversions.get()
+        token = None
+        if conversions is None:
+            conversions = {}
+            token = shared_conversions.set(conversions)
+        try:
+            DomObject._batch_convert_marquage_content_to_html(
+                (node, strip_elements) for node in nodes if node is not None
+            )
+            yield
+        finally:
+            if token is not None:
+                shared_conversions.reset(token)
+
+    @staticmethod
+    def batch_convert_marquage_content_to_html(nodes, strip_elements=["renvoi"]):
+        """Converts <marquage> tags to HTML for a list of nodes with a single XSLT transformation.
+
+        The nodes are copied in one synthetic document which is converted at once. If the
+        conversion of the synthetic document cannot be split back into the original nodes, each
+        node is converted on its own.
+
+        :param nodes: (list): the nodes to convert, ``None`` values are allowed.
+        :param strip_elements: (list, optional): Defaults to ['renvoi'].
+            A list of XML elements to strip from the nodes.
+        :returns: the list of the nodes' texts as strings with the converted html, in the same
+            order as ``nodes``.
+        """
+        strip_key = tuple(strip_elements or ())
+        html = DomObject._batch_convert_marquage_content_to_html(
+            (node, strip_elements) for node in nodes if node is not None
+        )
+        return [html[(node, strip_key)] if node is not None else None for node in nodes]
+
+    @staticmethod
+    def _batch_convert_marquage_content_to_html(items):
+        """Convert ``(node, strip_elements)`` pairs with a single XSLT transformation.
+
+        :returns: a dictionary of the converted html indexed by ``(node, strip_elements)``, with
+            ``strip_elements`` as a tuple.
+        """
+        conversions = shared_conversions.get()
+        # Trivial nodes are converted without the XSLT.
+        html = {}
+        converted_items = []
+        for node, strip_elements in items:
+            key = (node, tuple(strip_elements or ()))
+            if key in html:
+                continue
+            if conversions is not None and key in conversions:
+                html[key] = conversions[key]
+                continue
+            html[key] = marquage.render(node, strip_elements)
+            if html[key] is not None:
+                html[key] = normalize_whitespace(html[key])
+            else:
+                converted_items.append((key, strip_elements))
+
+        if converted_items:
+            document = et.Element("lot")
+            for (node, _), strip_elements in converted_items:
+                node = copy(node)
+                node.tail = None
+                if strip_elements:
+                    et.strip_elements(node, *strip_elements, with_tail=False)
+                document.append(node)
+            rendered_nodes = list(xslt.marquage_to_html(document).getroot())
+
+            if len(rendered_nodes) == len(converted_items):
+                for (key, _), rendered_node in zip(converted_items, rendered_nodes):
+                    html[key] = DomObject.get_rendered_html(
+                        rendered_node, tag=key[0].tag
+                    )
+            else:
+                for key, strip_elements in converted_items:
+                    html[key] = DomObject.convert_marquage_content_to_html(
+                        key[0], strip_elements
+                    )
+
+        if conversions is not None:
+            conversions.update(html)
+        return html
+
+    @staticmethod
+    def render_marquage_to_html(node, strip_elements=["renvoi"]):
+        """Converts <marquage> tags to HTML in a whole subtree with a single XSLT transformation.
+
+        :param strip_elements: (list, optional): Defaults to ['renvoi'].
+            A list of XML elements to strip from the node.
+        :returns: the root of the converted copy of the node. The content of its elements can
+            then be serialized with :meth:`get_rendered_html`.
+        """
         node = copy(node)
         if strip_elements:
             et.strip_elements(node, *strip_elements, with_tail=False)
         # Converts <marquage> tags to HTML
-        _node = xslt.marquage_to_html(node)
+        return xslt.marquage_to_html(node).getroot()
+
+    @staticmethod
+    def get_rendered_html(rendered_node, tag=None):
+        """Serialize the content of a node converted by :meth:`render_marquage_to_html`.
+
+        :param tag: (str, optional): the tag of the node before its conversion.
+            Defaults to the tag of ``rendered_node``.
+        :returns: the node's content as a string with the converted html.
+        """
         # Strip all other tags but keep text
         et.strip_tags(
-            _node,
+            rendered_node,
             *[
-                node.tag,
+                tag or rendered_node.tag,
                 "caracunicode",
                 "citation",
                 "equationligne",
@@ -98,6 +419,55 @@ class DomObject:
                 "objetmedia",
             ]
         )
-        _html = et.tostring(_node.getroot(), encoding="utf-8", method="html")
+        _html = et.tostring(
+            rendered_node, encoding="utf-8", method="html", with_tail=False
+        )
         output = _html.split(b">", 1)[1].rsplit(b"<", 1)[0]
         return normalize_whitespace(output.decode("utf-8"))
+
+
+class HtmlRendering:
+    """Convert elements of a subtree to HTML with a single XSLT transformation.
+
+    The whole subtree is converted on first use and the HTML of the elements of the given tags is
+    then read from the converted tree. Those tags must be copied as is by the XSLT. Other elements,
+    or elements without a counterpart in the converted tree, are converted on their own.
+    """
+
+    STRIP_ELEMENTS = ["renvoi"]
+
+    def __init__(self, root, tags):
+        self._root = root
+        self._tags = tags
+        self._rendered_nodes = None
+
+    def to_html(self, node):
+        """ :returns: the content of ``node`` converted to html. """
+        if node is None:
+            return None
+        # Trivial nodes are converted without the XSLT.
+        html = marquage.render(node, self.STRIP_ELEMENTS)
+        if html is not None:
+            return normalize_whitespace(html)
+        rendered_node = None
+        if node.tag in self._tags:
+            rendered_node = self._get_rendered_nodes().get(node)
+        if rendered_node is None:
+            return DomObject.convert_marquage_content_to_html(node)
+        return DomObject.get_rendered_html(rendered_node)
+
+    def _get_rendered_nodes(self):
+        """ :returns: a dict mapping the elements of the given tags to their converted copy. """
+        if self._rendered_nodes is None:
+            rendered_root = DomObject.render_marquage_to_html(
+                self._root, self.STRIP_ELEMENTS
+            )
+            nodes = list(self._root.iter(*self._tags))
+            rendered_nodes = list(rendered_root.iter(*self._tags))
+            # Both trees list the elements in the same order, unless some of them were dropped
+            # by the conversion, in which case we can't tell which ones.
+            if len(nodes) == len(rendered_nodes):
+                self._rendered_nodes = dict(zip(nodes, rendered_nodes))
+            else:
+                self._rendered_nodes = {}
+        return self._rendered_nodes
@@ -42,3 +42,34 @@ class InvalidTitleLevelError(LiberuditarticleError):
         if message is None:
             self.message = "Invalid value for the title level"
         super().__init__(self.message)
+
+
+class MissingSectionError(LiberuditarticleError):
+    """Raised when an accessor needs a section that was discarded when parsing"""
+
+    def __init__(self, section, accessor):
+        self.section = section
+        self.accessor = accessor
+        super().__init__(
+            "'%s' needs the '%s' section, which was not parsed" % (accessor, section)
+        )
+
+
+class InvalidFieldError(LiberuditarticleError):
+    """Raised when an unknown field is requested"""
+
+    def __init__(self, message=None):
+        self.message = message
+        if message is None:
+            self.message = "Invalid value for the field name"
+        super().__init__(self.message)
+
+
+class InvalidCitationStyleError(LiberuditarticleError):
+    """Raised when an unknown citation style is requested"""
+
+    def __init__(self, message=None):
+        self.message = message
+        if message is None:
+            self.message = "Invalid value for the citation style"
+        super().__init__(self.message)
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 from .base import EruditBaseObject
+from .base import cached_accessor
 
 
 class EruditJournal(EruditBaseObject):
@@ -33,6 +34,7 @@ class EruditJournal(EruditBaseObject):
             return issue.get("pid")
         return None
 
+    @cached_accessor
     def get_publication_period(self):
         """ :returns: the publication period of the journal object. """
         pubyears = self.get_publication_years()
@@ -50,6 +52,7 @@ class EruditJournal(EruditBaseObject):
         pubyears = sorted(pubyears)
         return pubyears
 
+    @cached_accessor
     def get_notes(self, html=False, journal_pid=None):
         """Return the journal's notes.
 
@@ -1,4 +1,7 @@
+from .. import xpath
 from ..utils import normalize_whitespace
+from .base import cached_accessor
+from .base import requires_sections
 
 
 try:
@@ -9,66 +12,85 @@ except ImportError:
     _ = lambda x: x  # noqa
 
 
+def format_publication_period(parts):
+    """Format a publication period in the active language
+
+    :param parts: the ``(tag, text)`` pairs of the children of a ``pub`` element.
+    :returns: the publication period and the year.
+    """
+    parts = list(parts)
+    if not parts:
+        return ""
+    first_tag, first_text = parts.pop(0)
+    # Make sure we dont have an empty first element.
+    while first_text is None:
+        first_tag, first_text = parts.pop(0)
+    if first_tag == "annee":
+        previous_item_is_year = True
+    else:
+        previous_item_is_year = False
+
+    publication_period = first_text
+
+    for tag, text in parts:
+        if tag == "periode":
+            if previous_item_is_year:
+                publication_period = "{}, {}".format(
+                    pgettext("numbering", publication_period),
+                    pgettext("numbering", text),
+                )
+            else:
+                publication_period = "{}–{}".format(
+                    pgettext("numbering", publication_period),
+                    pgettext("numbering", text),
+                )
+            previous_item_is_year = False
+
+        if tag == "annee":
+            if previous_item_is_year:
+                publication_period = "{}–{}".format(
+                    pgettext("numbering", publication_period),
+                    pgettext("numbering", text),
+                )
+            else:
+                publication_period = "{} {}".format(
+                    pgettext("numbering", publication_period),
+                    pgettext("numbering", text),
+                )
+            previous_item_is_year = True
+
+    return pgettext("numbering", publication_period)
+
+
 class PublicationPeriodMixin(object):
+    @requires_sections("admin")
+    @cached_accessor
     def get_publication_period(self):
         """ Returns the publication period and the year of the publication object. """
+        return format_publication_period(self._get_publication_period_parts())
 
+    def _get_publication_period_parts(self):
+        """ Returns the untranslated parts of the publication period. """
         elem = self.find("numero//pub")
         if elem is None:
-            return ""
-        child_elements = elem.getchildren()
-        if not child_elements:
-            return ""
-        first_element = child_elements.pop(0)
-        # Make sure we dont have an empty first element.
-        while first_element is None or first_element.text is None:
-            first_element = child_elements.pop(0)
-        if first_element.tag == "annee":
-            previous_item_is_year = True
-        else:
-            previous_item_is_year = False
-
-        publication_period = first_element.text
-
-        for element in child_elements:
-            if element.tag == "periode":
-                if previous_item_is_year:
-                    publication_period = "{}, {}".format(
-                        pgettext("numbering", publication_period),
-                        pgettext("numbering", element.text),
-                    )
-                else:
-                    publication_period = "{}–{}".format(
-                        pgettext("numbering", publication_period),
-                        pgettext("numbering", element.text),
-                    )
-                previous_item_is_year = False
-
-            if element.tag == "annee":
-                if previous_item_is_year:
-                    publication_period = "{}–{}".format(
-                        pgettext("numbering", publication_period),
-                        pgettext("numbering", element.text),
-                    )
-                else:
-                    publication_period = "{} {}".format(
-                        pgettext("numbering", publication_period),
-                        pgettext("numbering", element.text),
-                    )
-                previous_item_is_year = True
-
-        return pgettext("numbering", publication_period)
+            return ()
+        return tuple(
+            (child.tag if isinstance(child.tag, str) else None, child.text)
+            for child in elem
+        )
 
     publication_period = property(get_publication_period)
 
 
 class ISBNMixin(object):
+    @requires_sections("admin")
     def get_isbn(self):
         """ Returns the ISBN number associated with the article object. """
         isbn = self.get_text("numero//idisbn")
         isbn13 = self.get_text("numero//idisbn13")
         return isbn13 or isbn
 
+    @requires_sections("admin")
     def get_isbn_num(self):
         """ Returns the numeric ISBN number associated with the article object. """
         isbn_num = self.get_text("numero//idisbnnum")
@@ -80,10 +102,12 @@ class ISBNMixin(object):
 
 
 class ISSNMixin(object):
+    @requires_sections("admin")
     def get_issn(self):
         """ Returns the ISSN number associated with the article object. """
         return self.get_text("revue//idissn")
 
+    @requires_sections("admin")
     def get_issn_num(self):
         """ Returns the numeric ISSN number associated with the article object. """
         return self.get_text("revue//idissnnum")
@@ -93,6 +117,7 @@ class ISSNMixin(object):
 
 
 class CopyrightMixin(object):
+    @requires_sections("admin")
     def get_droitsauteur(self, links_only=False):
         """Return the list of all copyright notices of this object.
 
@@ -126,6 +151,7 @@ class CopyrightMixin(object):
 
         return da_list
 
+    @requires_sections("admin")
     def get_droitsauteurorg(self):
         """ Return the owner of the first copyright for this object. """
         return self.get_text("droitsauteur/nomorg")
@@ -141,10 +167,10 @@ class CopyrightMixin(object):
             Whether to convert marquage content to HTML.
         :returns: The copyrights declaration as a string."""
         labels = []
-        declaration = root.xpath("contributiondeclaration | copyrightdeclaration")
+        declaration = xpath.copyright_declaration(root)
         if len(declaration):
-            labels = declaration[0].xpath(
-                'label[@lang="{}"]'.format(language)
+            labels = xpath.copyright_label(
+                declaration[0], lang=language
             ) or declaration[0].findall("label")
         if len(labels):
             return (
@@ -165,14 +191,7 @@ class CopyrightMixin(object):
         :returns: The copyrights holders' names as a list of strings."""
         names = []
         for contribution in root.findall("contribution"):
-            person = contribution.xpath(
-                " \
-                artificialperson/name | \
-                physicalperson/personname/firstname | \
-                physicalperson/personname/familyname | \
-                physicalperson/personname/personnameprefix/name \
-            "
-            )
+            person = xpath.copyright_names(contribution)
             # Put prefix first if prefix is present.
             if len(person) == 3:
                 person = person[-1:] + person[:-1]
@@ -220,6 +239,8 @@ class CopyrightMixin(object):
             last_name,
         )
 
+    @requires_sections("admin")
+    @cached_accessor
     def get_copyrights(self, language, formatted=False, html=False):
         """Return the copyrights notice for this object.
 
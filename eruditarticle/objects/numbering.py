@@ -0,0 +1,233 @@
+try:
+    from django.utils.translation import pgettext
+    from django.utils.translation import gettext as _
+    from django.utils.translation import override
+except ImportError:
+    pgettext = lambda ctx, msg: msg  # noqa
+    _ = lambda x: x  # noqa
+    override = None
+
+import contextlib
+import functools
+import typing
+from dataclasses import dataclass
+
+from .base import _get_active_language
+from .base import cached_accessor
+from .base import requires_sections
+from .mixins import format_publication_period
+
+
+@dataclass(frozen=True)
+class VolumeNumbering:
+    """The numbering of an issue, as found in its ``SUMMARY`` datastream
+
+    The record does not depend on the active language, it can be formatted in any language with
+    :func:`format_volume_numbering`.
+    """
+
+    volume: str = ""
+    number: str = ""
+    alt_number: str = ""
+    number_type: typing.Optional[str] = None
+    # The untranslated ``(tag, text)`` pairs of the children of the ``pub`` element.
+    publication_period_parts: typing.Tuple[
+        typing.Tuple[typing.Optional[str], typing.Optional[str]], ...
+    ] = ()
+
+    @property
+    def publication_period(self):
+        """ :returns: the publication period in the active language. """
+        return format_publication_period(self.publication_period_parts)
+
+    def as_dict(self):
+        """ :returns: the numbering as returned by ``get_volume_numbering()``. """
+        return {
+            "volume": self.volume,
+            "number": self.number,
+            "alt_number": self.alt_number,
+            "number_type": self.number_type,
+            "publication_period": self.publication_period,
+        }
+
+    def format(self, html=False, abbreviated=False, locale=None):
+        """ :returns: the numbering formatted with :func:`format_volume_numbering`. """
+        return format_volume_numbering(
+            [self], locale=locale, html=html, abbreviated=abbreviated
+        )[0]
+
+
+class VolumeNumberingMixin(object):
+    """Build the :class:`VolumeNumbering` record of the issue of an object
+
+    Only the record is provided, the accessors of the parts of the numbering are defined by the
+    objects, since the ``volume`` tag of an article is also looked up as ``article.volume``.
+    """
+
+    def _get_numbering_part(self, tag_name):
+        """ :returns: the texts of the ``tag_name`` children of ``numero``, joined by dashes. """
+        return "-".join(
+            [
+                e.text
+                for e in self.findall("numero/{}".format(tag_name))
+                if e is not None and e.text is not None
+            ]
+        )
+
+    @requires_sections("admin")
+    @cached_accessor
+    def get_volume_numbering_record(self) -> VolumeNumbering:
+        """:returns: the numbering of the issue, which can be formatted in any language with
+        :func:`format_volume_numbering`."""
+        return VolumeNumbering(
+            volume=self._get_numbering_part("volume"),
+            number=self._get_numbering_part("nonumero"),
+            alt_number=self._get_numbering_part("anonumero"),
+            number_type=self.get_text("publicationtypecode"),
+            publication_period_parts=self._get_publication_period_parts(),
+        )
+
+
+class VolumeNumberingTemplates:
+    """The translated labels and templates of a numbering variant in a language
+
+    :param number_type: the publication type code of the issues formatted with the templates.
+    """
+
+    def __init__(self, number_type, html=False, abbreviated=False):
+        if abbreviated and html:
+            volume_str = pgettext("numbering", "Vol.")
+            number_str = pgettext("numbering", "N<sup>o</sup>")
+            untranslated_number_str = "N<sup>o</sup>"
+        elif abbreviated:
+            volume_str = pgettext("numbering", "Vol.")
+            number_str = pgettext("numbering", "N°")
+            untranslated_number_str = "N°"
+        else:
+            volume_str = pgettext("numbering", "Volume")
+            number_str = pgettext("numbering", "Numéro")
+            untranslated_number_str = "Numéro"
+
+        if number_type == "hs":
+            number_type = pgettext("numbering", "hors-série")
+            number_str_number_type = pgettext(
+                "numbering", "{} hors-série".format(untranslated_number_str)
+            )
+        else:
+            if number_type == "supp":
+                number_type = pgettext("numbering", "supplément")
+            elif number_type == "index":
+                number_type = pgettext("numbering", "index")
+            else:
+                number_type = None
+            number_str_number_type = pgettext(
+                "numbering", "{} {}".format(untranslated_number_str, number_type)
+            )
+
+        self.number_type = number_type
+        # The arguments of the templates which do not depend on the issue.
+        self.args = dict(
+            number_type=number_type,
+            number_type_lcase=number_type.lower() if number_type else None,
+            number_str=number_str,
+            number_str_lcase=number_str.lower() if number_str else None,
+            volume_str=volume_str,
+            number_str_number_type=number_str_number_type,
+            number_str_number_type_lcase=number_str_number_type.lower()
+            if number_str_number_type
+            else None,  # noqa
+        )
+        self.templates = {}
+
+    def get_template(self, volume, number, publication_period):
+        """ :returns: the template of the issues with or without these parts. """
+        key = (bool(volume), bool(number), bool(publication_period))
+        try:
+            return self.templates[key]
+        except KeyError:
+            template = self.templates[key] = self._get_template(*key)
+            return template
+
+    def _get_template(self, volume, number, publication_period):
+        number_type = self.number_type
+        if volume and number and number_type:
+            return _(
+                "{volume_str} {volume}, {number_str_lcase} {number}, {number_type_lcase}, {publication_period_lcase}"
+            )  # noqa
+        elif volume and not number and number_type:
+            return _(
+                "{volume_str} {volume}, {number_str_number_type_lcase}, {publication_period_lcase}"
+            )  # noqa
+        elif volume and number:
+            return _(
+                "{volume_str} {volume}, {number_str_lcase} {number}, {publication_period_lcase}"
+            )  # noqa
+        elif volume and not number:
+            return _("{volume_str} {volume}, {publication_period_lcase}")
+        elif not volume and number and number_type:
+            return _(
+                "{number_str} {number}, {number_type_lcase}, {publication_period_lcase}"
+            )
+        elif not volume and number_type and number_type.lower() == "index":
+            return _("Index, {publication_period_lcase}")
+        elif not volume and not number and number_type:
+            return _("{number_str_number_type}, {publication_period_lcase}")
+        elif not volume and number:
+            return _("{number_str} {number}, {publication_period_lcase}")
+        elif not volume and not number and publication_period:
+            return "{publication_period}"
+        else:
+            return ""
+
+
+@functools.lru_cache(maxsize=None)
+def _get_templates(language, number_type, html, abbreviated):
+    """ Translate the templates of a numbering variant once per language. """
+    return VolumeNumberingTemplates(number_type, html=html, abbreviated=abbreviated)
+
+
+def format_volume_numbering(
+    records: typing.Iterable[VolumeNumbering],
+    locale: typing.Optional[str] = None,
+    html: bool = False,
+    abbreviated: bool = False,
+) -> typing.List[str]:
+    """Format the numbering of several issues
+
+    The labels and templates of each variant are translated once per language and reused for
+    all the issues, which makes this function suited to the formatting of whole archives.
+
+    :param records: the numbering of the issues.
+    :param locale: the language to format the numbering in, the active language by default.
+    :param html: return results as HTML.
+    :param abbreviated: abbreviate the labels.
+    :returns: the formatted numbering of each issue.
+    """
+    if locale is not None and override is not None:
+        translation = override(locale)
+    else:
+        translation = contextlib.nullcontext()
+    results = []
+    with translation:
+        language = _get_active_language()
+        for record in records:
+            templates = _get_templates(language, record.number_type, html, abbreviated)
+            number = record.number
+            if number and record.alt_number:
+                number = "{} ({})".format(number, record.alt_number)
+            elif record.alt_number:
+                number = record.alt_number
+            publication_period = record.publication_period
+            template = templates.get_template(record.volume, number, publication_period)
+            results.append(
+                template.format(
+                    volume=record.volume,
+                    number=number,
+                    publication_period=publication_period,
+                    publication_period_lcase=publication_period.lower()
+                    if publication_period
+                    else None,
+                    **templates.args,
+                )
+            )
+    return results
@@ -1,6 +1,10 @@
-import lxml.etree as et
+import typing
+from dataclasses import dataclass
 
+from .. import xpath
 from .dom import DomObject
+from .dom import HtmlRendering
+from .exceptions import LiberuditarticleError
 
 try:
     from django.utils.translation import pgettext
@@ -10,38 +14,107 @@ except ImportError:
     _ = lambda x: x  # noqa
 
 
+# The name parts that are converted to HTML when formatting a person's name.
+NAME_TAGS = ("prenom", "autreprenom", "nomfamille", "suffixe", "nomorg")
+
+# The name parts joined, in this order, by ``PersonName.format()``.
+NAME_PARTS = ("prenom", "autreprenom", "nomfamille")
+
+
+def _format_name_parts(parts, suffixes=None):
+    """ Join the name ``parts`` which are set, followed by the ``suffixes``, if any. """
+    formatted_name = " ".join(v for v in parts if v)
+    if suffixes:
+        return "{formatted_name}, {suffixes}".format(
+            formatted_name=formatted_name, suffixes=", ".join(suffixes)
+        )
+    else:
+        return formatted_name
+
+
 class PersonName(DomObject):
+    def __init__(self, root, html_rendering=None):
+        super().__init__(root)
+        # Share the HTML rendering of the person this name belongs to, if any.
+        self._html_rendering = html_rendering or HtmlRendering(root, NAME_TAGS)
+
+    def get_html(self, tag_name, dom=None):
+        """ :returns: the content of the considered tag converted to html. """
+        return self._html_rendering.to_html(self.find(tag_name, dom=dom))
+
     def format(self, html=False, suffixes=True):
         get = self.get_html if html else self.get_text
-        keys_order = ["prenom", "autreprenom", "nomfamille"]
-        ordered_vals = [get(key) for key in keys_order]
-        formatted_name = " ".join(v for v in ordered_vals if v)
+        ordered_vals = [get(key) for key in NAME_PARTS]
         if not suffixes:
-            return formatted_name
+            return _format_name_parts(ordered_vals)
         suffixes = []
         for suffixe in self.findall("suffixe"):
             if suffixe.text is None:
                 continue
             suffixes.append(
-                self.convert_marquage_content_to_html(suffixe)
-                if html
-                else suffixe.text,
-            )
-        if suffixes:
-            return "{formatted_name}, {suffixes}".format(
-                formatted_name=formatted_name, suffixes=", ".join(suffixes)
+                self._html_rendering.to_html(suffixe) if html else suffixe.text,
             )
-        else:
-            return formatted_name
+        return _format_name_parts(ordered_vals, suffixes)
+
+    def snapshot(self, html=True):
+        """:returns: a :class:`PersonNameRecord` of this name.
+
+        :param html: whether to convert the parts of the name to HTML, without which the record
+            can only format the name as text.
+        """
+        first = {}
+        suffixes = []
+        for node in self._root.iterdescendants(*NAME_TAGS):
+            first.setdefault(node.tag, node)
+            if node.tag == "suffixe" and node.text is not None:
+                suffixes.append(node)
+        nodes = [first.get(tag) for tag in NAME_PARTS]
+        to_html = self._html_rendering.to_html
+        return PersonNameRecord(
+            parts=tuple(self.stringify_children(n, ["renvoi"]) for n in nodes),
+            html_parts=tuple(to_html(n) for n in nodes) if html else None,
+            suffixes=tuple(n.text for n in suffixes),
+            html_suffixes=tuple(to_html(n) for n in suffixes) if html else None,
+        )
+
+
+@dataclass
+class PersonNameRecord:
+    """The parts of a person name, extracted from the tree as text and as HTML
+
+    The record formats the name like :meth:`PersonName.format` and can be pickled. The HTML
+    parts are ``None`` if the record was built without them.
+    """
+
+    __slots__ = ("parts", "html_parts", "suffixes", "html_suffixes")
+
+    parts: typing.Tuple[typing.Optional[str], ...]
+    html_parts: typing.Optional[typing.Tuple[typing.Optional[str], ...]]
+    suffixes: typing.Tuple[str, ...]
+    html_suffixes: typing.Optional[typing.Tuple[str, ...]]
+
+    def format(self, html=False, suffixes=True):
+        if html and self.html_parts is None:
+            raise LiberuditarticleError("The name was extracted without its HTML")
+        if not suffixes:
+            return _format_name_parts(self.html_parts if html else self.parts)
+        if html:
+            return _format_name_parts(self.html_parts, self.html_suffixes)
+        return _format_name_parts(self.parts, self.suffixes)
 
 
 class Person(DomObject):
-    # NOTE: This is one of the slowest parts of liberuditarticle.
-    #
-    # Searching for slow tests and profiling the code led to discover that this
-    # function was a bottleneck. When asking for a "html" person, a XSL transfo
-    # is performed for every tag. An optimization would be to perform *one*
-    # XSL transformation for the whole sub tree.
+    # NOTE: When asking for a "html" person, every name part used to be converted with its own
+    # XSL transformation, which made persons one of the slowest parts of liberuditarticle. The
+    # whole person sub tree is now transformed *once* and every name part is read from it.
+    def __init__(self, root):
+        super().__init__(root)
+        self._html_rendering = HtmlRendering(root, NAME_TAGS)
+
+    def get_html(self, tag_name, dom=None):
+        """ :returns: the content of the considered tag converted to html. """
+        return self._html_rendering.to_html(self.find(tag_name, dom=dom))
+
     @property
     def firstname(self):
         return self.get_text("prenom")
@@ -75,16 +148,15 @@ class Person(DomObject):
 
     @property
     def role(self):
-        find_role = et.XPath("fonction")
-        roles = find_role(self._root)
+        roles = xpath.person_roles(self._root)
         return {role.get("lang"): role.text for role in roles}
 
     @property
     def pseudo(self):
-        pseudo = self.find('nompers[@typenompers="pseudonyme"]')
+        pseudo = self.find(xpath.person_pseudonym)
         all_person_names = self.findall("nompers")
         if pseudo is not None and len(all_person_names) > 1:
-            return PersonName(pseudo)
+            return PersonName(pseudo, html_rendering=self._html_rendering)
         else:
             return None
 
@@ -98,7 +170,12 @@ class Person(DomObject):
             result = get("nomorg")
             member_elems = self.findall("membre")
             if member_elems:
-                members = (PersonName(elem.find("nompers")) for elem in member_elems)
+                members = (
+                    PersonName(
+                        elem.find("nompers"), html_rendering=self._html_rendering
+                    )
+                    for elem in member_elems
+                )
                 formatted_members = ", ".join(
                     m.format(html=html, suffixes=suffixes) for m in members
                 )
@@ -106,7 +183,9 @@ class Person(DomObject):
             return result
         nompers = self.find("nompers")
         if nompers is not None:
-            result = PersonName(nompers).format(html=html, suffixes=suffixes)
+            result = PersonName(nompers, html_rendering=self._html_rendering).format(
+                html=html, suffixes=suffixes
+            )
             pseudo = self.pseudo
             if pseudo:
                 result += ", alias " + pseudo.format(html=html, suffixes=suffixes)
@@ -114,6 +193,142 @@ class Person(DomObject):
         else:
             return ""
 
+    def snapshot(self, html=True):
+        """Extract all the fields of the person in one walk of its subtree
+
+        :param html: whether to convert the names to HTML, without which the record can only
+            format them as text.
+        :returns: a :class:`PersonRecord`, which can be used instead of the person by
+            :meth:`format_name` and the ``format_authors`` functions and can be pickled.
+        """
+        return PersonRecord(**self._get_record_fields(html))
+
+    def _get_record_fields(self, html=True):
+        """ :returns: the fields of the person, for a :class:`PersonRecord`. """
+        first = {}
+        nompers_nodes = []
+        affiliation_nodes = []
+        member_nodes = []
+        roles = {}
+        email = pseudo = None
+        for node in self._root.iterdescendants():
+            tag = node.tag
+            if not isinstance(tag, str):
+                continue
+            # Like find(), each field is read from the first element of its tag.
+            first.setdefault(tag, node)
+            if tag == "nompers":
+                nompers_nodes.append(node)
+                if pseudo is None and node.get("typenompers") == "pseudonyme":
+                    pseudo = node
+            elif tag == "affiliation":
+                affiliation_nodes.append(node)
+            elif tag == "membre":
+                member_nodes.append(node)
+            elif tag == "fonction" and node.getparent() is self._root:
+                roles[node.get("lang")] = node.text
+            elif (
+                tag == "liensimple"
+                and email is None
+                and node.getparent().tag == "courriel"
+            ):
+                email = node
+
+        def get_text(node):
+            return self.stringify_children(node, strip_elements=["renvoi"])
+
+        def get_name(nompers):
+            if nompers is None:
+                return None
+            return PersonName(nompers, html_rendering=self._html_rendering).snapshot(
+                html
+            )
+
+        return dict(
+            firstname=get_text(first.get("prenom")),
+            lastname=get_text(first.get("nomfamille")),
+            othername=get_text(first.get("autreprenom")),
+            suffix=get_text(first.get("suffixe")),
+            email=get_text(email),
+            affiliations=[
+                get_text(affiliation.find(".//alinea"))
+                for affiliation in affiliation_nodes
+            ],
+            organization=get_text(first.get("nomorg")),
+            html_organization=(
+                self._html_rendering.to_html(first.get("nomorg")) if html else None
+            ),
+            is_organization="nomorg" in first,
+            role=roles,
+            pseudo=get_name(pseudo) if len(nompers_nodes) > 1 else None,
+            name=get_name(first.get("nompers")),
+            members=[get_name(member.find("nompers")) for member in member_nodes],
+        )
+
+
+@dataclass
+class PersonRecord:
+    """The fields of a :class:`Person`, as returned by :meth:`Person.snapshot`
+
+    The record does not keep any reference to the tree of the person. It has the same
+    attributes and :meth:`format_name` method as the person it was extracted from. The HTML
+    names are ``None`` if the record was built without them.
+    """
+
+    __slots__ = (
+        "firstname",
+        "lastname",
+        "othername",
+        "suffix",
+        "email",
+        "affiliations",
+        "organization",
+        "html_organization",
+        "is_organization",
+        "role",
+        "pseudo",
+        "name",
+        "members",
+    )
+
+    firstname: typing.Optional[str]
+    lastname: typing.Optional[str]
+    othername: typing.Optional[str]
+    suffix: typing.Optional[str]
+    email: typing.Optional[str]
+    affiliations: typing.List[typing.Optional[str]]
+    organization: typing.Optional[str]
+    html_organization: typing.Optional[str]
+    is_organization: bool
+    role: typing.Dict[typing.Optional[str], typing.Optional[str]]
+    pseudo: typing.Optional[PersonNameRecord]
+    # The first name of the person and the names of the members of an organization.
+    name: typing.Optional[PersonNameRecord]
+    members: typing.List[typing.Optional[PersonNameRecord]]
+
+    def format_name(self, html=False, suffixes=True):
+        if self.is_organization:
+            if (
+                html
+                and self.html_organization is None
+                and self.organization is not None
+            ):
+                raise LiberuditarticleError("The name was extracted without its HTML")
+            result = self.html_organization if html else self.organization
+            if self.members:
+                formatted_members = ", ".join(
+                    m.format(html=html, suffixes=suffixes) for m in self.members
+                )
+                result = "{} ({})".format(result, formatted_members)
+            return result
+        if self.name is not None:
+            result = self.name.format(html=html, suffixes=suffixes)
+            if self.pseudo:
+                result += ", alias " + self.pseudo.format(html=html, suffixes=suffixes)
+            return result
+        else:
+            return ""
+
 
 class Redacteur(Person):
     @property
@@ -128,6 +343,22 @@ class Redacteur(Person):
         else:
             return []
 
+    def snapshot(self, html=True):
+        """ :returns: a :class:`RedacteurRecord` of the fields of the redacteur. """
+        return RedacteurRecord(
+            **self._get_record_fields(html), typerc=self.typerc, themes=self.themes
+        )
+
+
+@dataclass
+class RedacteurRecord(PersonRecord):
+    """ The fields of a :class:`Redacteur`, as returned by :meth:`Redacteur.snapshot` """
+
+    __slots__ = ("typerc", "themes")
+
+    typerc: typing.Optional[str]
+    themes: typing.List[str]
+
 
 def format_authors(authors, html=False, suffixes=True):
     authors = [author.format_name(html=html, suffixes=suffixes) for author in authors]
@@ -1,27 +1,111 @@
 try:
     from django.utils.translation import pgettext
-    from django.utils.translation import gettext as _
+    from django.utils.translation import override
 except ImportError:
     pgettext = lambda ctx, msg: msg  # noqa
-    _ = lambda x: x  # noqa
+    override = None
 
+import io
 import typing
 import collections
+import collections.abc
+import contextlib
 import itertools
+import lxml.etree as et
 import roman
+import sys
 import functools
+import types
+from bisect import bisect_right
+from copy import copy, deepcopy
 from datetime import datetime
+import dataclasses
 from dataclasses import dataclass
 from urllib.parse import urlparse
 
+from .. import xpath
+from ..utils import has_xml_namespaces, remove_xml_namespaces
 from .base import EruditBaseObject
+from .base import cached_accessor
+from .base import _get_active_language
 from .mixins import CopyrightMixin
 from .mixins import ISBNMixin
 from .mixins import ISSNMixin
 from .mixins import PublicationPeriodMixin
+from .numbering import VolumeNumberingMixin
 from .person import Redacteur, Person, format_authors
 from .exceptions import InvalidTypercError, LiberuditarticleError
 
+# Marks the fields of a SummaryArticle that are computed on first access.
+LAZY = object()
+
+# The children of revue and grtheme elements which are converted to HTML by several accessors.
+JOURNAL_TITLE_TAGS = {"titrerev", "sstitrerev", "titrerevparal", "sstitrerevparal"}
+THEME_TAGS = {"theme", "sstheme", "themeparal", "ssthemeparal"}
+
+
+class SummaryArticleRecord:
+    """The ``article`` element of a summary, from which the fields of its
+    :class:`SummaryArticle` that are expensive to format, and its section titles, are computed
+    on first access.
+
+    The computed fields are kept by the record, which is shared by the copies of the article,
+    and the element is then released. Pickling a record computes its fields, so that the
+    summaries stored in a disk cache are never formatted again.
+    """
+
+    __slots__ = ("publication", "article", "languages", "language", "fields")
+
+    def __init__(self, publication, article, languages, language=None):
+        self.publication = publication
+        self.article = article
+        self.languages = languages
+        # The fields are formatted in the language that was active when the summary was built.
+        self.language = language
+        self.fields = None
+
+    def get(self, name):
+        if self.fields is None:
+            if self.language is not None and override is not None:
+                translation = override(self.language)
+            else:
+                translation = contextlib.nullcontext()
+            with translation:
+                self.fields = self.publication._get_summary_fields(
+                    self.article, list(self.languages)
+                )
+            self.publication = self.article = None
+        return self.fields[name]
+
+    def __getstate__(self):
+        self.get("title")
+        return self.languages, self.language, self.fields
+
+    def __setstate__(self, state):
+        self.languages, self.language, self.fields = state
+        self.publication = self.article = None
+
+
+class LazySummaryField:
+    """ A field of a SummaryArticle that can be computed from its record on first access """
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            # The default value of the field.
+            return None
+        try:
+            return instance.__dict__[self.name]
+        except KeyError:
+            value = instance.__dict__[self.name] = instance._record.get(self.name)
+            return value
+
+    def __set__(self, instance, value):
+        if value is not LAZY:
+            instance.__dict__[self.name] = value
+
 
 @dataclass
 class SummaryArticle:
@@ -30,12 +114,12 @@ class SummaryArticle:
     urlhtml: typing.Optional[str] = None
     first_page: typing.Optional[str] = None
     last_page: typing.Optional[str] = None
-    section_title: typing.Optional[str] = None
-    title: typing.Optional[str] = None
-    html_title: typing.Optional[str] = None
+    section_title: typing.Optional[str] = LazySummaryField()
+    title: typing.Optional[str] = LazySummaryField()
+    html_title: typing.Optional[str] = LazySummaryField()
     ordseq: typing.Optional[str] = None
     doi: typing.Optional[str] = None
-    authors: typing.Optional[str] = None
+    authors: typing.Optional[str] = LazySummaryField()
     accessible: typing.Optional[str] = True
 
     def has_external_url(self) -> bool:
@@ -45,19 +129,277 @@ class SummaryArticle:
         return bool(external_pdf or external_html)
 
 
+@dataclass
+class SummarySection:
+    """A run of consecutive articles of a summary that share the same section titles
+
+    ``titles`` holds the section titles of levels 1, 2 and 3, in this order, in the format of
+    :meth:`EruditArticle.get_section_titles`. A level without a title is ``None``.
+    """
+
+    titles: typing.List[typing.Optional[dict]]
+    summary_articles: typing.List[SummaryArticle]
+
+
+class SummaryArticleColumns(collections.abc.Sequence):
+    """A compact, read-only copy of a list of :class:`SummaryArticle`
+
+    The fields of the articles are stored in parallel tuples, one per field, instead of one
+    instance per article. The values that repeat across articles and issues (pages, ordseq,
+    section titles and the directories of the urls) are interned and the HTML titles without
+    markup share the string of the plain titles. The articles are rebuilt as
+    :class:`SummaryArticle` instances when they are accessed.
+    """
+
+    __slots__ = ("_columns", "_length")
+
+    # The fields whose values are interned.
+    INTERNED_FIELDS = ("first_page", "last_page", "ordseq", "section_title")
+    # The fields whose values are split into an interned directory and a file name.
+    URL_FIELDS = ("urlpdf", "urlhtml")
+
+    def __init__(self, summary_articles: typing.Iterable[SummaryArticle]):
+        summary_articles = list(summary_articles)
+        self._length = len(summary_articles)
+        self._columns = {}
+        for field in dataclasses.fields(SummaryArticle):
+            values = [getattr(a, field.name) for a in summary_articles]
+            if field.name in self.URL_FIELDS:
+                self._columns[field.name] = (
+                    tuple(self._intern(self._get_directory(v)) for v in values),
+                    tuple(self._get_filename(v) for v in values),
+                )
+            elif field.name in self.INTERNED_FIELDS:
+                self._columns[field.name] = tuple(self._intern(v) for v in values)
+            elif field.name == "html_title":
+                # Most titles have no markup, share them with the plain titles.
+                self._columns[field.name] = tuple(
+                    title if title == html_title else html_title
+                    for title, html_title in zip(self._columns["title"], values)
+                )
+            else:
+                self._columns[field.name] = tuple(values)
+
+    @staticmethod
+    def _intern(value):
+        return sys.intern(value) if isinstance(value, str) else value
+
+    @staticmethod
+    def _get_directory(url):
+        if url is None:
+            return None
+        directory, separator, _ = url.rpartition("/")
+        return directory + separator
+
+    @staticmethod
+    def _get_filename(url):
+        return url.rpartition("/")[2] if url is not None else None
+
+    def _get_article(self, index):
+        fields = {}
+        for name, column in self._columns.items():
+            if name in self.URL_FIELDS:
+                directory, filename = column[0][index], column[1][index]
+                fields[name] = None if filename is None else directory + filename
+            else:
+                fields[name] = column[index]
+        return SummaryArticle(**fields)
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._get_article(i) for i in range(self._length)[index]]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("summary article index out of range")
+        return self._get_article(index)
+
+
+class SummaryIndex:
+    """The articles of a summary, indexed by localidentifier and ordered by ordseq"""
+
+    def __init__(self, summary_articles: typing.List[SummaryArticle]):
+        self.summary_articles = summary_articles
+        self._by_localidentifier = {}
+        for summary_article in summary_articles:
+            self._by_localidentifier.setdefault(
+                summary_article.localidentifier, summary_article
+            )
+        # Articles without a numeric ordseq come last, sorting is stable.
+        self._ordered = sorted(summary_articles, key=self._get_ordseq)
+        self._positions = {}
+        for position, summary_article in enumerate(self._ordered):
+            self._positions.setdefault(summary_article.localidentifier, position)
+
+    @staticmethod
+    def _get_ordseq(summary_article):
+        try:
+            return int(summary_article.ordseq)
+        except (TypeError, ValueError):
+            return float("inf")
+
+    def get(self, localidentifier: str) -> SummaryArticle:
+        try:
+            return self._by_localidentifier[localidentifier]
+        except KeyError:
+            raise LiberuditarticleError(
+                f"No article with localidentifier {localidentifier}"
+            )
+
+    def get_neighbour(
+        self, localidentifier: str, offset: int
+    ) -> typing.Optional[SummaryArticle]:
+        """ Return the article ``offset`` positions away in ordseq order, if any """
+        self.get(localidentifier)
+        position = self._positions[localidentifier] + offset
+        if 0 <= position < len(self._ordered):
+            return self._ordered[position]
+        return None
+
+
+class PageRangeIndex:
+    """The page ranges of the articles of a summary, sorted by first page
+
+    Arabic and roman page numbers are kept apart. The range of an article whose first and last
+    pages are not in the same numbering only covers its first page.
+
+    :param articles_pages: the first pages and the last pages of each article, as two lists of
+        strings.
+    """
+
+    def __init__(
+        self,
+        articles_pages: typing.Iterable[
+            typing.Tuple[typing.List[str], typing.List[str]]
+        ],
+    ):
+        first_pages = {"arabic": [], "roman": []}
+        last_pages = {"arabic": [], "roman": []}
+        ranges = {"arabic": [], "roman": []}
+        for position, (ppages, dpages) in enumerate(articles_pages):
+            ppages = [page for page in map(self.parse_page, ppages) if page]
+            dpages = [page for page in map(self.parse_page, dpages) if page]
+            for numbering, number in ppages:
+                first_pages[numbering].append(number)
+            for numbering, number in dpages:
+                last_pages[numbering].append(number)
+            if not ppages:
+                continue
+            numbering, start = ppages[0]
+            end = start
+            if dpages and dpages[0][0] == numbering:
+                end = max(start, dpages[0][1])
+            # Among the articles starting on the same page, the first one is found first.
+            ranges[numbering].append((start, -position, end))
+
+        # The first page is preferably roman, the last page preferably arabic.
+        if first_pages["roman"]:
+            self.first_page = roman.toRoman(min(first_pages["roman"]))
+        elif first_pages["arabic"]:
+            self.first_page = str(min(first_pages["arabic"]))
+        else:
+            self.first_page = None
+        if last_pages["arabic"]:
+            self.last_page = str(max(last_pages["arabic"]))
+        elif last_pages["roman"]:
+            self.last_page = roman.toRoman(max(last_pages["roman"]))
+        else:
+            self.last_page = None
+
+        self._ranges = {}
+        for numbering, numbering_ranges in ranges.items():
+            numbering_ranges.sort()
+            ends = [end for _, _, end in numbering_ranges]
+            self._ranges[numbering] = (
+                [start for start, _, _ in numbering_ranges],
+                ends,
+                # The greatest last page of the ranges up to each one, to stop the lookups.
+                list(itertools.accumulate(ends, max)),
+                [-position for _, position, _ in numbering_ranges],
+            )
+
+    @staticmethod
+    def parse_page(page):
+        """:returns: a ``(numbering, number)`` pair, or ``None`` if ``page`` is not an arabic
+        or a roman number."""
+        if page is None:
+            return None
+        try:
+            return "arabic", int(page)
+        except ValueError:
+            try:
+                return "roman", roman.fromRoman(page)
+            except roman.InvalidRomanNumeralError:
+                return None
+
+    def find(self, page) -> typing.Optional[int]:
+        """Return the position of the article whose range contains ``page``, if any
+
+        If several ranges contain the page, the one that starts last is chosen.
+        """
+        parsed_page = self.parse_page(page)
+        if parsed_page is None:
+            return None
+        numbering, number = parsed_page
+        starts, ends, max_ends, positions = self._ranges[numbering]
+        index = bisect_right(starts, number) - 1
+        while index >= 0 and max_ends[index] >= number:
+            if ends[index] >= number:
+                return positions[index]
+            index -= 1
+        return None
+
+
+class ThemeIndex:
+    """The redacteurs of the themes of a publication, indexed by theme id
+
+    :param redacteurs: the redacteurs of the publication, in the order of the document.
+    :param lang: the language of the themes.
+    """
+
+    def __init__(self, redacteurs: typing.Iterable[Redacteur], lang: str):
+        self.lang = lang
+        self._redacteurs = {}
+        for redacteur in redacteurs:
+            # A redacteur is listed once per theme, even if it refers to it several times.
+            for theme_id in dict.fromkeys(redacteur.themes):
+                self._redacteurs.setdefault(theme_id, []).append(redacteur)
+
+    def get_redacteurs(self, theme_id: str) -> typing.List[Redacteur]:
+        """ :returns: the redacteurs of a theme, in the order of the document. """
+        return list(self._redacteurs.get(theme_id, ()))
+
+
+@dataclass
+class PublicationBundle:
+    """The data of the page of an issue, see :meth:`EruditPublication.render_bundle`"""
+
+    journal_title: str
+    volume_numbering: str
+    themes: typing.List[dict]
+    redacteurchef: typing.List[Redacteur]
+    notegens_edito: typing.List[dict]
+    copyrights: str
+    droitsauteur: typing.List[dict]
+    summary_articles: typing.List[SummaryArticle]
+
+
 class EruditPublication(
-    PublicationPeriodMixin, ISBNMixin, ISSNMixin, CopyrightMixin, EruditBaseObject
+    PublicationPeriodMixin,
+    VolumeNumberingMixin,
+    ISBNMixin,
+    ISSNMixin,
+    CopyrightMixin,
+    EruditBaseObject,
 ):
     """
     Expects the ``SUMMARY`` datastream of a Fedora ``Publication`` object
     """
 
-    def __init__(self, xml):
-        super().__init__(xml)
-        self.get_summary_articles = functools.lru_cache(maxsize=1)(
-            self.get_summary_articles
-        )
-
+    @cached_accessor
     def get_titles(self, html=True):
         """
         .. warning::
@@ -76,6 +418,7 @@ class EruditPublication(
             html=html,
         )
 
+    @cached_accessor
     def get_languages(self):
         """ :returns: a list of the journal's principal languages, defaults to ['fr']. """
         languages = self.find("revue").get("lang")
@@ -85,6 +428,7 @@ class EruditPublication(
         """ :returns: the number of articles of the publication object. """
         return int(self.get_text("nbarticle"))
 
+    @cached_accessor
     def get_directors(self):
         """ :returns: the authors of the publication object. """
         return self.get_persons("directeur")
@@ -93,14 +437,21 @@ class EruditPublication(
         """ :returns: the publisher of the issue object. """
         return [publisher.text for publisher in self.findall("editeur//nomorg")]
 
+    @cached_accessor
     def get_editors(self):
         """ :returns: the the editors of the publication object. """
-        return self.get_persons('redacteurchef[@typerc="regulier"]')
+        return [
+            Person(tag) for tag in self.findall(xpath.redacteurchef, typerc="regulier")
+        ]
 
+    @cached_accessor
     def get_guest_editors(self):
         """ :returns: the guest editors associated with the publication object. """
-        return self.get_persons('redacteurchef[@typerc="invite"]')
+        return [
+            Person(tag) for tag in self.findall(xpath.redacteurchef, typerc="invite")
+        ]
 
+    @cached_accessor
     def get_notegens_edito(self, formatted=False, html=False):
         """Return the editorial note for this publication
 
@@ -111,7 +462,7 @@ class EruditPublication(
         :returns: a list of notegens
         """
         notes = []
-        for note_elem in self.findall('numero/notegen[@typenoteg="edito"]'):
+        for note_elem in self.findall(xpath.numero_notegen_edito):
 
             # If a scope is defined, make sure it's 'numero'.
             scope = note_elem.get("porteenoteg")
@@ -167,49 +518,84 @@ class EruditPublication(
 
     def _find_redacteurchef(self, theme_id, html=False):
         """ Find the redacteurchef for the given theme """
-        rc = []
-        for redacteurchef in self.get_redacteurchef(html=html):
+        return self._get_theme_index().get_redacteurs(theme_id)
 
-            themes = redacteurchef.themes
-            if themes and theme_id in themes:
-                rc.append(redacteurchef)
-        return rc
+    @cached_accessor
+    def _get_theme_index(self) -> ThemeIndex:
+        """Index the redacteurs of the publication by theme
+
+        The index is not copied by :func:`cached_accessor`, so that looking up the redacteurs
+        of each theme does not copy the whole index.
+        """
+        theme = self.find("theme")
+        return ThemeIndex(
+            (Redacteur(tag) for tag in self.findall(xpath.redacteurchef, typerc="")),
+            # Like before, all the themes get the language of the first one.
+            (theme.get("lang") if theme is not None else None) or "fr",
+        )
 
     def _find_themeparal(self, theme_tag, html=False):
-        """ Find the parallel names of the theme """
-        method = self.get_html if html else self.get_text
+        """Find the parallel names of the theme
+
+        The parallel names and subnames are collected in one pass over the theme and each of
+        them is converted to HTML once.
+        """
+        theme_parals = []
+        # The first parallel name and subname of each language.
+        names = {}
+        subnames = {}
+        for element in theme_tag.iter("themeparal", "ssthemeparal"):
+            if element.tag == "themeparal" and element.getparent() is theme_tag:
+                theme_parals.append(element)
+            lang = element.get("lang")
+            if lang is not None:
+                lang_elements = names if element.tag == "themeparal" else subnames
+                lang_elements.setdefault(lang, element)
+
+        parals = []
+        for theme_paral in theme_parals:
+            lang = theme_paral.get("lang") or ""
+            parals.append((theme_paral, names.get(lang), subnames.get(lang)))
+        html_nodes = self.batch_convert_marquage_content_to_html(
+            list(itertools.chain.from_iterable(parals))
+        )
+
+        stringify = functools.partial(
+            self.stringify_children, strip_elements=["renvoi"]
+        )
         pn = collections.OrderedDict()
-        for theme_paral in theme_tag.findall("themeparal"):
+        for index, (theme_paral, name, subname) in enumerate(parals):
+            html_theme_paral, html_name, html_subname = html_nodes[
+                3 * index : 3 * index + 3
+            ]
             lang = theme_paral.get("lang")
             pn[lang] = {
-                "name": method("themeparal[@lang='{}']".format(lang), dom=theme_tag),
+                "name": html_name if html else stringify(name),
                 "lang": lang,
-                "subname": method(
-                    "ssthemeparal[@lang='{}']".format(lang), dom=theme_tag
-                ),
-                "html_name": self.convert_marquage_content_to_html(
-                    theme_paral,
-                ),
-                "html_subname": self.convert_marquage_content_to_html(
-                    self.find("ssthemeparal[@lang='{}']".format(lang), dom=theme_tag),
-                ),
+                "subname": html_subname if html else stringify(subname),
+                "html_name": html_theme_paral,
+                "html_subname": html_subname,
             }
         return pn
 
     # TODO fixup the get_theme, get_themes, get_html_themes, get_theme_guest_editors mess
     def parse_theme(self, theme_tag, html=False):
         """ Parse a theme tag """
-        method = self.get_html if html else self.get_text
+        name_tag = self.find("theme", dom=theme_tag)
+        subname_tag = self.find("sstheme", dom=theme_tag)
+        html_name = self.convert_marquage_content_to_html(name_tag)
+        html_subname = self.convert_marquage_content_to_html(subname_tag)
+        if html:
+            name, subname = html_name, html_subname
+        else:
+            name = self.stringify_children(name_tag, strip_elements=["renvoi"])
+            subname = self.stringify_children(subname_tag, strip_elements=["renvoi"])
         theme = {
-            "name": method("theme", dom=theme_tag),
-            "lang": self.find("theme").get("lang") or "fr",
-            "subname": method("sstheme", dom=theme_tag),
-            "html_name": self.convert_marquage_content_to_html(
-                self.find("theme", dom=theme_tag),
-            ),
-            "html_subname": self.convert_marquage_content_to_html(
-                self.find("sstheme", dom=theme_tag),
-            ),
+            "name": name,
+            "lang": self._get_theme_index().lang,
+            "subname": subname,
+            "html_name": html_name,
+            "html_subname": html_subname,
         }
         theme_id = theme_tag.get("id")
         # theme redacteurs en chef
@@ -218,6 +604,7 @@ class EruditPublication(
 
         return theme_id, theme
 
+    @cached_accessor
     def get_themes(self, html=False, formatted=False):
         """ :returns: the themes of this publication """
         themes = collections.OrderedDict()
@@ -266,6 +653,7 @@ class EruditPublication(
             theme_names.append("{}\xa0: {}".format(name, subname) if subname else name)
         return theme_names
 
+    @cached_accessor
     def get_redacteurchef(self, typerc=None, idrefs=None, formatted=False, html=False):
         """
         Return the list of redacteurchef of this Publication. If called with the default arguments,
@@ -290,28 +678,23 @@ class EruditPublication(
         :raises InvalidTypercError: if typerc is not one of "regulier" or "invite"
         :returns: a list of redacteurchef objects of this publication"""
 
-        tag = "redacteurchef"
-
         if typerc is not None and typerc not in ["regulier", "invite"]:
             raise InvalidTypercError("Must be 'regulier' or 'invite'")
 
-        attribute_search = []
         if idrefs is not None and len(idrefs) == 0:
-            attribute_search.append("not(@idrefs)")
-        elif idrefs is not None:
-            idrefs_search = []
-            for idref in idrefs:
-                idrefs_search.append('contains(@idrefs, "{}")'.format(idref))
-            idrefs_query = "({})".format(" or ".join(idrefs_search))
-            attribute_search.append(idrefs_query)
-        if typerc:
-            attribute_search.append("@typerc='{}'".format(typerc))
-
-        if attribute_search:
-            tag = "redacteurchef[{}]".format(" and ".join(attribute_search))
+            redacteurchef_tags = self.findall(
+                xpath.redacteurchef_without_theme, typerc=typerc or ""
+            )
+        else:
+            redacteurchef_tags = self.findall(xpath.redacteurchef, typerc=typerc or "")
+        if idrefs:
+            redacteurchef_tags = [
+                tag
+                for tag in redacteurchef_tags
+                if any(idref in tag.get("idrefs", "") for idref in idrefs)
+            ]
 
         redacteurchefs = []
-        redacteurchef_tags = self._root.xpath("//{}".format(tag))
         for redacteurchef_tag in redacteurchef_tags:
             redacteurchef = Redacteur(redacteurchef_tag)
             if formatted:
@@ -330,6 +713,7 @@ class EruditPublication(
         :returns: the theme of the publication object with HTML tags."""
         return self.convert_marquage_content_to_html(self.find("theme"))
 
+    @cached_accessor
     def get_journal_title(self, formatted=False, html=False, subtitles=True):
         """Return the title of the journal
 
@@ -355,49 +739,26 @@ class EruditPublication(
 
     def get_first_page(self):
         """ :returns: the first page of the publication object. """
-        roman_pages = []
-        arabic_pages = []
-        for ppage in self.findall("article//pagination//ppage"):
-            if ppage.text is None:
-                continue
-            try:
-                arabic_pages.append(int(ppage.text))
-            except ValueError:
-                try:
-                    roman_pages.append(roman.fromRoman(ppage.text))
-                except roman.InvalidRomanNumeralError:
-                    pass
-        if len(roman_pages):
-            return roman.toRoman(min(roman_pages))
-        elif len(arabic_pages):
-            return str(min(arabic_pages))
-        else:
-            return None
+        return self._get_page_index().first_page
 
     def get_last_page(self):
         """ :returns: the last page of the publication object. """
-        roman_pages = []
-        arabic_pages = []
-        for dpage in self.findall("article//pagination//dpage"):
-            if dpage.text is None:
-                continue
-            try:
-                arabic_pages.append(int(dpage.text))
-            except ValueError:
-                try:
-                    roman_pages.append(roman.fromRoman(dpage.text))
-                except roman.InvalidRomanNumeralError:
-                    pass
-        if len(arabic_pages):
-            return str(max(arabic_pages))
-        elif len(roman_pages):
-            return roman.toRoman(max(roman_pages))
-        else:
-            return None
+        return self._get_page_index().last_page
+
+    @cached_accessor
+    def _get_page_index(self) -> PageRangeIndex:
+        """ Return the page ranges of the articles in the summary """
+        return PageRangeIndex(
+            (
+                [ppage.text for ppage in article.findall(".//pagination//ppage")],
+                [dpage.text for dpage in article.findall(".//pagination//dpage")],
+            )
+            for article in self.findall("article")
+        )
 
     def get_note_edito(self):
         """ :returns: the edito note associated with the publication object if any. """
-        note = self.stringify_children(self.find('notegen[@typenoteg="edito"]'))
+        note = self.stringify_children(self.find(xpath.notegen_edito))
         return note if note is not None else note
 
     def get_production_date(self):
@@ -422,6 +783,7 @@ class EruditPublication(
         """ :returns: the publication year of the publication object. """
         return self.get_text("numero//pub//annee")
 
+    @cached_accessor
     def get_section_titles(self):
         """ :returns: an ordered list of section titles of the publication object. """
         section_titles = []
@@ -435,34 +797,17 @@ class EruditPublication(
 
     def get_volume(self):
         """ :returns: the volume of the publication object. """
-        return "-".join(
-            [
-                v.text
-                for v in self.findall("numero/volume")
-                if v is not None and v.text is not None
-            ]
-        )
+        return self._get_numbering_part("volume")
 
     def get_number(self):
         """ :returns: the number of the publication object. """
-        return "-".join(
-            [
-                n.text
-                for n in self.findall("numero/nonumero")
-                if n is not None and n.text is not None
-            ]
-        )
+        return self._get_numbering_part("nonumero")
 
     def get_alt_number(self):
         """ :returns: the alternative number of the publication object. """
-        return "-".join(
-            [
-                a.text
-                for a in self.findall("numero/anonumero")
-                if a is not None and a.text is not None
-            ]
-        )
+        return self._get_numbering_part("anonumero")
 
+    @cached_accessor
     def get_volume_numbering(self, html=False, abbreviated=False, formatted=False):
         """Return the volume title of this publication
 
@@ -478,98 +823,44 @@ class EruditPublication(
 
         :returns: the volume title of this publication
         """
-
-        volume = self.get_volume()
-        number = self.get_number()
-        alt_number = self.get_alt_number()
-        number_type = self.get_publication_type()
-        publication_period = self.get_publication_period()
-
+        volume_numbering = self.get_volume_numbering_record()
         if not formatted:
-            return {
-                "volume": volume,
-                "number": number,
-                "alt_number": alt_number,
-                "number_type": number_type,
-                "publication_period": publication_period,
-            }
+            return volume_numbering.as_dict()
+        return volume_numbering.format(html=html, abbreviated=abbreviated)
 
-        if abbreviated and html:
-            volume_str = pgettext("numbering", "Vol.")
-            number_str = pgettext("numbering", "N<sup>o</sup>")
-            untranslated_number_str = "N<sup>o</sup>"
-        elif abbreviated:
-            volume_str = pgettext("numbering", "Vol.")
-            number_str = pgettext("numbering", "N°")
-            untranslated_number_str = "N°"
-        else:
-            volume_str = pgettext("numbering", "Volume")
-            number_str = pgettext("numbering", "Numéro")
-            untranslated_number_str = "Numéro"
-
-        if number_type == "hs":
-            number_type = self.get_publication_type(formatted=True)
-            number_str_number_type = pgettext(
-                "numbering", "{} hors-série".format(untranslated_number_str)
-            )
-        else:
-            number_type = self.get_publication_type(formatted=True)
-            number_str_number_type = pgettext(
-                "numbering", "{} {}".format(untranslated_number_str, number_type)
-            )
+    def render_bundle(self, language: str, html: bool = True) -> PublicationBundle:
+        """Return the data of the page of this issue
 
-        if number and alt_number:
-            number = "{} ({})".format(number, alt_number)
-        elif alt_number:
-            number = alt_number
-
-        args = dict(
-            volume=volume,
-            number=number,
-            number_type=number_type,
-            number_type_lcase=number_type.lower() if number_type else None,
-            publication_period=publication_period,
-            publication_period_lcase=publication_period.lower()
-            if publication_period
-            else None,
-            number_str=number_str,
-            number_str_lcase=number_str.lower() if number_str else None,
-            volume_str=volume_str,
-            number_str_number_type=number_str_number_type,
-            number_str_number_type_lcase=number_str_number_type.lower()
-            if number_str_number_type
-            else None,  # noqa
-        )
+        The accessors used by the page are called in ``language`` and share their conversions
+        to HTML: the titles and themes are converted at once, then each node is converted at
+        most once, whichever accessor needs it.
 
-        if volume and number and number_type:
-            string = _(
-                "{volume_str} {volume}, {number_str_lcase} {number}, {number_type_lcase}, {publication_period_lcase}"
-            )  # noqa
-        elif volume and not number and number_type:
-            string = _(
-                "{volume_str} {volume}, {number_str_number_type_lcase}, {publication_period_lcase}"
-            )  # noqa
-        elif volume and number:
-            string = _(
-                "{volume_str} {volume}, {number_str_lcase} {number}, {publication_period_lcase}"
-            )  # noqa
-        elif volume and not number:
-            string = _("{volume_str} {volume}, {publication_period_lcase}")
-        elif not volume and number and number_type:
-            string = _(
-                "{number_str} {number}, {number_type_lcase}, {publication_period_lcase}"
-            )
-        elif not volume and number_type and number_type.lower() == "index":
-            string = _("Index, {publication_period_lcase}")
-        elif not volume and not number and number_type:
-            string = _("{number_str_number_type}, {publication_period_lcase}")
-        elif not volume and number:
-            string = _("{number_str} {number}, {publication_period_lcase}")
-        elif not volume and not number and publication_period:
-            string = "{publication_period}"
+        :param language: the language of the page.
+        :param html: convert XML markup to HTML.
+        :returns: the formatted journal title, volume numbering, themes, copyrights and
+            editorial notes, the redacteurs, the droitsauteur and the summary articles.
+        """
+        if override is not None:
+            translation = override(language)
         else:
-            string = ""
-        return string.format(**args)
+            translation = contextlib.nullcontext()
+        nodes = []
+        revue = self.find("infosommaire/revue")
+        if revue is not None:
+            nodes.extend(child for child in revue if child.tag in JOURNAL_TITLE_TAGS)
+        for grtheme in self.findall("grtheme"):
+            nodes.extend(child for child in grtheme if child.tag in THEME_TAGS)
+        with translation, self.sharing_conversions(nodes):
+            return PublicationBundle(
+                journal_title=self.get_journal_title(formatted=True, html=html),
+                volume_numbering=self.get_volume_numbering(formatted=True, html=html),
+                themes=self.get_themes(formatted=True, html=html),
+                redacteurchef=self.get_redacteurchef(),
+                notegens_edito=self.get_notegens_edito(html=html),
+                copyrights=self.get_copyrights(language, formatted=True, html=html),
+                droitsauteur=self.get_droitsauteur(),
+                summary_articles=self.get_summary_articles(),
+            )
 
     article_count = property(get_article_count)
     directors = property(get_directors)
@@ -592,56 +883,257 @@ class EruditPublication(
     publishers = property(get_publishers)
     languages = property(get_languages)
 
-    def get_summary_articles(self) -> typing.List[SummaryArticle]:
-        """ Return the list of the articles in the summary """
-        articles = []
-        articles_elem = self.findall("article")
-
-        for article in articles_elem:
-            titles = self._get_titles(
-                root_elem=article,
-                title_elem_name="titre",
-                subtitle_elem_name="sstitre",
-                paral_title_elem_name="titreparal",
-                paral_subtitle_elem_name="sstitreparal",
-                languages=self.get_languages(),
-                html=True,
+    def _get_summary_titles(self, article, languages, html=True):
+        """ Return the titles and the reviewed works of an ``article`` element of the summary """
+        titles = self._get_titles(
+            root_elem=article,
+            title_elem_name="titre",
+            subtitle_elem_name="sstitre",
+            paral_title_elem_name="titreparal",
+            paral_subtitle_elem_name="sstitreparal",
+            languages=languages,
+            html=html,
+        )
+        titles["reviewed_works"] = self._get_reviewed_or_referenced_works(
+            root_elem=article, ref_elem_name="trefbiblio", html=html
+        )
+        return titles
+
+    def _get_summary_fields(self, article, languages):
+        """Format the titles, the authors and the section titles of an ``article`` element of
+        the summary"""
+        titles = self._get_summary_titles(article, languages)
+        authors = [Person(author) for author in article.findall(".//auteur")]
+        return {
+            "title": self._get_formatted_title(titles, html=False),
+            "html_title": self._get_formatted_title(titles, html=True),
+            "authors": format_authors(authors) if authors else None,
+            "section_title": self.stringify_children(
+                article.find("liminaire/grtitre/surtitre")
+            ),
+            "section_titles": self._get_summary_section_titles(article),
+        }
+
+    def _get_summary_section_titles(self, article):
+        """ Return the section titles of levels 1 to 3 of an ``article`` element """
+        grtitre = article.find("liminaire/grtitre")
+        if grtitre is None:
+            return [None, None, None]
+        # The first title and the parallel titles of each level, in one pass over grtitre.
+        main_titles = {}
+        paral_titles = collections.defaultdict(collections.OrderedDict)
+        for child in grtitre:
+            tag = child.tag
+            if not isinstance(tag, str) or not tag.startswith("surtitre"):
+                continue
+            if tag.startswith("surtitreparal"):
+                paral_titles[tag[len("surtitreparal") :]][child.get("lang")] = child
+            else:
+                main_titles.setdefault(tag[len("surtitre") :], child)
+        section_titles = []
+        for level in ("", "2", "3"):
+            section_title = self.convert_marquage_content_to_html(
+                main_titles.get(level)
             )
-            titles["reviewed_works"] = self._get_reviewed_or_referenced_works(
-                root_elem=article, ref_elem_name="trefbiblio", html=True
+            if not section_title:
+                section_titles.append(None)
+                continue
+            paral = collections.OrderedDict(
+                (lang, self.convert_marquage_content_to_html(title))
+                for lang, title in paral_titles[level].items()
             )
+            section_titles.append({"main": section_title, "paral": paral})
+        return section_titles
 
-            title = self._get_formatted_title(titles, html=False)
-            html_title = self._get_formatted_title(titles, html=True)
-            authors = [Person(author) for author in article.findall(".//auteur")]
-
-            summary_article = SummaryArticle(
-                localidentifier=article.get("idproprio"),
-                urlpdf=article.findtext(".//urlpdf"),
-                urlhtml=article.findtext(".//urlhtml"),
-                first_page=article.findtext(".//ppage"),
-                last_page=article.findtext(".//dpage"),
-                title=title,
-                html_title=html_title,
-                ordseq=article.get("ordseq"),
-                doi=article.get("doi"),
-            )
-            if authors:
-                summary_article.authors = format_authors(authors)
+    def _get_summary_article(self, article, languages, language=None) -> SummaryArticle:
+        """Build the summary of an ``article`` element
 
-            if article.findtext(".//accessible") == "non":
-                summary_article.accessible = False
+        Its titles, authors and section titles are only formatted when they are first accessed,
+        in ``language``, the active language when the summary was built.
+        """
+        summary_article = SummaryArticle(
+            localidentifier=article.get("idproprio"),
+            urlpdf=article.findtext(".//urlpdf"),
+            urlhtml=article.findtext(".//urlhtml"),
+            first_page=article.findtext(".//ppage"),
+            last_page=article.findtext(".//dpage"),
+            section_title=LAZY,
+            title=LAZY,
+            html_title=LAZY,
+            ordseq=article.get("ordseq"),
+            doi=article.get("doi"),
+            authors=LAZY,
+        )
+        summary_article._record = SummaryArticleRecord(
+            self, article, tuple(languages), language
+        )
 
-            articles.append(summary_article)
-        return articles
+        if article.findtext(".//accessible") == "non":
+            summary_article.accessible = False
+        return summary_article
 
-    def get_summary_article(self, localidentifier: str) -> SummaryArticle:
-        summary_articles = self.get_summary_articles()
-        try:
-            return next(
-                a for a in summary_articles if a.localidentifier == localidentifier
+    @cached_accessor
+    def _get_summary_index(self) -> SummaryIndex:
+        """Return the articles in the summary, indexed by localidentifier
+
+        The index is not copied by :func:`cached_accessor`, the public accessors copy the
+        articles they return.
+        """
+        languages = self.get_languages()
+        language = _get_active_language()
+        return SummaryIndex(
+            [
+                self._get_summary_article(article, languages, language)
+                for article in self.findall("article")
+            ]
+        )
+
+    @cached_accessor
+    def get_summary_articles(
+        self, offset: int = 0, limit: typing.Optional[int] = None
+    ) -> typing.List[SummaryArticle]:
+        """Return the list of the articles in the summary
+
+        :param offset: the number of articles to skip.
+        :param limit: the maximum number of articles to return, all of them by default.
+        :returns: the articles of the summary, or only the requested window. Only the articles
+            of the window are built, unless all the articles of the summary were built already.
+        """
+        if offset < 0 or (limit is not None and limit < 0):
+            raise ValueError("offset and limit must be non-negative")
+        if offset == 0 and limit is None:
+            return self._get_summary_index().summary_articles
+        end = offset + limit if limit is not None else None
+        if self._has_cached_result(self._get_summary_index):
+            return self._get_summary_index().summary_articles[offset:end]
+        languages = self.get_languages()
+        language = _get_active_language()
+        return [
+            self._get_summary_article(article, languages, language)
+            for article in self.findall("article")[offset:end]
+        ]
+
+    def iter_summary_articles(self) -> typing.Iterator[SummaryArticle]:
+        """Yield the articles in the summary one at a time
+
+        If the publication was built with ``lazy=True`` and its document has not been parsed yet,
+        the document is read with :func:`lxml.etree.iterparse` and each article is yielded as
+        soon as its element is parsed. The parsed elements are dropped along the way, so that the
+        whole tree is never held in memory. Otherwise, or if the publication has a disk cache,
+        the articles of :meth:`get_summary_articles` are yielded.
+        """
+        if self._is_parsed() or self._disk_cache is not None:
+            yield from self.get_summary_articles()
+            return
+
+        xml = self._xml
+        has_namespaces = has_xml_namespaces(xml)
+        if isinstance(xml, str):
+            xml = xml.encode("utf-8")
+        languages = None
+        language = _get_active_language()
+        for _, element in et.iterparse(
+            io.BytesIO(xml), events=("end",), tag=("{*}revue", "{*}article")
+        ):
+            if has_namespaces:
+                remove_xml_namespaces(element)
+            if element.tag == "revue":
+                # Like get_languages(), only consider the first revue element.
+                if languages is None:
+                    lang = element.get("lang")
+                    languages = lang.split() if lang else ["fr"]
+                continue
+            # The element is cleared below, the record keeps a copy of it.
+            yield self._get_summary_article(
+                deepcopy(element), list(languages or ["fr"]), language
             )
-        except StopIteration:
+            # Drop the article and everything that was parsed before it.
+            element.clear(keep_tail=True)
+            parent = element.getparent()
+            if parent is not None:
+                del parent[: parent.index(element)]
+
+    def get_summary_sections(self) -> typing.List[SummarySection]:
+        """Return the articles in the summary grouped by section
+
+        The consecutive articles that have the same section titles, of all levels and
+        languages, form a section. The articles without section titles form sections whose
+        titles are all ``None``.
+
+        :returns: the sections of the summary, in the order of the articles.
+        """
+        groups = itertools.groupby(
+            self._get_summary_index().summary_articles,
+            key=lambda summary_article: summary_article._record.get("section_titles"),
+        )
+        return [
+            SummarySection(deepcopy(titles), [copy(a) for a in summary_articles])
+            for titles, summary_articles in groups
+        ]
+
+    @cached_accessor
+    def _get_summary_article_elements(self) -> typing.Mapping:
+        """Return the ``article`` elements of the summary, by localidentifier
+
+        The elements are returned in a read-only view, which is not copied by
+        :func:`cached_accessor`.
+        """
+        elements = {}
+        for article in self.findall("article"):
+            elements.setdefault(article.get("idproprio"), article)
+        return types.MappingProxyType(elements)
+
+    def get_summary_article_title(
+        self, localidentifier: str, html: bool = False
+    ) -> str:
+        """Format the title of an article in the summary
+
+        Unlike the ``title`` of :class:`SummaryArticle`, the markup of the title is dropped
+        unless ``html`` is ``True``, and only the title of the article is formatted.
+
+        :param localidentifier: the localidentifier of the article.
+        :param html: whether to convert the markup of the title to HTML.
+        :raises LiberuditarticleError: if there is no such article.
+        """
+        article = self._get_summary_article_elements().get(localidentifier)
+        if article is None:
             raise LiberuditarticleError(
                 f"No article with localidentifier {localidentifier}"
             )
+        titles = self._get_summary_titles(article, self.get_languages(), html=html)
+        return self._get_formatted_title(titles, html=html)
+
+    def get_summary_article(self, localidentifier: str) -> SummaryArticle:
+        """:returns: the article in the summary with the given localidentifier.
+        :raises LiberuditarticleError: if there is no such article."""
+        return copy(self._get_summary_index().get(localidentifier))
+
+    def get_summary_article_at_page(
+        self, page: typing.Union[int, str]
+    ) -> typing.Optional[SummaryArticle]:
+        """Return the article in the summary that contains a page
+
+        :param page: an arabic or a roman page number.
+        :returns: the article whose pages include ``page``, the one starting last if there are
+            several, or ``None``.
+        """
+        position = self._get_page_index().find(page)
+        if position is None:
+            return None
+        return copy(self._get_summary_index().summary_articles[position])
+
+    def get_previous_summary_article(
+        self, localidentifier: str
+    ) -> typing.Optional[SummaryArticle]:
+        """:returns: the article preceding the given one in ordseq order, if any.
+        :raises LiberuditarticleError: if there is no article with this localidentifier.
+        """
+        return copy(self._get_summary_index().get_neighbour(localidentifier, -1))
+
+    def get_next_summary_article(
+        self, localidentifier: str
+    ) -> typing.Optional[SummaryArticle]:
+        """:returns: the article following the given one in ordseq order, if any.
+        :raises LiberuditarticleError: if there is no article with this localidentifier.
+        """
+        return copy(self._get_summary_index().get_neighbour(localidentifier, 1))
@@ -1,13 +1,16 @@
 import collections
+import lxml.etree as et
 import pytest
 from lxml.builder import E
 
-from eruditarticle.objects import EruditArticle, Title
+from eruditarticle.objects import ARTICLE_FIELDS, EruditArticle, Title
 from eruditarticle.tests.decorators import with_value, with_fixtures
 from ..objects.exceptions import (
+    InvalidFieldError,
     LiberuditarticleError,
     InvalidTitleLevelError,
     InvalidOrdseqError,
+    MissingSectionError,
 )
 
 
@@ -912,3 +915,126 @@ def test_stringified_elements_normalize_whitespaces():
     title.text = "foo\nbar"
     assert article.get_formatted_title() == "foo bar"
     assert article.get_formatted_html_title() == "foo bar"
+
+
+def test_cached_accessors_return_copies():
+    article = get_article("article/savant/minimal/602354ar.xml")
+    abstracts = article.get_abstracts()
+    abstracts[0]["content"] = "foo"
+    abstracts.append({})
+    assert article.get_abstracts() != abstracts
+    assert article.get_abstracts() == article.get_abstracts(html=False)
+
+
+def test_cached_accessors_are_keyed_by_arguments():
+    article = get_article("article/savant/minimal/602354ar.xml")
+    assert isinstance(article.get_authors(), list)
+    assert isinstance(article.get_authors(formatted=True), str)
+    assert isinstance(article.get_authors(False), list)
+
+
+def test_clear_cache():
+    article = get_article("article/savant/minimal/602354ar.xml")
+    title = article.find("grtitre/titre")
+    formatted_title = article.get_formatted_title()
+    title.text = "foo"
+    assert article.get_formatted_title() == formatted_title
+    article.clear_cache()
+    assert article.get_formatted_title() != formatted_title
+
+
+@pytest.mark.parametrize("from_tree", [True, False])
+def test_metadata_only_article(from_tree):
+    path = "./eruditarticle/tests/fixtures/article/savant/complet/009255ar.xml"
+    with open(path, "rb") as fp:
+        xml = fp.read()
+    article = EruditArticle(xml)
+    metadata = EruditArticle(
+        article._dom if from_tree else xml, sections={"admin", "liminaire"}
+    )
+    assert metadata.find("corps") is None
+    assert article.find("corps") is not None
+    assert metadata.get_formatted_html_title() == article.get_formatted_html_title()
+    assert metadata.get_authors(formatted=True) == article.get_authors(formatted=True)
+    assert metadata.get_abstracts(html=True) == article.get_abstracts(html=True)
+    assert metadata.get_doi() == article.get_doi()
+    with pytest.raises(MissingSectionError):
+        metadata.get_html_body()
+    with pytest.raises(MissingSectionError):
+        metadata.get_references()
+
+
+def test_malformed_document_raises_a_syntax_error():
+    with pytest.raises(et.XMLSyntaxError):
+        EruditArticle(b"<article><titre></article>")
+    article = EruditArticle(b"<article><titre></article>", lazy=True)
+    # The error of a lazy document is raised on every access, not only on the first one.
+    for _ in range(2):
+        with pytest.raises(et.XMLSyntaxError):
+            article.get_doi()
+
+
+def test_numbering_tags_are_elements():
+    article = get_article("article/savant/complet/044308ar.xml")
+    assert article.volume.tag == "volume"
+    assert article.volume.text == "65"
+    assert article.get_volume_numbering_record().volume == "65"
+    with pytest.raises(AttributeError):
+        article.alt_number
+
+
+def test_unknown_sections():
+    with pytest.raises(LiberuditarticleError):
+        EruditArticle(b"<article/>", sections={"partiefin"})
+
+
+def test_section_accessors_only_read_their_sections():
+    # The only sstitre of this article is that of a table of its corps.
+    article = get_article("article/abstracts/1056320ar.xml")
+    assert article.find("sstitre") is not None
+    assert article.get_subtitle() is None
+    # The first titre of this review is that of its bibliography.
+    article = get_article("article/savant/complet/1006389ar.xml")
+    assert article.find("titre") is not None
+    assert article.get_html_title() is None
+    metadata = EruditArticle(article._dom, sections={"liminaire"})
+    assert metadata.get_html_title() is None
+    assert metadata.get_subtitle() is None
+
+
+@pytest.mark.parametrize("html", [True, False])
+def test_extract_matches_the_accessors(html):
+    article = get_article("article/savant/complet/009255ar.xml")
+    fields = article.extract(html=html, language="fr")
+    article.clear_cache()
+    assert list(fields) == list(ARTICLE_FIELDS)
+    assert repr(fields["titles"]) == repr(article.get_titles(html=html))
+    assert people_to_dict(fields["authors"]) == people_to_dict(article.get_authors())
+    assert fields["abstracts"] == article.get_abstracts(html=html)
+    assert fields["keywords"] == article.get_keywords(html=html)
+    assert fields["doi"] == article.get_doi()
+    assert fields["first_page"] == article.get_first_page()
+    assert fields["last_page"] == article.get_last_page()
+    assert fields["copyrights"] == article.get_copyrights(
+        "fr", formatted=True, html=html
+    )
+    assert fields["notegens"] == article.get_notegens(html=html)
+    assert fields["section_titles"] == [
+        article.get_section_titles(level=level, html=html) for level in (1, 2, 3)
+    ]
+    assert fields["references"] == article.get_references(html=html)
+
+
+def test_extract_selected_fields():
+    article = get_article("article/savant/complet/009255ar.xml")
+    fields = article.extract(fields=["references", "doi"])
+    assert list(fields) == ["references", "doi"]
+    with pytest.raises(InvalidFieldError):
+        article.extract(fields=["doi", "body"])
+    metadata = get_article("article/savant/complet/009255ar.xml")
+    metadata = EruditArticle(metadata._dom, sections={"admin", "liminaire"})
+    assert metadata.extract(fields=["doi", "abstracts"]) == article.extract(
+        fields=["doi", "abstracts"]
+    )
+    with pytest.raises(MissingSectionError):
+        metadata.extract(fields=["references"])
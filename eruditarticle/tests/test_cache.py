@@ -0,0 +1,84 @@
+import pytest
+
+from eruditarticle.cache import SQLiteCache
+from eruditarticle.objects import EruditArticle, EruditPublication
+
+
+def get_xml(fixturename):
+    path = "./eruditarticle/tests/fixtures/{}".format(fixturename)
+    with open(path, "rb") as fp:
+        return fp.read()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return SQLiteCache(str(tmp_path / "cache.sqlite3"))
+
+
+def test_cached_results_do_not_parse_the_document(cache):
+    xml = get_xml("publication/ela03987.xml")
+    publication = EruditPublication(xml, cache=cache)
+    summary_articles = publication.get_summary_articles()
+    titles = publication.get_titles(html=True)
+
+    publication = EruditPublication(xml, cache=cache)
+    assert publication.get_summary_articles() == summary_articles
+    assert publication.get_titles(html=True) == titles
+    assert "_dom" not in publication.__dict__
+
+
+def test_uncached_results_parse_the_document(cache):
+    xml = get_xml("article/savant/minimal/602354ar.xml")
+    article = EruditArticle(xml, cache=cache)
+    assert article.get_formatted_title() == EruditArticle(xml).get_formatted_title()
+    assert len(article.get_authors()) == 1
+
+
+def test_document_key_depends_on_the_content(cache):
+    assert cache.get_document_key(b"<a/>") == cache.get_document_key("<a/>")
+    assert cache.get_document_key(b"<a/>") != cache.get_document_key(b"<b/>")
+
+
+def test_unpicklable_results_are_not_stored(cache):
+    cache.set("person", [EruditArticle(b"<article/>")])
+    assert cache.get("person") is None
+
+
+def test_least_recently_used_results_are_evicted(cache):
+    cache.max_size = 3000
+    cache.set("a", "a" * 1000)
+    cache.set("b", "b" * 1000)
+    assert cache.get("a") == "a" * 1000
+    cache.set("c", "c" * 1000)
+    assert cache.get("a") == "a" * 1000
+    assert cache.get("b") is None
+    assert cache.get("c") == "c" * 1000
+
+
+def test_private_accessors_are_not_stored(cache):
+    xml = get_xml("publication/ela03987.xml")
+    publication = EruditPublication(xml, cache=cache)
+    publication.get_summary_articles()
+    publication.get_themes()
+    keys = [
+        key for (key,) in cache._get_connection().execute("SELECT key FROM entries")
+    ]
+    assert any("get_summary_articles" in key for key in keys)
+    assert not any("._get_" in key for key in keys)
+
+
+def test_total_size_is_kept_up_to_date(cache):
+    cache.set("a", "a" * 1000)
+    cache.set("b", "b" * 1000)
+    cache.set("a", "a" * 10)
+    connection = cache._get_connection()
+    (total_size,) = connection.execute(
+        "SELECT value FROM metadata WHERE name = 'total_size'"
+    ).fetchone()
+    (size,) = connection.execute("SELECT SUM(size) FROM entries").fetchone()
+    assert total_size == size
+    cache.clear()
+    (total_size,) = connection.execute(
+        "SELECT value FROM metadata WHERE name = 'total_size'"
+    ).fetchone()
+    assert total_size == 0
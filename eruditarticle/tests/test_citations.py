@@ -0,0 +1,217 @@
+import io
+import json
+
+import lxml.etree as et
+import pytest
+
+from eruditarticle.citations import (
+    CITATION_STYLES,
+    Citation,
+    CitationWriter,
+    get_article_citation,
+    get_citations,
+    get_summary_citations,
+    write_citations,
+)
+from eruditarticle.objects import EruditArticle, EruditPublication, VolumeNumbering
+from eruditarticle.objects.dom import HtmlRendering
+from eruditarticle.objects.exceptions import (
+    InvalidCitationStyleError,
+    LiberuditarticleError,
+)
+from eruditarticle.objects.person import Person
+
+
+def get_xml(fixturename):
+    path = "./eruditarticle/tests/fixtures/{}".format(fixturename)
+    with open(path, "rb") as fp:
+        return fp.read()
+
+
+def export(citations, style):
+    fp = io.StringIO()
+    count = write_citations(citations, fp, style=style)
+    return count, fp.getvalue()
+
+
+@pytest.fixture
+def publication():
+    return EruditPublication(get_xml("publication/ae1375.xml"))
+
+
+@pytest.fixture
+def article():
+    return EruditArticle(get_xml("article/savant/complet/009255ar.xml"))
+
+
+def test_summary_citations_share_the_issue_fields(publication):
+    citations = list(get_summary_citations(publication))
+    assert len(citations) == len(publication.get_summary_articles())
+    assert citations[1].localidentifier == "013464ar"
+    assert [a.format_name() for a in citations[1].authors] == [
+        "Pierre-André Chiappori",
+        "Olivier Donni",
+    ]
+    assert citations[1].volume_numbering is citations[0].volume_numbering
+    assert citations[1].year == "2006"
+    assert (citations[1].first_page, citations[1].last_page) == ("9", "52")
+
+
+@pytest.mark.parametrize("style", CITATION_STYLES)
+def test_summary_citation_titles_have_no_markup(style):
+    # The reviewed works of this issue are titled with marquage elements.
+    publication = EruditPublication(get_xml("publication/ae1806445.xml"))
+    citations = list(get_summary_citations(publication))
+    citation = next(c for c in citations if c.localidentifier == "1003967ar")
+    assert citation.title.startswith(
+        "Développement urbain et analyse économique, EN COLLABORATION."
+    )
+    assert "<em>" in publication.get_summary_article("1003967ar").html_title
+    assert "<em>" not in export(citations, style)[1]
+
+
+def test_citation_authors_are_not_converted_to_html(publication, article, monkeypatch):
+    monkeypatch.setattr(HtmlRendering, "to_html", None)
+    citations = list(get_citations([article]))
+    citations.extend(get_summary_citations(publication))
+    assert all(citation.authors for citation in citations)
+
+
+def test_article_citation(article):
+    citation = get_article_citation(article)
+    assert citation.localidentifier == "009255ar"
+    assert citation.journal_title == "Romanticism on the Net"
+    assert citation.volume_numbering == article.get_volume_numbering_record()
+    assert citation.volume_numbering.number == "32-33"
+    assert citation.year == "2003"
+    assert citation.doi == "10.7202/009255ar"
+
+
+def test_bibtex(publication):
+    count, bibtex = export(get_summary_citations(publication), "bibtex")
+    assert count == 10
+    assert bibtex.count("@article{") == 10
+    assert bibtex.startswith(
+        "@article{013463ar,\n"
+        "  author = {Donni, Olivier},\n"
+        "  title = {Avant-propos},\n"
+        "  journal = {L'Actualité économique},\n"
+        "  volume = {82},\n"
+        "  number = {1-2},\n"
+        "  year = {2006},\n"
+        "  pages = {5--8},\n"
+        "  issn = {0001-771X},\n"
+        "  publisher = {HEC Montréal},\n"
+        "  language = {fr}\n"
+        "}\n\n"
+        "@article{013464ar,\n"
+        "  author = {Chiappori, Pierre-André and Donni, Olivier},\n"
+    )
+
+
+def test_bibtex_escapes_special_characters():
+    author = Person(
+        et.fromstring("<auteur><nomorg>Smith &amp; Sons_</nomorg></auteur>")
+    ).snapshot()
+    citation = Citation(
+        localidentifier="a b",
+        title="100% {sure}\n $1",
+        authors=[author],
+        journal_title=None,
+        volume_numbering=None,
+    )
+    assert export([citation], "bibtex")[1] == (
+        "@article{ab,\n"
+        "  author = {{Smith \\& Sons\\_}},\n"
+        "  title = {100\\% \\{sure\\} \\$1}\n"
+        "}\n"
+    )
+
+
+def test_ris(article):
+    count, ris = export(get_citations([article, article]), "ris")
+    assert count == 2
+    assert ris.count("ER  - \n") == 2
+    assert ris.split("ER  - \n")[0] == (
+        "TY  - JOUR\n"
+        "AU  - Pratt, Lynda\n"
+        "TI  - Robert Southey, Writing and Romanticism\n"
+        "JO  - Romanticism on the Net\n"
+        "IS  - 32-33\n"
+        "PY  - 2003\n"
+        "DO  - 10.7202/009255ar\n"
+        "SN  - 1467-1255\n"
+        "PB  - Université de Montréal\n"
+        "LA  - en\n"
+        "ID  - 009255ar\n"
+    )
+
+
+def test_csl_json(publication, article):
+    summary_articles = publication.get_summary_articles()[:2]
+    count, csl = export(
+        get_citations([article] + summary_articles, publication), "csl-json"
+    )
+    items = json.loads(csl)
+    assert count == len(items) == 3
+    assert items[0]["DOI"] == "10.7202/009255ar"
+    assert items[2] == {
+        "id": "013464ar",
+        "type": "article-journal",
+        "title": (
+            "Les modèles non unitaires de comportement du ménage\xa0: "
+            "un survol de la littérature"
+        ),
+        "author": [
+            {"family": "Chiappori", "given": "Pierre-André"},
+            {"family": "Donni", "given": "Olivier"},
+        ],
+        "container-title": "L'Actualité économique",
+        "volume": "82",
+        "issue": "1-2",
+        "page": "9-52",
+        "ISSN": "0001-771X",
+        "publisher": "HEC Montréal",
+        "language": "fr",
+        "issued": {"date-parts": [[2006]]},
+    }
+
+
+@pytest.mark.parametrize("style", sorted(CITATION_STYLES))
+def test_empty_export(style):
+    count, output = export([], style)
+    assert count == 0
+    if style == "csl-json":
+        assert json.loads(output) == []
+    else:
+        assert output == ""
+
+
+def test_summary_articles_need_their_publication(publication):
+    with pytest.raises(LiberuditarticleError):
+        list(get_citations(publication.get_summary_articles()))
+
+
+def test_citation_writers_must_write_citations():
+    with pytest.raises(TypeError):
+        CitationWriter(io.StringIO())
+
+
+def test_unknown_style():
+    with pytest.raises(InvalidCitationStyleError):
+        write_citations([], io.StringIO(), style="endnote")
+
+
+def test_volume_numbering_record_of_an_article(article):
+    assert article.get_volume_numbering_record() == VolumeNumbering(
+        volume="",
+        number="32-33",
+        alt_number="",
+        number_type=None,
+        publication_period_parts=(
+            ("periode", "November"),
+            ("annee", "2003"),
+            ("periode", "February"),
+            ("annee", "2004"),
+        ),
+    )
@@ -0,0 +1,141 @@
+import collections
+import gzip
+import operator
+import shutil
+import tarfile
+import zipfile
+
+import pytest
+
+from eruditarticle.corpus import Corpus, get_root_tag
+from eruditarticle.objects import EruditArticle, EruditJournal, EruditPublication
+from eruditarticle.objects.exceptions import LiberuditarticleError
+
+FIXTURES = "./eruditarticle/tests/fixtures/"
+
+# The documents of the corpus, by name.
+DOCUMENTS = {
+    "a/009255ar.xml": "article/savant/complet/009255ar.xml",
+    "a/b/044308ar.xml": "article/savant/complet/044308ar.xml",
+    "journal.xml": "journal/approchesind0522.xml",
+    "publication.xml": "publication/ae1806445.xml",
+}
+
+
+@pytest.fixture
+def directory(tmp_path):
+    root = tmp_path / "corpus"
+    for name, fixture in DOCUMENTS.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy(FIXTURES + fixture, str(path))
+    (root / "unknown.xml").write_bytes(b"<?xml version='1.0'?><site/>")
+    (root / "malformed.xml").write_bytes(b"<article")
+    (root / "notes.txt").write_bytes(b"<article/>")
+    return root
+
+
+@pytest.fixture(params=["directory", "zip", "tar", "tar.gz"])
+def corpus_path(request, directory, tmp_path):
+    if request.param == "directory":
+        return str(directory)
+    names = sorted(p.relative_to(directory).as_posix() for p in directory.rglob("*"))
+    path = str(tmp_path / ("corpus." + request.param))
+    if request.param == "zip":
+        with zipfile.ZipFile(path, "w") as archive:
+            for name in names:
+                archive.write(str(directory / name), name)
+    else:
+        mode = "w:gz" if request.param.endswith("gz") else "w"
+        with tarfile.open(path, mode) as archive:
+            for name in names:
+                archive.add(str(directory / name), name, recursive=False)
+    return path
+
+
+def test_documents_are_inferred_and_ordered(corpus_path):
+    with Corpus(corpus_path) as corpus:
+        assert operator.length_hint(corpus) == 6
+        documents = [(d.name.replace("\\", "/"), d.object_type) for d in corpus]
+    assert documents == [
+        ("a/009255ar.xml", EruditArticle),
+        ("a/b/044308ar.xml", EruditArticle),
+        ("journal.xml", EruditJournal),
+        ("publication.xml", EruditPublication),
+    ]
+
+
+def test_objects_are_built_on_first_access(corpus_path):
+    with Corpus(corpus_path, types=[EruditArticle]) as corpus:
+        documents = list(corpus)
+        assert [d.object_type for d in documents] == [EruditArticle, EruditArticle]
+        assert "object" not in vars(documents[0])
+        assert documents[0].object is documents[0].object
+        assert documents[0].object.get_localidentifier() == "009255ar"
+        assert [o.get_localidentifier() for o in corpus.objects()] == [
+            "009255ar",
+            "044308ar",
+        ]
+
+
+def test_tar_members_are_read_once_in_a_forward_pass(tmp_path, monkeypatch):
+    path = str(tmp_path / "corpus.tar.gz")
+    names = ["{:02}.xml".format(i) for i in range(20)]
+    with tarfile.open(path, "w:gz") as archive:
+        for name in names:
+            archive.add(FIXTURES + DOCUMENTS["a/009255ar.xml"], name)
+
+    reads = collections.Counter()
+    extractfile = tarfile.TarFile.extractfile
+    rewinds = []
+    rewind = gzip._GzipReader._rewind
+
+    def counting_extractfile(archive, member):
+        reads[member.name] += 1
+        return extractfile(archive, member)
+
+    def counting_rewind(reader):
+        rewinds.append(reader)
+        return rewind(reader)
+
+    monkeypatch.setattr(tarfile.TarFile, "extractfile", counting_extractfile)
+    monkeypatch.setattr(gzip._GzipReader, "_rewind", counting_rewind)
+    with Corpus(path) as corpus:
+        rewinds.clear()
+        # Unlike list(), a comprehension does not ask for the length hint.
+        documents = [document for document in corpus]
+        for document in documents:
+            assert document.object.get_localidentifier() == "009255ar"
+            assert document.read()
+    assert [document.name for document in documents] == names
+    assert reads == dict.fromkeys(names, 1)
+    # The compressed stream was never decompressed again from its start.
+    assert rewinds == []
+
+    with Corpus(path) as corpus:
+        rewinds.clear()
+        assert operator.length_hint(corpus) == len(names)
+        assert len(list(corpus)) == len(names)
+    # Counting the members reads the whole stream, which is only read again once.
+    assert len(rewinds) == 1
+
+
+def test_root_tag_of_a_large_document_is_read_from_its_beginning():
+    class Reader:
+        def __init__(self):
+            self.size = 0
+
+        def read(self, size):
+            self.size += size
+            return b"<numeros xmlns='urn:x'>" + b"<numero/>" * size
+
+    reader = Reader()
+    assert get_root_tag(reader) == "numeros"
+    assert reader.size == 4096
+
+
+def test_unknown_corpus(tmp_path):
+    path = tmp_path / "corpus.xml"
+    path.write_bytes(b"<article/>")
+    with pytest.raises(LiberuditarticleError):
+        Corpus(str(path))
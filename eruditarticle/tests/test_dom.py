@@ -0,0 +1,141 @@
+import glob
+
+import lxml.etree as et
+import pytest
+
+from eruditarticle.objects.dom import DomObject, TagIndex, parse_simple_path
+from eruditarticle.utils import parse_xml
+
+FIXTURES = sorted(glob.glob("./eruditarticle/tests/fixtures/**/*.xml", recursive=True))
+
+SIMPLE_PATHS = [
+    "article",
+    "article//pagination//ppage",
+    "article//liminaire//grtitre//surtitre",
+    "corps/texte",
+    "grtitre",
+    "infoarticle//pagination//dpage",
+    "liminaire//grtitre",
+    "numero//pub//annee",
+    "numero/volume",
+    "para/alinea",
+    "redacteurchef",
+    "resume",
+    "titre",
+]
+
+
+@pytest.mark.parametrize(
+    "path, expected",
+    [
+        ("titre", ((True, "titre"),)),
+        ("numero//pub", ((True, "numero"), (True, "pub"))),
+        ("corps/texte", ((True, "corps"), (False, "texte"))),
+        ('idpublic[@scheme="uri"]', None),
+        ("contributiondeclaration | copyrightdeclaration", None),
+        ("/titre", None),
+        ("titre/", None),
+        ("numero///pub", None),
+        ("*", None),
+    ],
+)
+def test_parse_simple_path(path, expected):
+    assert parse_simple_path(path) == expected
+
+
+@pytest.mark.parametrize("fixture", FIXTURES)
+def test_tag_index_matches_lxml(fixture):
+    with open(fixture, "rb") as xml:
+        root = parse_xml(xml.read()).getroot()
+    tag_index = TagIndex(root)
+    for path in SIMPLE_PATHS:
+        assert tag_index.findall(parse_simple_path(path), root) == root.findall(
+            ".//{}".format(path)
+        )
+
+
+def test_tag_index_returns_elements_in_document_order_without_duplicates():
+    root = et.fromstring("<r><a><a><b>1</b></a><b>2</b></a></r>")
+    dom = DomObject(root)
+    dom.index_tags = True
+    assert [b.text for b in dom.findall("a//b")] == ["1", "2"]
+    assert [b.text for b in dom.findall("a/b")] == ["1", "2"]
+
+
+def test_tag_index_ignores_removed_elements():
+    root = et.fromstring("<r><a><b>1</b></a><a><b>2</b></a></r>")
+    dom = DomObject(root)
+    dom.index_tags = True
+    assert len(dom.findall("b")) == 2
+    del root[0][:]
+    assert [b.text for b in dom.findall("a/b")] == ["2"]
+    assert dom.find("b").text == "2"
+
+
+def test_tag_index_is_relative_to_dom():
+    root = et.fromstring("<r><a><b>1</b></a><b>2</b></r>")
+    dom = DomObject(root)
+    dom.index_tags = True
+    assert [b.text for b in dom.findall("b", dom=root[0])] == ["1"]
+    assert dom.find("b", dom=root[0][0]) is None
+
+
+@pytest.mark.parametrize("fixture", FIXTURES)
+def test_batch_conversion_to_html_matches_node_by_node_conversion(fixture):
+    with open(fixture, "rb") as xml:
+        root = parse_xml(xml.read()).getroot()
+    for tags, strip_elements in [
+        (["alinea", "motcle", "titre", "sstitre", "trefbiblio"], ["renvoi"]),
+        (["refbiblio", "resume", "notegen"], ["idpublic"]),
+    ]:
+        nodes = list(root.iter(*tags))
+        assert DomObject.batch_convert_marquage_content_to_html(
+            nodes, strip_elements=strip_elements
+        ) == [
+            DomObject.convert_marquage_content_to_html(node, strip_elements)
+            for node in nodes
+        ]
+
+
+def test_batch_conversion_to_html_keeps_none_values():
+    root = et.fromstring(
+        '<r><titre>A <marquage typemarq="italique">b</marquage></titre><motcle>c</motcle></r>'
+    )
+    assert DomObject.batch_convert_marquage_content_to_html(
+        [None, root[0], None, root[1]]
+    ) == [None, "A <em>b</em>", None, "c"]
+    assert DomObject.batch_convert_marquage_content_to_html([None]) == [None]
+
+
+@pytest.mark.parametrize(
+    "xml, strip_elements, expected",
+    [
+        ("<a> x <b>y</b>\n z </a>", None, "x y z"),
+        ("<a>x<renvoi>1</renvoi> y</a>", ["renvoi"], "x y"),
+        ("<a>x<b>y<renvoi>1<!-- c --></renvoi></b> z</a>", ["renvoi"], "xy z"),
+        # Like when stripping the tags of a copy of the node, comments stop the text.
+        ("<a>x<b>y<!-- c -->z</b> w</a>", None, "xy"),
+        ("<a><b/></a>", None, None),
+    ],
+)
+def test_stringify_children(xml, strip_elements, expected):
+    node = et.fromstring(xml)
+    assert DomObject.stringify_children(node, strip_elements) == expected
+    assert et.tostring(node) == xml.encode()
+
+
+def test_shared_conversions_are_kept_until_the_outermost_context_exits():
+    root = et.fromstring(
+        '<r><titre>A <marquage typemarq="italique">b</marquage></titre><motcle>c</motcle></r>'
+    )
+    with DomObject.sharing_conversions([root[0]]):
+        with DomObject.sharing_conversions([root[1]]):
+            pass
+        root[0].text = "B "
+        root[1].text = "d"
+        assert DomObject.convert_marquage_content_to_html(root[0]) == "A <em>b</em>"
+        assert DomObject.batch_convert_marquage_content_to_html(root) == [
+            "A <em>b</em>",
+            "c",
+        ]
+    assert DomObject.convert_marquage_content_to_html(root[0]) == "B <em>b</em>"
@@ -0,0 +1,77 @@
+import glob
+
+import lxml.etree as et
+import pytest
+
+from eruditarticle import marquage
+from eruditarticle.objects.dom import DomObject
+from eruditarticle.utils import normalize_whitespace, parse_xml
+
+
+def convert_with_xslt(node, strip_elements):
+    rendered_node = DomObject.render_marquage_to_html(node, strip_elements)
+    return DomObject.get_rendered_html(rendered_node, tag=node.tag)
+
+
+@pytest.mark.parametrize(
+    "fixture",
+    sorted(glob.glob("./eruditarticle/tests/fixtures/**/*.xml", recursive=True)),
+)
+def test_render_is_identical_to_the_xslt(fixture):
+    with open(fixture, "rb") as xml:
+        root = parse_xml(xml.read()).getroot()
+    for strip_elements in (["renvoi"], ["idpublic"]):
+        for node in root.iter(et.Element):
+            html = marquage.render(node, strip_elements)
+            if html is not None:
+                assert normalize_whitespace(html) == convert_with_xslt(
+                    node, strip_elements
+                )
+
+
+@pytest.mark.parametrize(
+    "xml, expected",
+    [
+        ("<titre>A &amp; b &lt; c &gt; d</titre>", "A &amp; b &lt; c &gt; d"),
+        ('<titre><marquage typemarq="italique">a</marquage></titre>', "<em>a</em>"),
+        ('<titre><marquage typemarq="gras">a</marquage></titre>', "<strong>a</strong>"),
+        (
+            '<titre><marquage typemarq="taillep">a</marquage></titre>',
+            "<small>a</small>",
+        ),
+        (
+            '<titre><marquage typemarq="petitecap">a</marquage></titre>',
+            '<span class="petitecap">a</span>',
+        ),
+        ("<titre><marquage>a</marquage></titre>", '<span class="">a</span>'),
+        (
+            "<titre>x<exposant>2</exposant><indice>i</indice></titre>",
+            "x<sup>2</sup><sub>i</sub>",
+        ),
+        ('<titre>a<caracunicode code="U+00E9">é</caracunicode>b</titre>', "aéb"),
+        ("<titre>a<renvoi>1</renvoi> b</titre>", "a b"),
+        ("<titre>a<!-- comment -->b</titre>", "ab"),
+        ("<titre>  a \n\t b  </titre>", "a b"),
+        ("<titre></titre>", None),
+    ],
+)
+def test_render_trivial_nodes(xml, expected):
+    node = et.fromstring(xml)
+    html = marquage.render(node, ["renvoi"])
+    assert html is not None
+    assert normalize_whitespace(html) == expected
+    assert convert_with_xslt(node, ["renvoi"]) == expected
+
+
+@pytest.mark.parametrize(
+    "xml",
+    [
+        '<titre>a <liensimple href="http://example.com">b</liensimple></titre>',
+        '<titre><marquage typemarq="a&quot;b">a</marquage></titre>',
+        '<marquage typemarq="italique">a</marquage>',
+        "<titre>a&#13;b</titre>",
+        "<alinea>a <citation>b</citation></alinea>",
+    ],
+)
+def test_render_bails_out_on_other_markup(xml):
+    assert marquage.render(et.fromstring(xml), ["renvoi"]) is None
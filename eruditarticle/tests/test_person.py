@@ -1,12 +1,20 @@
+import glob
+import pickle
+
 import lxml.etree as et
 import pytest
 
+from eruditarticle.objects.dom import HtmlRendering
+from eruditarticle.objects.exceptions import LiberuditarticleError
 from eruditarticle.objects.person import (
     Person,
+    Redacteur,
+    format_authors,
     format_authors_mla,
     format_authors_apa,
     format_authors_chicago,
 )
+from eruditarticle.utils import parse_xml
 
 
 class FakePerson:
@@ -70,6 +78,104 @@ def test_author_with_empty_suffix():
     assert person.format_name() == "Pamela A. Foelsch"
 
 
+class NodeByNodeHtmlRendering(HtmlRendering):
+    def _get_rendered_nodes(self):
+        return {}
+
+
+@pytest.mark.parametrize(
+    "fixture",
+    sorted(glob.glob("./eruditarticle/tests/fixtures/**/*.xml", recursive=True)),
+)
+def test_html_format_name_is_the_same_as_converting_each_name_part(fixture):
+    with open(fixture, "rb") as xml:
+        root = parse_xml(xml.read()).getroot()
+    for elem in root.iter("auteur", "redacteurchef", "directeur"):
+        expected_person = Person(elem)
+        expected_person._html_rendering = NodeByNodeHtmlRendering(elem, ())
+        expected = expected_person.format_name(html=True)
+        assert Person(elem).format_name(html=True) == expected
+        assert Person(elem).format_name(html=True, suffixes=False) == (
+            expected_person.format_name(html=True, suffixes=False)
+        )
+
+
+@pytest.mark.parametrize(
+    "fixture",
+    sorted(glob.glob("./eruditarticle/tests/fixtures/**/*.xml", recursive=True)),
+)
+def test_snapshot_is_the_same_as_the_person(fixture):
+    with open(fixture, "rb") as xml:
+        root = parse_xml(xml.read()).getroot()
+    for elem in root.iter("auteur", "redacteurchef", "membre"):
+        person = Redacteur(elem) if elem.tag == "redacteurchef" else Person(elem)
+        record = pickle.loads(pickle.dumps(person.snapshot()))
+        for field in (
+            "firstname",
+            "lastname",
+            "othername",
+            "suffix",
+            "email",
+            "affiliations",
+            "organization",
+            "role",
+        ):
+            assert getattr(record, field) == getattr(person, field)
+        for html in (True, False):
+            for suffixes in (True, False):
+                assert record.format_name(html=html, suffixes=suffixes) == (
+                    person.format_name(html=html, suffixes=suffixes)
+                )
+        for format in (
+            format_authors,
+            format_authors_mla,
+            format_authors_apa,
+            format_authors_chicago,
+        ):
+            assert format([record, record]) == format([person, person])
+        if elem.tag == "redacteurchef":
+            assert (record.typerc, record.themes) == (person.typerc, person.themes)
+        text_record = person.snapshot(html=False)
+        assert text_record.format_name() == person.format_name()
+
+
+def test_text_only_snapshot():
+    person = Person(
+        et.fromstring(
+            "<auteur><nompers><prenom>Jean</prenom>"
+            '<nomfamille><marquage typemarq="italique">Dupont</marquage></nomfamille>'
+            "</nompers></auteur>"
+        )
+    )
+    record = person.snapshot(html=False)
+    assert record.name.html_parts is None
+    assert record.format_name() == "Jean Dupont"
+    with pytest.raises(LiberuditarticleError):
+        record.format_name(html=True)
+    organization = Person(et.fromstring("<auteur><nomorg>Érudit</nomorg></auteur>"))
+    record = organization.snapshot(html=False)
+    assert record.format_name() == "Érudit"
+    with pytest.raises(LiberuditarticleError):
+        record.format_name(html=True)
+
+
+def test_snapshot_of_a_pseudonym():
+    person = Person(
+        et.fromstring(
+            "<auteur><nompers><prenom>Jean</prenom><nomfamille>Dupont</nomfamille></nompers>"
+            '<nompers typenompers="pseudonyme"><prenom>J.</prenom>'
+            '<nomfamille><marquage typemarq="italique">D</marquage></nomfamille>'
+            "<suffixe>fils</suffixe></nompers></auteur>"
+        )
+    )
+    record = person.snapshot()
+    assert record.format_name() == "Jean Dupont, alias J. D, fils"
+    assert record.format_name(html=True, suffixes=False) == (
+        "Jean Dupont, alias J. <em>D</em>"
+    )
+    assert record.pseudo.format() == person.pseudo.format()
+
+
 COMMON_EDGE_CASES = [
     ([], ""),
     ([(None, None)], ""),
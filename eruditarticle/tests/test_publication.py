@@ -1,9 +1,12 @@
+import collections
+import pickle
 import pytest
 
 from datetime import datetime
 import typing
 
 from eruditarticle.objects import EruditPublication, Title, SummaryArticle
+from eruditarticle.objects import SummaryArticleColumns
 from eruditarticle.tests.decorators import with_value, with_fixtures
 
 from .test_article import people_to_dict
@@ -524,6 +527,10 @@ class TestRedacteurChef(object):
         assert redacteurchef.lastname == "Lesage (NUMÉRO)"
         assert redacteurchef.typerc == "regulier"
 
+    @with_value("smq1826.xml", "get_redacteurchef", idrefs=['th1"'])
+    def test_can_filter_redacteurchef_with_quotes_in_theme_ids(self, value):
+        assert value == []
+
     @with_value("ltp02888.xml", "get_redacteurchef", typerc="invite", idrefs=[])
     def test_does_not_return_thematic_redacteurchef_when_no_themes_specified(
         self, value
@@ -573,10 +580,217 @@ class TestEruditPublication(object):
         )
         assert summary_article.accessible == accessible
 
+    def test_summary_article_titles_and_authors_are_lazy(self):
+        publication = self.test_objects["ela03987.xml"]
+        summary_article = publication.get_summary_articles()[0]
+        assert summary_article._record.fields is None
+        assert summary_article.urlpdf == "/revue/ela/2018/v/n45/1051608ar.pdf"
+        assert not summary_article.has_external_url()
+        assert summary_article._record.fields is None
+        assert summary_article.title == "Claude Wauthier nous a quittés"
+        assert summary_article.authors == "Bernard Mouralis"
+        # The fields computed by one copy are shared with the others.
+        assert publication.get_summary_articles()[0]._record.fields is not None
+        assert pickle.loads(pickle.dumps(summary_article)) == summary_article
+        assert summary_article == SummaryArticle(
+            localidentifier="1051608ar",
+            urlpdf="/revue/ela/2018/v/n45/1051608ar.pdf",
+            first_page="1",
+            last_page="2",
+            title="Claude Wauthier nous a quittés",
+            html_title="Claude Wauthier nous a quittés",
+            ordseq="1",
+            doi="10.7202/1051608ar",
+            authors="Bernard Mouralis",
+        )
+
+    def test_pickled_summary_articles_are_formatted(self):
+        path = "./eruditarticle/tests/fixtures/publication/ela03987.xml"
+        with open(path, "rb") as fp:
+            publication = EruditPublication(fp.read())
+        summary_article = publication.get_summary_articles()[1]
+        assert summary_article._record.article is not None
+        summary_article = pickle.loads(pickle.dumps(summary_article))
+        # The fields were formatted before pickling, the tree was not pickled.
+        assert summary_article._record.fields is not None
+        assert summary_article._record.article is None
+        assert summary_article._record.publication is None
+        assert summary_article == publication.get_summary_articles()[1]
+
+    @pytest.mark.parametrize(
+        "offset, limit", [(0, 10), (10, 10), (50, 10), (0, None), (20, None), (0, 0)]
+    )
+    def test_paginated_summary_articles(self, offset, limit):
+        publication = self.test_objects["ela03987.xml"]
+        end = offset + limit if limit is not None else None
+        assert (
+            publication.get_summary_articles(offset, limit)
+            == publication.get_summary_articles()[offset:end]
+        )
+
+    def test_paginated_summary_articles_only_build_the_window(self, monkeypatch):
+        publication = self.test_objects["ela03987.xml"]
+        built = []
+        get_summary_article = publication._get_summary_article
+        monkeypatch.setattr(
+            publication,
+            "_get_summary_article",
+            lambda article, *args: built.append(article)
+            or get_summary_article(article, *args),
+        )
+        summary_articles = publication.get_summary_articles(offset=10, limit=5)
+        assert len(built) == len(summary_articles) == 5
+        assert summary_articles[0].localidentifier == "1051618ar"
+        with pytest.raises(ValueError):
+            publication.get_summary_articles(offset=-1)
+
+    def test_paginated_summary_articles_reuse_the_summary(self, monkeypatch):
+        publication = EruditPublication(self.test_objects["ela03987.xml"]._dom)
+        summary_articles = publication.get_summary_articles()
+        monkeypatch.setattr(publication, "_get_summary_article", None)
+        window = publication.get_summary_articles(offset=10, limit=5)
+        assert window == summary_articles[10:15]
+
+    @pytest.mark.parametrize("fixture", ["ela03987.xml", "etudinuit777.xml"])
+    def test_summary_article_columns(self, fixture):
+        summary_articles = self.test_objects[fixture].get_summary_articles()
+        columns = SummaryArticleColumns(summary_articles)
+        assert len(columns) == len(summary_articles)
+        assert list(columns) == summary_articles
+        assert columns[-1] == summary_articles[-1]
+        assert columns[2:5] == summary_articles[2:5]
+        with pytest.raises(IndexError):
+            columns[len(summary_articles)]
+
+    @pytest.mark.parametrize("fixture", ["ela03987.xml", "etudinuit777.xml"])
+    def test_iter_summary_articles(self, fixture):
+        with open("./eruditarticle/tests/fixtures/publication/" + fixture, "rb") as fp:
+            publication = EruditPublication(fp.read(), lazy=True)
+        summary_articles = list(publication.iter_summary_articles())
+        # The summary was streamed without parsing the whole document.
+        assert not publication._is_parsed()
+        assert summary_articles == publication.get_summary_articles()
+        assert list(publication.iter_summary_articles()) == summary_articles
+
     def test_get_summary_article_can_raise_liberuditarticleerror(self):
         with pytest.raises(LiberuditarticleError):
             self.test_objects["etudinuit777.xml"].get_summary_article("error")
 
+    @pytest.mark.parametrize(
+        "localidentifier, previous, next",
+        [
+            ("1051608ar", None, "1051609ar"),
+            ("1051609ar", "1051608ar", "1051610ar"),
+        ],
+    )
+    def test_get_neighbour_summary_articles(self, localidentifier, previous, next):
+        publication = self.test_objects["ela03987.xml"]
+        previous_article = publication.get_previous_summary_article(localidentifier)
+        next_article = publication.get_next_summary_article(localidentifier)
+        assert getattr(previous_article, "localidentifier", None) == previous
+        assert getattr(next_article, "localidentifier", None) == next
+
+    def test_neighbour_summary_articles_follow_ordseq(self):
+        publication = EruditPublication(
+            "<sommaire><infosommaire><revue/></infosommaire>"
+            '<article idproprio="b" ordseq="2"/>'
+            '<article idproprio="a" ordseq="1"/>'
+            '<article idproprio="c" ordseq="3"/>'
+            "</sommaire>"
+        )
+        assert publication.get_summary_article("a").ordseq == "1"
+        assert publication.get_next_summary_article("a").localidentifier == "b"
+        assert publication.get_previous_summary_article("c").localidentifier == "b"
+        assert publication.get_next_summary_article("c") is None
+        with pytest.raises(LiberuditarticleError):
+            publication.get_next_summary_article("d")
+
+    def test_get_summary_sections(self):
+        path = "./eruditarticle/tests/fixtures/publication/section_titles/raqv44n1.xml"
+        with open(path, "rb") as fp:
+            publication = EruditPublication(fp.read())
+        sections = publication.get_summary_sections()
+        summary_articles = [a for s in sections for a in s.summary_articles]
+        assert summary_articles == publication.get_summary_articles()
+        assert [len(s.summary_articles) for s in sections] == [7, 1, 3, 3, 1, 2, 6, 4]
+        assert sections[0].titles == [None, None, None]
+        assert sections[2].titles == [
+            {
+                "main": "Paroles et points de vue atikamekw nehirowisiwok",
+                "paral": collections.OrderedDict(),
+            },
+            {
+                "main": "Paroles d’aînés nehirowisiwok",
+                "paral": collections.OrderedDict(),
+            },
+            None,
+        ]
+        assert sections[2].summary_articles[0].section_title == (
+            "Paroles et points de vue atikamekw nehirowisiwok"
+        )
+        # The returned sections are copies.
+        sections[2].summary_articles.clear()
+        assert len(publication.get_summary_sections()[2].summary_articles) == 3
+
+    def test_get_summary_article_title(self):
+        publication = self.test_objects["ae1806445.xml"]
+        assert publication.get_summary_article_title("1003968ar").startswith(
+            "Challenge for Survival. Land, Air and Water for Man in Megalopolis, par"
+        )
+        assert publication.get_summary_article_title("1003968ar", html=True).startswith(
+            "<em>Challenge for Survival. Land, Air and Water for Man in Megalopolis</em>, par"
+        )
+        with pytest.raises(LiberuditarticleError):
+            publication.get_summary_article_title("foo")
+
+    def test_summary_sections_are_formatted_with_the_summary_articles(
+        self, monkeypatch
+    ):
+        path = "./eruditarticle/tests/fixtures/publication/section_titles/raqv44n1.xml"
+        with open(path, "rb") as fp:
+            publication = EruditPublication(fp.read())
+        formatted = []
+        get_summary_fields = publication._get_summary_fields
+        monkeypatch.setattr(
+            publication,
+            "_get_summary_fields",
+            lambda article, *args: formatted.append(article)
+            or get_summary_fields(article, *args),
+        )
+        summary_articles = publication.get_summary_articles()
+        assert summary_articles[8].section_title == (
+            "Paroles et points de vue atikamekw nehirowisiwok"
+        )
+        sections = publication.get_summary_sections()
+        assert [a.title for s in sections for a in s.summary_articles] == [
+            a.title for a in summary_articles
+        ]
+        assert len(formatted) == len(summary_articles)
+
+    def test_section_titles_are_the_text_of_the_surtitre_elements(self):
+        publication = self.test_objects["images1102374.xml"]
+        assert publication.get_section_titles() == [
+            "Éditorial",
+            "Dossier",
+            "\n                  ",
+            "Points de vue",
+            "Chroniques",
+        ]
+
+    def test_section_titles_of_a_summary_without_revue(self):
+        assert EruditPublication(b"<numero/>").get_section_titles() == []
+        publication = EruditPublication(
+            b"<numero>"
+            b"<article><liminaire><grtitre>"
+            b"<surtitre>A</surtitre><surtitre> </surtitre>"
+            b"</grtitre></liminaire></article>"
+            b"<article><liminaire><grtitre>"
+            b"<surtitre2>B</surtitre2><surtitre>C</surtitre>"
+            b"</grtitre></liminaire></article>"
+            b"</numero>"
+        )
+        assert publication.get_section_titles() == ["A", " ", "C"]
+
     @with_value("ae1375.xml", "get_article_count")
     def test_can_return_the_number_of_articles_of_this_publication(self, value):
         assert value == 10
@@ -621,6 +835,39 @@ class TestEruditPublication(object):
     def test_can_return_the_last_page_of_the_publication_when_no_pages(self, value):
         assert value is None
 
+    @pytest.mark.parametrize(
+        "page, localidentifier",
+        [
+            ("III", "800960ar"),
+            ("iii", "800960ar"),
+            (1, "800961ar"),
+            ("19", "800961ar"),
+            (100, "800968ar"),
+            (149, "800975ar"),
+            (150, None),
+            ("IV", None),
+            ("a", None),
+        ],
+    )
+    def test_get_summary_article_at_page(self, page, localidentifier):
+        publication = self.test_objects["hphi3180.xml"]
+        summary_article = publication.get_summary_article_at_page(page)
+        assert getattr(summary_article, "localidentifier", None) == localidentifier
+
+    def test_get_summary_article_at_page_with_nested_ranges(self):
+        publication = EruditPublication(
+            "<sommaire><infosommaire><revue/></infosommaire>"
+            '<article idproprio="a"><pagination><ppage>1</ppage><dpage>20</dpage>'
+            "</pagination></article>"
+            '<article idproprio="b"><pagination><ppage>5</ppage><dpage>6</dpage>'
+            "</pagination></article>"
+            '<article idproprio="c"><pagination><ppage>5</ppage></pagination></article>'
+            "</sommaire>"
+        )
+        assert publication.get_summary_article_at_page(4).localidentifier == "a"
+        assert publication.get_summary_article_at_page(5).localidentifier == "b"
+        assert publication.get_summary_article_at_page(7).localidentifier == "a"
+
     def test_number(self):
         assert self.test_objects["ae1375.xml"].get_number() == "1-2"
         assert self.test_objects["crs1517600.xml"].get_number() == ""
@@ -713,6 +960,23 @@ class TestEruditPublication(object):
         assert themes["th1"]["redacteurchef"][0].firstname == "Alain"
         assert themes["th1"]["redacteurchef"][0].lastname == "Lesage"
 
+    def test_redacteur_of_several_themes(self):
+        publication = EruditPublication(
+            "<sommaire><infosommaire><revue>"
+            '<redacteurchef typerc="invite" idrefs="th1 th2 th1">'
+            "<nompers><nomfamille>A</nomfamille></nompers></redacteurchef>"
+            '<redacteurchef typerc="invite" idrefs="th2">'
+            "<nompers><nomfamille>B</nomfamille></nompers></redacteurchef>"
+            '<numero><grtheme id="th1"><theme>Un</theme></grtheme>'
+            '<grtheme id="th2"><theme>Deux</theme></grtheme>'
+            '<grtheme id="th3"><theme>Trois</theme></grtheme></numero>'
+            "</revue></infosommaire></sommaire>"
+        )
+        themes = publication.get_themes()
+        assert [r.lastname for r in themes["th1"]["redacteurchef"]] == ["A"]
+        assert [r.lastname for r in themes["th2"]["redacteurchef"]] == ["A", "B"]
+        assert themes["th3"]["redacteurchef"] == []
+
     def test_theme_paral(self):
         themes = self.test_objects["esse02315.xml"].get_themes()
         assert len(themes.keys()) == 1
@@ -725,6 +989,39 @@ class TestEruditPublication(object):
             "html_subname": None,
         }
 
+    @pytest.mark.parametrize(
+        "html, name, subname",
+        [
+            (True, "<em>Geopolitics</em>", "Maps"),
+            (False, "Geopolitics", "Maps"),
+        ],
+    )
+    def test_theme_paral_with_markup(self, html, name, subname):
+        publication = EruditPublication(
+            "<sommaire><infosommaire><revue><numero><grtheme id='th1'>"
+            "<theme>Géopolitique</theme>"
+            "<themeparal lang='en'><marquage typemarq='italique'>Geopolitics</marquage>"
+            "<renvoi>1</renvoi></themeparal>"
+            "<ssthemeparal lang='en'>Maps</ssthemeparal>"
+            "<themeparal>Unknown</themeparal>"
+            "</grtheme></numero></revue></infosommaire></sommaire>"
+        )
+        paral = publication.get_themes(html=html)["th1"]["paral"]
+        assert paral["en"] == {
+            "name": name,
+            "lang": "en",
+            "subname": subname,
+            "html_name": "<em>Geopolitics</em>",
+            "html_subname": "Maps",
+        }
+        assert paral[None] == {
+            "name": None,
+            "lang": None,
+            "subname": None,
+            "html_name": "Unknown",
+            "html_subname": None,
+        }
+
     def test_sstheme(self):
         themes = self.test_objects["images1080663.xml"].get_themes()
         assert len(themes.keys()) == 2
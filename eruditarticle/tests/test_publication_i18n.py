@@ -1,5 +1,5 @@
 import pytest
-from eruditarticle.objects import EruditPublication
+from eruditarticle.objects import EruditPublication, format_volume_numbering
 
 try:
     from django.utils import translation  # noqa
@@ -55,3 +55,67 @@ class TestPublicationVolumeNumberingEnglish(object):
     @with_value("as2866.xml", "get_volume_numbering", formatted=True)
     def test_can_format_volume_numbering_horsserie_no_number_in_en(self, value):
         assert value == "Volume 32, Special Issue, 2008"
+
+
+@with_fixtures(
+    "./eruditarticle/tests/fixtures/publication/volume_numbering", EruditPublication
+)
+class TestFormatVolumeNumbering(object):
+    def test_can_format_records_in_several_locales(self):
+        records = [
+            self.test_objects[fixture].get_volume_numbering_record()
+            for fixture in ("cd02305.xml", "annuaire3703.xml", "va1503694.xml")
+        ]
+        assert format_volume_numbering(records, locale="en") == [
+            "Volume 56, Number 3-4, September–December 2015",
+            "Special Issue, 2001",
+            "Volume 52, Number 214, Supplement, Spring 2009",
+        ]
+        assert format_volume_numbering(records, locale="fr", abbreviated=True) == [
+            "Vol. 56, n° 3-4, septembre–décembre 2015",
+            "N° hors-série, 2001",
+            "Vol. 52, n° 214, supplément, printemps 2009",
+        ]
+        assert records[0].format(locale="en", abbreviated=True, html=True) == (
+            "Vol. 56, N<sup>o</sup> 3-4, September–December 2015"
+        )
+
+    def test_records_do_not_depend_on_the_active_locale(self):
+        publication = self.test_objects["cd02305.xml"]
+        record = publication.get_volume_numbering_record()
+        with translation.override("en"):
+            assert publication.get_volume_numbering_record() == record
+            assert record.publication_period == "September–December 2015"
+        assert record.publication_period == "Septembre–Décembre 2015"
+
+
+@with_fixtures("./eruditarticle/tests/fixtures/publication", EruditPublication)
+class TestRenderBundle(object):
+    @pytest.mark.parametrize("fixture", ["esse02315.xml", "images1102374.xml"])
+    @pytest.mark.parametrize("language", ["fr", "en"])
+    def test_bundle_matches_the_accessors(self, fixture, language):
+        publication = self.test_objects[fixture]
+        bundle = publication.render_bundle(language)
+        publication.clear_cache()
+        with translation.override(language):
+            assert bundle.journal_title == publication.get_journal_title(
+                formatted=True, html=True
+            )
+            assert bundle.volume_numbering == publication.get_volume_numbering(
+                formatted=True, html=True
+            )
+            assert bundle.themes == publication.get_themes(formatted=True, html=True)
+            assert bundle.notegens_edito == publication.get_notegens_edito(html=True)
+            assert bundle.copyrights == publication.get_copyrights(
+                language, formatted=True, html=True
+            )
+            assert bundle.droitsauteur == publication.get_droitsauteur()
+            assert bundle.summary_articles == publication.get_summary_articles()
+
+    def test_bundle_is_rendered_in_its_language(self):
+        publication = self.test_objects["esse02315.xml"]
+        with translation.override("fr"):
+            bundle = publication.render_bundle("en", html=False)
+        assert bundle.volume_numbering.startswith("Number")
+        assert bundle.themes == publication.get_themes(formatted=True)
+        assert publication.render_bundle("fr").volume_numbering.startswith("Numéro")
@@ -1,6 +1,7 @@
+import lxml.etree as et
 import pytest
 
-from eruditarticle.utils import normalize_whitespace
+from eruditarticle.utils import normalize_whitespace, parse_xml, remove_xml_namespaces
 
 
 @pytest.mark.parametrize(
@@ -20,3 +21,23 @@ from eruditarticle.utils import normalize_whitespace
 )
 def test_normalize_whitespaces(s1, s2):
     assert normalize_whitespace(s1) == s2
+
+
+@pytest.mark.parametrize(
+    "xml",
+    [
+        b'<a:article xmlns:a="urn:a" xmlns:b="urn:b" b:lang="fr"><a:titre>T</a:titre></a:article>',
+        b'<article xmlns="urn:a" xml:lang="fr"><titre>T</titre></article>',
+        b'<article lang="fr"><titre xmlns="urn:a">T</titre></article>',
+        b'<article lang="fr"><titre>T</titre></article>',
+    ],
+)
+def test_parse_xml_removes_namespaces(xml):
+    tree = parse_xml(xml)
+    assert et.tostring(tree) == b'<article lang="fr"><titre>T</titre></article>'
+
+
+def test_remove_xml_namespaces_keeps_attributes_order():
+    root = et.fromstring(b'<article xmlns:x="urn:x" a="1" x:b="2" c="3"/>')
+    tree = remove_xml_namespaces(root)
+    assert tree.getroot().items() == [("a", "1"), ("b", "2"), ("c", "3")]
@@ -1,38 +1,73 @@
-import io
 import re
 
 import lxml.etree as et
 
 
-drop_namespace_xslt = """<xsl:stylesheet version="1.0" xmlns:xsl="http://www.w3.org/1999/XSL/Transform">
-<xsl:output method="xml" indent="no"/>
+def has_xml_namespaces(xml):
+    """Tell whether an XML string may declare or use any namespace.
 
-<xsl:template match="/|comment()|processing-instruction()">
-    <xsl:copy>
-      <xsl:apply-templates/>
-    </xsl:copy>
-</xsl:template>
+    Namespaced names are always introduced by a ``xmlns`` declaration or by the reserved
+    ``xml:`` prefix, so their absence from the raw document means that there is nothing to
+    strip. This check can return false positives (ie. in text content), but no false negatives.
+    """
+    if isinstance(xml, bytes):
+        return b"xmlns" in xml or b"xml:" in xml
+    return "xmlns" in xml or "xml:" in xml
 
-<xsl:template match="*">
-    <xsl:element name="{local-name()}">
-      <xsl:apply-templates select="@*|node()"/>
-    </xsl:element>
-</xsl:template>
 
-<xsl:template match="@*">
-    <xsl:attribute name="{local-name()}">
-      <xsl:value-of select="."/>
-    </xsl:attribute>
-</xsl:template>
-</xsl:stylesheet>
-"""
+def remove_xml_namespaces(treedom):
+    """Given an lxml tree object, remove all XML namespaces in place.
 
+    Elements and attributes are renamed to their local names in a single walk of the tree and
+    the namespace declarations that are not used anymore are dropped.
 
-def remove_xml_namespaces(treedom):
-    """ Given an lxml tree object, remove all XML namespaces. """
-    xslt_doc = et.parse(io.StringIO(drop_namespace_xslt))
-    transform = et.XSLT(xslt_doc)
-    return transform(treedom)
+    :returns: the namespace-free tree.
+    """
+    root = treedom.getroot() if isinstance(treedom, et._ElementTree) else treedom
+    for element in root.iter(et.Element):
+        tag = element.tag
+        if tag[0] == "{":
+            element.tag = tag.rpartition("}")[2]
+        attrib = element.attrib
+        if any(name[0] == "{" for name in attrib.keys()):
+            # Rebuild the attributes to keep their original order.
+            items = attrib.items()
+            attrib.clear()
+            for name, value in items:
+                attrib[name.rpartition("}")[2]] = value
+    et.cleanup_namespaces(root)
+    return root.getroottree()
+
+
+def _remove_sections(root, discarded_sections):
+    """Remove the given children of the root element, whatever their namespace.
+
+    The document is parsed in full beforehand: dropping the sections while parsing it with
+    iterparse keeps a smaller tree in memory at any time, but it parses the document more slowly
+    than the C parser does.
+    """
+    for element in list(root):
+        tag = element.tag
+        if isinstance(tag, str) and tag.rpartition("}")[2] in discarded_sections:
+            root.remove(element)
+    return root
+
+
+def parse_xml(xml, discarded_sections=()):
+    """Parse an XML string and return its tree without any XML namespaces.
+
+    The namespaces are stripped from the freshly parsed tree and the walk is skipped altogether
+    when the document does not use any namespace.
+
+    :param discarded_sections: the names of the children of the root element to drop, with
+        their content, before the namespaces are stripped.
+    """
+    root = et.fromstring(xml)
+    if discarded_sections:
+        _remove_sections(root, discarded_sections)
+    if has_xml_namespaces(xml):
+        return remove_xml_namespaces(root)
+    return root.getroottree()
 
 
 def normalize_whitespace(s):
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""Precompiled XPath expressions used by the objects accessors.
+
+The expressions are compiled once, when this module is imported. Values that change from one
+call to another are passed as XPath variables (ie. ``xpath.label(root, lang="fr")``) instead of
+being formatted into the expressions.
+"""
+
+import lxml.etree as et
+
+# Generic
+child_nodes = et.XPath("child::node()")
+
+# Article
+article_authors = et.XPath(
+    '//liminaire//auteur[not(contribution[@typecontrib!="aut"])]'
+)
+article_doi = et.XPath('admin/infoarticle/idpublic[@scheme="doi"]')
+article_uri = et.XPath('admin/infoarticle/idpublic[@scheme="uri"]')
+reference_doi = et.XPath('idpublic[@scheme="doi"]')
+
+# Publication
+notegen_edito = et.XPath('.//notegen[@typenoteg="edito"]')
+numero_notegen_edito = et.XPath('.//numero/notegen[@typenoteg="edito"]')
+redacteurchef = et.XPath("//redacteurchef[not($typerc) or @typerc=$typerc]")
+redacteurchef_without_theme = et.XPath(
+    "//redacteurchef[not(@idrefs)][not($typerc) or @typerc=$typerc]"
+)
+
+# Copyrights
+copyright_declaration = et.XPath("contributiondeclaration | copyrightdeclaration")
+copyright_label = et.XPath("label[@lang=$lang]")
+copyright_names = et.XPath(
+    "artificialperson/name"
+    " | physicalperson/personname/firstname"
+    " | physicalperson/personname/familyname"
+    " | physicalperson/personname/personnameprefix/name"
+)
+
+# Person
+person_roles = et.XPath("fonction")
+person_pseudonym = et.XPath('.//nompers[@typenompers="pseudonyme"]')